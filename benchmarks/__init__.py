@@ -0,0 +1,6 @@
+'''
+Benchmark-uri pentru EasyDPG; se ruleaza cu dpg in context headless (fara viewport), de ex:
+    python -m easydpg.benchmarks.tree_index
+    python -m easydpg.benchmarks.suite                  # toata suita; compara cu baseline.json, daca exista (cod de iesire 1 la regresii)
+    python -m easydpg.benchmarks.suite --save-baseline  # salveaza baseline-ul local (valorile depind de masina)
+'''
@@ -0,0 +1,88 @@
+import random
+import time
+
+from ..easy_dpg import np, _compile_adjust_rule, _solve_proportional_parts, _solve_proportional_parts_vectorized
+
+
+def _random_rule(rnd, max_parts=12):
+    '''
+    Genereaza o regula de ajustare valida, aleatoare: parti 'u' (cu min/max ocazionale) si parti R, cu un total de unitati explicit.
+    '''
+    part_count_ = rnd.randint(1, max_parts)
+    parts_ = []
+    units_left_ = rnd.randint(part_count_, 400)
+    total_units_ = units_left_
+    for _ in range(part_count_):
+        if rnd.random() < 0.6 and units_left_ > 0:
+            units_ = rnd.randint(0, max(0, min(units_left_, total_units_ // part_count_ + 5)))
+            units_left_ -= units_
+            part_ = f"{units_}u"
+            extra_ = []
+            if rnd.random() < 0.3:
+                extra_.append(f"min={rnd.randint(0, 300)}")
+            if rnd.random() < 0.3:
+                extra_.append(f"max={rnd.randint(0, 600)}")
+            if len(extra_) > 0:
+                part_ += "[" + ",".join(extra_) + "]"
+        else:
+            part_ = f"{rnd.randint(1, 9)}r"
+        parts_.append(part_)
+    return f"{total_units_}:" + ",".join(parts_)
+
+
+def check_parity(cases=5000, seed=0):
+    '''
+    Verifica faptul ca rezolvarea vectorizata (numpy) da exact aceleasi rezultate (valori si tipuri) ca varianta Python pura.
+    :return: numarul de cazuri verificate; arunca AssertionError la prima diferenta
+    '''
+    if np is None:
+        raise Exception("numpy is not installed, the vectorized solver is not available")
+
+    rnd_ = random.Random(seed)
+    plans_ = [_compile_adjust_rule(_random_rule(rnd_)) for _ in range(cases)]
+    totals_ = [rnd_.choice([rnd_.randint(0, 4000), rnd_.uniform(0, 4000)]) for _ in range(cases)]
+    names_ = ["parity"] * cases
+
+    expected_ = [_solve_proportional_parts(plan_, total_, name_) for plan_, total_, name_ in zip(plans_, totals_, names_)]
+    actual_ = _solve_proportional_parts_vectorized(plans_, totals_, names_)
+    for plan_, total_, e, a in zip(plans_, totals_, expected_, actual_):
+        assert e == a, f"parity broken for rule {plan_.rule} and total {total_}:\n\tpython:     {e}\n\tvectorized: {a}"
+        assert [type(d) for _, d in e] == [type(d) for _, d in a], f"result types differ for rule {plan_.rule} and total {total_}"
+    return cases
+
+
+def bench_proportional_solver(batch_sizes=(10, 100, 1000), repeats=20, seed=1):
+    '''
+    Compara timpul de rezolvare a unui lot de LM-uri (acelasi nivel de adancime) intre varianta Python si cea vectorizata.
+    :return: lista de dict-uri {adjusters, python_ms, vectorized_ms}
+    '''
+    rnd_ = random.Random(seed)
+    results_ = []
+    for size in batch_sizes:
+        plans_ = [_compile_adjust_rule(_random_rule(rnd_)) for _ in range(size)]
+        totals_ = [rnd_.randint(200, 4000) for _ in range(size)]
+        names_ = ["bench"] * size
+
+        t0_ = time.perf_counter()
+        for _ in range(repeats):
+            [_solve_proportional_parts(plan_, total_, name_) for plan_, total_, name_ in zip(plans_, totals_, names_)]
+        python_ms_ = (time.perf_counter() - t0_) * 1000.0 / repeats
+
+        vectorized_ms_ = None
+        if np is not None:
+            t0_ = time.perf_counter()
+            for _ in range(repeats):
+                _solve_proportional_parts_vectorized(plans_, totals_, names_)
+            vectorized_ms_ = (time.perf_counter() - t0_) * 1000.0 / repeats
+
+        results_.append({"adjusters": size, "python_ms": python_ms_, "vectorized_ms": vectorized_ms_})
+    return results_
+
+
+if __name__ == "__main__":
+    if np is not None:
+        print(f"parity ok on {check_parity()} random rules")
+    print(f"{'adjusters':>10} {'python (ms)':>12} {'vectorized (ms)':>16}")
+    for row in bench_proportional_solver():
+        vectorized_ = f"{row['vectorized_ms']:>16.3f}" if row['vectorized_ms'] is not None else f"{'n/a':>16}"
+        print(f"{row['adjusters']:>10} {row['python_ms']:>12.3f} {vectorized_}")
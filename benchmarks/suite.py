@@ -0,0 +1,316 @@
+import argparse
+import contextlib
+import json
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import create_app, reset_item_caches, LOG_CATEGORIES, FACTORY, _LayoutManagerController, _RECT_SIZE_SNAPSHOT, _compile_adjust_rule, \
+    EasyDPGWrapperPrimaryPanel, EasyDPGWrapperInnerPanel, EasyDPGWrapperText, EasyDPGWrapperFactory, EasyDPGWidget, \
+    EasyDPGProportionalVerticalAdjuster, EasyDPGProportionalHorizontalAdjuster
+from ..redux import ReduxStore, ReduxStateRoot, Action
+from .proportional_solver import _random_rule
+
+_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+_REGRESSION_TOLERANCE = 0.25 # o scadere de peste 25% a ops/sec fata de baseline e raportata ca regresie
+_ROOT_SIZE = (1600, 900)
+_SEED_PRIORITY = 1000 # listenerii harness-ului ruleaza inaintea celor ai aplicatiei (prioritatea implicita e 0)
+
+
+class _HeadlessHarness:
+    '''
+    Ruleaza EasyDPGApp + _LayoutManagerController fara viewport: fiecare cadru e EasyDPGApp._step_frame(render=False) (randarea dpg lipseste).
+    Marimea reala a LM-urilor de varf (care, headless, ar fi 0x0) e pusa in snapshot-ul de geometrie de doi listeneri care ruleaza inaintea
+    tuturor celorlalti: la pre-render cea "randata" in cadrul trecut, la post-render cea ceruta cu set_root_lm_size, ca dupa o randare reala.
+    '''
+    def __init__(self):
+        dpg.create_context()
+        reset_item_caches()
+        self.app_ = create_app()
+        self.controller_ = FACTORY(_LayoutManagerController)
+        self.root_ = EasyDPGWrapperPrimaryPanel.build(width=_ROOT_SIZE[0], height=_ROOT_SIZE[1])
+        self.app_._set_root_tag(self.root_.tag()) # in mod normal il seteaza start(), care insa ar deschide fereastra
+        self.rendered_sizes_ = {} # lm_tag -> marimea "randata"
+        self.pending_sizes_ = {} # lm_tag -> marimea ceruta, "randata" in cadrul urmator
+        self.unregister_ = [self.app_.register_pre_render_listener(self.__seed_sizes, priority=_SEED_PRIORITY),
+                            self.app_.register_post_render_listener(self.__render_sizes, priority=_SEED_PRIORITY)]
+        self.cases_ = []
+
+    def frame(self):
+        self.app_._step_frame(render=False)
+
+    def set_root_lm_size(self, lm_tag, size):
+        self.pending_sizes_[lm_tag] = tuple(size)
+
+    def __seed_sizes(self):
+        # snapshot-ul de geometrie e golit dupa fiecare cadru, deci marimile se pun din nou inaintea fiecarui listener
+        for lm_tag, size in list(self.rendered_sizes_.items()):
+            if dpg.does_item_exist(lm_tag):
+                _RECT_SIZE_SNAPSHOT[lm_tag] = size
+            else:
+                del self.rendered_sizes_[lm_tag]
+
+    def __render_sizes(self):
+        self.rendered_sizes_.update(self.pending_sizes_)
+        self.pending_sizes_ = {}
+        self.__seed_sizes()
+
+    def case_root(self):
+        case_ = EasyDPGWrapperInnerPanel.build(explicit_parent=self.root_)
+        self.cases_.append(case_)
+        return case_
+
+    def cleanup(self):
+        # sterge ce a ramas de la benchmark-ul curent, ca urmatorul sa porneasca de la acelasi pom
+        for case_ in self.cases_:
+            if dpg.does_item_exist(case_.tag()):
+                case_.delete()
+        self.cases_ = []
+        self.frame()
+
+    def close(self):
+        for unregister in self.unregister_:
+            unregister()
+        dpg.destroy_context()
+        reset_item_caches()
+
+
+def _deep_adjusters(parent, depth, leaves_per_level=2):
+    # stiva de adjustere imbricate, alternand vertical/orizontal, cu cateva texte pe fiecare nivel
+    top_ = None
+    current_ = parent
+    for level in range(depth):
+        cls_ = EasyDPGProportionalVerticalAdjuster if level % 2 == 0 else EasyDPGProportionalHorizontalAdjuster
+        # ultimul nivel nu mai are LM imbricat, deci nici partea R pentru el
+        rule_ = f"{leaves_per_level + 2}:" + ",".join(["1u"] * leaves_per_level + ["1r"]) if level < depth - 1 else f"{leaves_per_level}:" + ",".join(["1u"] * leaves_per_level)
+        lm_ = cls_.build(adjust_rule=rule_, explicit_parent=current_)
+        top_ = lm_ if top_ is None else top_
+        for i in range(leaves_per_level):
+            EasyDPGWrapperText.build(f"level {level} leaf {i}", explicit_parent=lm_)
+        current_ = lm_
+    return top_
+
+
+def _wide_list(parent, rows):
+    lm_ = EasyDPGProportionalVerticalAdjuster.build(adjust_rule="", explicit_parent=parent)
+    for i in range(rows):
+        EasyDPGWrapperText.build(f"row {i}", explicit_parent=lm_)
+    return lm_
+
+
+def bench_tree_build(harness, depth=40, repeats=5):
+    def op():
+        case_ = harness.case_root()
+        top_ = _deep_adjusters(case_, depth)
+        harness.set_root_lm_size(top_.tag(), _ROOT_SIZE)
+        harness.frame()
+        case_.delete()
+        harness.frame()
+    return op, repeats
+
+
+def bench_wide_list_build(harness, rows=500, repeats=5):
+    def op():
+        case_ = harness.case_root()
+        lm_ = _wide_list(case_, rows)
+        harness.set_root_lm_size(lm_.tag(), _ROOT_SIZE)
+        harness.frame()
+        case_.delete()
+        harness.frame()
+    return op, repeats
+
+
+def bench_resize_relayout(harness, depth=40, repeats=50):
+    case_ = harness.case_root()
+    top_ = _deep_adjusters(case_, depth)
+    harness.set_root_lm_size(top_.tag(), _ROOT_SIZE)
+    harness.frame()
+    sizes_ = [(_ROOT_SIZE[0] - i % 7 * 10, _ROOT_SIZE[1] - i % 5 * 10) for i in range(repeats)]
+    state_ = {"i": 0}
+
+    def op():
+        harness.set_root_lm_size(top_.tag(), sizes_[state_["i"] % len(sizes_)])
+        state_["i"] += 1
+        harness.frame()
+    return op, repeats
+
+
+def bench_wrapper_construction(harness, count=2000, repeats=5):
+    case_ = harness.case_root()
+    tags_ = [dpg.add_text(f"t{i}", parent=case_.tag()) for i in range(count)]
+    harness.frame()
+
+    def op():
+        for tag in tags_:
+            EasyDPGWrapperText(tag)
+    return op, repeats
+
+
+def bench_wrapper_lookup(harness, count=2000, repeats=20):
+    case_ = harness.case_root()
+    tags_ = [dpg.add_text(f"t{i}", parent=case_.tag()) for i in range(count)]
+    keep_alive_ = [EasyDPGWrapperFactory.create_wrapper(tag) for tag in tags_] # cache-ul e slab: cineva trebuie sa le tina in viata
+    harness.frame()
+
+    def op():
+        for tag in tags_:
+            EasyDPGWrapperFactory.create_wrapper(tag)
+    op.keep_alive_ = keep_alive_
+    return op, repeats
+
+
+def bench_rule_parsing(harness, rules=2000, repeats=5, seed=0):
+    rnd_ = random.Random(seed)
+    rules_ = [_random_rule(rnd_) for _ in range(rules)]
+
+    def op():
+        _compile_adjust_rule.cache_clear() # masuram parsarea, nu cache-ul
+        for rule in rules_:
+            _compile_adjust_rule(rule)
+    return op, repeats
+
+
+def bench_redux_rebuild(harness, rows=200, repeats=20):
+    BenchState = ReduxStateRoot("BenchState", ["rows"])
+    BenchState.__new__.__defaults__ = ([],)
+
+    def rows_reducer(rows, action: Action = None):
+        if action is not None and action.name == "SetRows":
+            return action.payload["rows"]
+        return rows if rows is not None else []
+
+    store_ = ReduxStore(reducer_or_substatekey2reducer_map={"rows": rows_reducer}, initial_state=BenchState(), middlewares=[])
+    case_ = harness.case_root()
+
+    def build(widget: EasyDPGWidget, re):
+        lm_ = EasyDPGProportionalVerticalAdjuster.build(adjust_rule="", explicit_parent=case_)
+        re(lm_, "ROWS")
+        harness.set_root_lm_size(lm_.tag(), _ROOT_SIZE)
+
+        def update_rows(widget, registry, xpath, rows):
+            registry["ROWS"].delete_children()
+            for row in rows:
+                EasyDPGWrapperText.build(row, explicit_parent=registry["ROWS"])
+        widget.listen_on_redux("rows", update_rows)
+
+    widget_ = EasyDPGWidget(build, redux_store=store_).build()
+    harness.frame()
+    state_ = {"i": 0}
+
+    def op():
+        state_["i"] += 1
+        store_.dispatch(Action("SetRows", {"rows": [f"row {state_['i']}:{r}" for r in range(rows)]}))
+        harness.frame()
+    op.widget_ = widget_
+    return op, repeats
+
+
+BENCHMARKS = {
+    "tree_build": bench_tree_build,
+    "wide_list_build": bench_wide_list_build,
+    "resize_relayout": bench_resize_relayout,
+    "wrapper_construction": bench_wrapper_construction,
+    "wrapper_lookup": bench_wrapper_lookup,
+    "rule_parsing": bench_rule_parsing,
+    "redux_rebuild": bench_redux_rebuild,
+}
+
+
+def _measure(op, repeats):
+    op() # incalzire (cache-uri, primul layout)
+
+    t0_ = time.perf_counter()
+    for _ in range(repeats):
+        op()
+    elapsed_ = time.perf_counter() - t0_
+
+    # alocarile se masoara separat, tracemalloc incetineste mult executia
+    tracemalloc.start()
+    before_, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    op()
+    after_, peak_ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"ops_per_sec": repeats / elapsed_ if elapsed_ > 0 else float("inf"), "ms_per_op": elapsed_ * 1000.0 / repeats,
+            "alloc_peak_kb": (peak_ - before_) / 1024.0, "alloc_net_kb": (after_ - before_) / 1024.0}
+
+
+@contextlib.contextmanager
+def _silenced_easydpg_logs():
+    loggers_ = [logging.getLogger(f"easydpg.{category}") for category in LOG_CATEGORIES]
+    disabled_ = [logger_.disabled for logger_ in loggers_]
+    for logger_ in loggers_:
+        logger_.disabled = True
+    try:
+        yield
+    finally:
+        for logger_, disabled in zip(loggers_, disabled_):
+            logger_.disabled = disabled
+
+
+def run_suite(names=None, quiet=True):
+    '''
+    Ruleaza benchmark-urile (toate, sau doar cele din names) intr-un context dpg headless.
+    :quiet opreste logger-ele easydpg.* in timpul masuratorilor (I/O-ul consolei ar domina timpii)
+    :return: {nume: {ops_per_sec, ms_per_op, alloc_peak_kb, alloc_net_kb}}
+    '''
+    harness_ = _HeadlessHarness()
+    results_ = {}
+    try:
+        for name in (names if names is not None else BENCHMARKS.keys()):
+            with _silenced_easydpg_logs() if quiet else contextlib.nullcontext():
+                op_, repeats_ = BENCHMARKS[name](harness_)
+                results_[name] = _measure(op_, repeats_)
+                harness_.cleanup()
+    finally:
+        harness_.close()
+    return results_
+
+
+def compare_with_baseline(results, baseline, tolerance=_REGRESSION_TOLERANCE):
+    '''
+    :return: lista de (nume, ops_per_sec baseline, ops_per_sec curent) pentru benchmark-urile mai lente decat baseline-ul peste toleranta
+    '''
+    regressions_ = []
+    for name, row in results.items():
+        if name in baseline and row["ops_per_sec"] < baseline[name]["ops_per_sec"] * (1.0 - tolerance):
+            regressions_.append((name, baseline[name]["ops_per_sec"], row["ops_per_sec"]))
+    return regressions_
+
+
+def main(argv=None):
+    parser_ = argparse.ArgumentParser(description="EasyDPG headless benchmark suite")
+    parser_.add_argument("names", nargs="*", help=f"benchmark-uri de rulat (implicit toate): {', '.join(BENCHMARKS.keys())}")
+    parser_.add_argument("--save-baseline", action="store_true", help="salveaza rezultatele ca baseline (local, dependent de masina)")
+    parser_.add_argument("--baseline", default=_BASELINE_PATH)
+    parser_.add_argument("--tolerance", type=float, default=_REGRESSION_TOLERANCE)
+    args_ = parser_.parse_args(argv)
+
+    results_ = run_suite(args_.names if len(args_.names) > 0 else None)
+    print(f"{'benchmark':<22} {'ops/sec':>10} {'ms/op':>10} {'peak KB':>10} {'net KB':>10}")
+    for name, row in results_.items():
+        print(f"{name:<22} {row['ops_per_sec']:>10.2f} {row['ms_per_op']:>10.3f} {row['alloc_peak_kb']:>10.1f} {row['alloc_net_kb']:>10.1f}")
+
+    if args_.save_baseline:
+        with open(args_.baseline, "w") as f:
+            json.dump(results_, f, indent=2, sort_keys=True)
+        print(f"baseline saved to {args_.baseline}")
+        return 0
+
+    if os.path.exists(args_.baseline):
+        with open(args_.baseline) as f:
+            regressions_ = compare_with_baseline(results_, json.load(f), args_.tolerance)
+        for name, expected, actual in regressions_:
+            print(f"REGRESSION: {name}: {actual:.2f} ops/sec vs baseline {expected:.2f} ops/sec")
+        return 1 if len(regressions_) > 0 else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import random
+import time
+
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import _DFSTreeIndex
+
+
+def _build_synthetic_tree(size, fanout=10):
+    '''
+    Construieste (headless) un pom dpg de ~size elemente: grupuri imbricate cu fanout copii, frunzele fiind texte.
+    :return: (root_tag, lista cu tag-urile grupurilor - candidatii pentru mutatii)
+    '''
+    root_ = dpg.add_window(label="bench-root")
+    groups_ = [root_]
+    created_ = 1
+    frontier_ = [root_]
+    while created_ < size:
+        next_frontier_ = []
+        for parent_ in frontier_:
+            for _ in range(fanout):
+                if created_ >= size:
+                    break
+                group_ = dpg.add_group(parent=parent_)
+                groups_.append(group_)
+                next_frontier_.append(group_)
+                created_ += 1
+        frontier_ = next_frontier_
+    for parent_ in frontier_:
+        dpg.add_text("leaf", parent=parent_)
+    return root_, groups_
+
+
+def bench_tree_index(sizes=(100, 1000, 5000, 20000), mutations=50, seed=0):
+    '''
+    Compara costul per mutatie (un text adaugat intr-un grup oarecare) intre reconstruirea completa a indexului DFS
+    si re-scanarea incrementala a subarborelui atins.
+    :return: lista de dict-uri {size, full_ms, incremental_ms, speedup}
+    '''
+    rnd_ = random.Random(seed)
+    results_ = []
+    for size in sizes:
+        dpg.create_context()
+        try:
+            root_, groups_ = _build_synthetic_tree(size)
+
+            full_total_ = 0.0
+            incremental_total_ = 0.0
+            index_ = _DFSTreeIndex()
+            index_.build(root_)
+            for _ in range(mutations):
+                target_ = rnd_.choice(groups_)
+                dpg.add_text("mutation", parent=target_)
+
+                t0_ = time.perf_counter()
+                _DFSTreeIndex().build(root_)
+                full_total_ += time.perf_counter() - t0_
+
+                t0_ = time.perf_counter()
+                index_.rescan([target_])
+                incremental_total_ += time.perf_counter() - t0_
+
+            row_ = {
+                "size": len(index_),
+                "full_ms": full_total_ * 1000.0 / mutations,
+                "incremental_ms": incremental_total_ * 1000.0 / mutations,
+            }
+            row_["speedup"] = row_["full_ms"] / row_["incremental_ms"] if row_["incremental_ms"] > 0 else float("inf")
+            results_.append(row_)
+        finally:
+            dpg.destroy_context()
+    return results_
+
+
+if __name__ == "__main__":
+    print(f"{'nodes':>8} {'full (ms)':>12} {'incremental (ms)':>18} {'speedup':>9}")
+    for row in bench_tree_index():
+        print(f"{row['size']:>8} {row['full_ms']:>12.3f} {row['incremental_ms']:>18.3f} {row['speedup']:>8.1f}x")
@@ -1,9 +1,27 @@
 import dataclasses
 
-from typing import Union, Literal, List, Tuple, Dict, Callable, Any
+from typing import Union, Literal, List, Tuple, Dict, Callable, Any, Sequence
 import os
+import time
+import json
+import logging
 import re
 import random
+import heapq
+import math
+import bisect
+import functools
+import weakref
+import concurrent.futures
+import itertools
+import threading
+import asyncio
+import inspect
+try:
+    import numpy as np
+except ImportError: # numpy e optional, e folosit doar de rezolvarea vectorizata (in lot) a LM-urilor proportionale
+    np = None
+from collections import deque
 
 #import faulthandler
 #faulthandler.enable()
@@ -23,6 +41,9 @@ RegisterElementFunc = Callable[[Union[str, int], str], None]
 BuilderCallback = Callable[['EasyDPGWidget', RegisterElementFunc], None]
 ElementsRegistry = Dict[str, 'EasyDPGWrapper']
 WidgetReduxListener = Callable[['EasyDPGWidget', ElementsRegistry, str, ReduxState], None]
+SelectorListener = Callable[['EasyDPGWidget', ElementsRegistry, Any], None] # (widget, registry, valoarea selectata)
+ReconcileRowBuilder = Callable[['EasyDPGWrapper', Any], Any] # (containerul, element) -> randul construit (wrapper sau tag), construit in container
+ReconcileRowUpdater = Callable[[Any, Any], None] # (randul existent, elementul nou cu aceeasi cheie) -> actualizare pe loc
 DPGParent = Union[int, str, None]
 AnyParent = Union[int, str, 'EasyDPGWrapper', None]
 
@@ -34,16 +55,66 @@ KeyboardPressedScancode = int # @TODO nu am testat ce-mi vine prin callback dpg,
 KeyboardPressedKey = str # @TODO nu am testat ce-mi vine prin callback dpg, de fapt...
 KeyboardPressListener = Callable[[KeyboardPressedScancode, KeyboardPressedKey], None]
 RenderListener = Callable[[],None]
+BackgroundRenderListener = Callable[[], Union[Callable[[], None], None]] # ruleaza in fundal; daca intoarce o functie, aceasta se aplica pe firul de randare
 
 # LM-uri (Layout Manageri)
 LMRecalculateResult = Dict[Union[str, int], Dict[str, int]] # un dict cu tag-urile descendetilor unui LM, cu pos_x, pos_y, width si height al spatiului virtual alocat pentru fiecare
 LMProportionalAdjusterResultRowProvider = Callable[[int, int, int], Dict[str, int]]
 
+# Liste virtualizate
+VirtualListDataSource = Union[Sequence[Any], Callable[[], Sequence[Any]]] # secventa de date sau un callable care o intoarce (ex. lambda: store.state.posts)
+VirtualListRowBuilder = Callable[['EasyDPGWrapperGroup', int, Any], Any] # (containerul randului, index, element) -> randul construit (orice obiect)
+VirtualListRowUpdater = Callable[[Any, int, Any], None] # (randul construit anterior, index nou, element nou) -> reutilizeaza randul pentru alt element
+
 # Wrapper aids
 UniversalColor = Union[float, int, List[int], List[float]]
 ThemeCreator = Callable[[UniversalColor], str]
 ##########################
 
+############################################################
+# LOGGING
+##############################
+class _CategoryLogger:
+    '''
+    Logger pe categorii (easydpg.<categorie>), cu mesaje formatate lenes (stil logging, cu %s si argumente separate).
+    In caile fierbinti, 'if _LOG_X.debug_enabled:' ocoleste si pregatirea argumentelor; isEnabledFor e memorat de modulul logging
+    (si golit de el la orice setLevel), deci ramane ieftin si corect oricum ar fi configurate logger-ele easydpg.*.
+    '''
+    __slots__ = ('logger_',)
+
+    def __init__(self, category: str):
+        self.logger_ = logging.getLogger(f"easydpg.{category}")
+
+    @property
+    def debug_enabled(self) -> bool: return self.logger_.isEnabledFor(logging.DEBUG)
+
+    def debug(self, msg, *args):
+        if self.debug_enabled:
+            self.logger_.debug(msg, *args)
+    def info(self, msg, *args): self.logger_.info(msg, *args)
+    def warning(self, msg, *args): self.logger_.warning(msg, *args)
+    def error(self, msg, *args): self.logger_.error(msg, *args)
+
+LOG_CATEGORIES = ("layout", "tree", "events", "popup", "widgets")
+_LOG_LAYOUT = _CategoryLogger("layout")
+_LOG_TREE = _CategoryLogger("tree")
+_LOG_EVENTS = _CategoryLogger("events")
+_LOG_POPUP = _CategoryLogger("popup")
+_LOG_WIDGETS = _CategoryLogger("widgets")
+_LOGGERS = {"layout": _LOG_LAYOUT, "tree": _LOG_TREE, "events": _LOG_EVENTS, "popup": _LOG_POPUP, "widgets": _LOG_WIDGETS}
+
+def set_log_level(level: Union[int, str], *categories: str):
+    '''
+    Seteaza nivelul de logging pentru categoriile date (implicit toate: layout, tree, events, popup, widgets), ex:
+        set_log_level(logging.DEBUG, "layout", "tree")
+    Logger-ele easydpg.* se pot configura si direct, prin modulul logging.
+    '''
+    for category in (categories if len(categories) > 0 else LOG_CATEGORIES):
+        if category not in _LOGGERS:
+            raise Exception(f"ERROR: set_log_level: unknown log category '{category}', expected one of: {LOG_CATEGORIES}")
+        _LOGGERS[category].logger_.setLevel(level)
+##########################
+
 ############################################################
 # USEFUL OOP CONSTRUCTS
 ##############################
@@ -54,11 +125,218 @@ _DEFCALLBACK_DPG_ITEMS = ["mvbutton", "mvfiledialog", "mvcheckbox"] #,TODO...]
 _BACKGCOLOR_DPG_ITEMS = ["mvprogressbar", "mvbutton", "mvwindowappitem", "mvchildwindow", "mvinputtext", "mvinputfloat", "mvinputint", "mvinputintmulti", "mvinputfloatmulti", "mvinputdouble", "mvinputDoublemulti"] #,TODO...]
 _SINGLEVALUE_DPG_ITEMS = ["mvcheckbox", "mvtext", "mvprogressbar"]
 
-def _get_simplified_type(tag): return dpg.get_item_type(tag).split("::")[1].strip().lower()
-def _guard_incompatible_type(tag, compatible_types, exception_msg=lambda tag, item_type, compatible_types: f"wrong tag id {tag} (of type '{item_type}'), expected a tag from one of the following types:\n\t{compatible_types}"):
+# capabilitatile tipurilor dpg, ca masti de biti: o singura cautare (tip -> masca) raspunde oricarei garzi de tip
+_CAP_CONTEXT_MANAGEABLE = 1 << 0
+_CAP_VISIBILITY = 1 << 1
+_CAP_GEOMETRY_SIZE_MANAGEABLE = 1 << 2
+_CAP_DEFCALLBACK = 1 << 3
+_CAP_BACKGCOLOR = 1 << 4
+_CAP_SINGLEVALUE = 1 << 5
+_DPG_ITEMS_BY_CAPABILITY = {
+    _CAP_CONTEXT_MANAGEABLE: _CONTEXT_MANAGEABLE_DPG_ITEMS,
+    _CAP_VISIBILITY: _VISIBILITY_DPG_ITEMS,
+    _CAP_GEOMETRY_SIZE_MANAGEABLE: _GEOMETRY_SIZE_MANAGEABLE_DPG_ITEMS,
+    _CAP_DEFCALLBACK: _DEFCALLBACK_DPG_ITEMS,
+    _CAP_BACKGCOLOR: _BACKGCOLOR_DPG_ITEMS,
+    _CAP_SINGLEVALUE: _SINGLEVALUE_DPG_ITEMS,
+}
+_TYPE_CAPABILITIES: Dict[str, int] = {}
+for _cap, _items in _DPG_ITEMS_BY_CAPABILITY.items():
+    for _item_type in _items:
+        _TYPE_CAPABILITIES[_item_type] = _TYPE_CAPABILITIES.get(_item_type, 0) | _cap
+
+_ITEM_TYPE_CACHE: Dict[Union[str, int], Tuple[int, str]] = {} # tag -> (uuid, tipul simplificat) (tipul unui element dpg nu se schimba cat timp exista); curatat la stergere
+
+def _item_uuid(tag) -> int:
+    '''
+    uuid-ul dpg al elementului, cu care cache-urile per tag isi valideaza intrarile: un alias (tag str) sters cu dpg.delete_item brut
+    poate fi refolosit de alt element, un uuid nu (in acelasi context; la un context nou, vezi reset_item_caches); 0 daca alias-ul nu exista
+    '''
+    return dpg.get_alias_id(tag) if type(tag) is str else tag
+
+@functools.lru_cache(maxsize=None)
+def _simplify_dpg_type(dpg_type: str) -> str: return dpg_type.split("::")[1].strip().lower()
+
+def _get_simplified_type(tag):
+    uuid_ = _item_uuid(tag)
+    entry_ = _ITEM_TYPE_CACHE.get(tag)
+    if entry_ is None or entry_[0] != uuid_:
+        entry_ = _ITEM_TYPE_CACHE[tag] = (uuid_, _simplify_dpg_type(dpg.get_item_type(tag)))
+    return entry_[1]
+def _has_capability(tag, capabilities: int) -> bool: return _TYPE_CAPABILITIES.get(_get_simplified_type(tag), 0) & capabilities == capabilities
+def _guard_incompatible_type(tag, compatible_types: Union[int, List[str]], exception_msg=lambda tag, item_type, compatible_types: f"wrong tag id {tag} (of type '{item_type}'), expected a tag from one of the following types:\n\t{compatible_types}"):
+    '''
+    :compatible_types fie o masca de capabilitati (_CAP_*), fie o lista explicita de tipuri simplificate
+    '''
+    def _compatible(type_):
+        if type(compatible_types) is int:
+            return _TYPE_CAPABILITIES.get(type_, 0) & compatible_types == compatible_types
+        return type_ in compatible_types
+
     type_ = _get_simplified_type(tag)
-    if type_ not in compatible_types:
-        raise Exception(exception_msg(tag, type_, compatible_types))
+    if _compatible(type_):
+        return
+    # inainte de refuz, tipul se reciteste din dpg: intrarea din cache poate fi a altui element (ex. tag int dintr-un context distrus fara reset_item_caches)
+    _ITEM_TYPE_CACHE.pop(tag, None)
+    if dpg.does_item_exist(tag):
+        type_ = _get_simplified_type(tag)
+        if _compatible(type_):
+            return
+    if type(compatible_types) is int:
+        compatible_types = [t for t, caps in _TYPE_CAPABILITIES.items() if caps & compatible_types == compatible_types]
+    raise Exception(exception_msg(tag, type_, compatible_types))
+
+_IDLE_GRACE_FRAMES = 10 # cadre fara activitate dupa care bucla de randare intra in repaus (idle_fps)
+
+_STRUCTURE_CHANGED_TAGS = set() # containerele carora li s-a modificat lista de copii prin EasyDPG (build/delete/move), consumate de _LayoutManagerController la pre-render
+
+def notify_structure_changed(tag: AnyParent):
+    '''
+    Anunta ca lista de copii a containerului dat s-a modificat. Wrapper-ele EasyDPG o apeleaza singure; o apelezi manual doar
+    dupa apeluri dpg brute (add_*, delete_item, move_item), daca nu ai activat poll_structure_changes la create_app.
+    :tag containerul (tag sau wrapper) al carui set de copii s-a schimbat
+    '''
+    if tag is None:
+        return
+    _STRUCTURE_CHANGED_TAGS.add(tag if type(tag) in [int, str] else tag.tag())
+
+def _notify_item_added(tag):
+    notify_structure_changed(dpg.get_item_parent(tag))
+
+class _LayoutMeta:
+    '''
+    Metadatele de layout (folosite de LM-uri) ale unui element, tinute in Python, nu in user_data-ul dpg: accesul e o simpla
+    citire de atribut, fara drum dus-intors prin C-API. Se sincronizeaza cu user_data doar la export explicit (EasyDPGWrapper.export_layout_meta).
+    '''
+    __slots__ = ('scale_x', 'scale_y', 'justify_x', 'justify_y', 'min_x', 'max_x', 'min_y', 'max_y',
+                 'padding_left', 'padding_right', 'padding_top', 'padding_bottom')
+
+    def __init__(self):
+        self.scale_x = 1.0 # pt LM-uri, cum sa se incadreze in spatiul virtual dat de LM
+        self.scale_y = 1.0
+        self.justify_x = -1 # tot pt LM-uri, 0 e centru, -1 e stanga, 1 e dreapta
+        self.justify_y = -1
+        self.min_x = 0 # tot pt LM-uri, limitele preferentiale sub care LM-ul nu mai scaleaza elementul; cealalta, limita maxima peste care nu o mai scaleaza...
+        self.max_x = 0
+        self.min_y = 0
+        self.max_y = 0
+        self.padding_left = 0
+        self.padding_right = 0
+        self.padding_top = 0
+        self.padding_bottom = 0
+
+    def as_dict(self): return {field: getattr(self, field) for field in _LayoutMeta.__slots__}
+
+    def apply(self, attrs: Dict[str, Any]):
+        for field, value in attrs.items():
+            setattr(self, field, value)
+        return self
+
+@dataclasses.dataclass(frozen=True)
+class LayoutSpec:
+    '''
+    Un set (oricare subset) de metadate de layout pentru LM-uri, aplicabil dintr-o data pe unul sau mai multe elemente
+    (EasyDPGWrapper.set_layout / EasyDPGWrapper.apply_layout); campurile None raman neschimbate pe element.
+    '''
+    scale_x: Union[float, None] = None
+    scale_y: Union[float, None] = None
+    justify_x: Union[int, None] = None
+    justify_y: Union[int, None] = None
+    min_x: Union[int, None] = None
+    max_x: Union[int, None] = None
+    min_y: Union[int, None] = None
+    max_y: Union[int, None] = None
+    padding_left: Union[int, None] = None
+    padding_right: Union[int, None] = None
+    padding_top: Union[int, None] = None
+    padding_bottom: Union[int, None] = None
+
+    def attrs(self) -> Dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self) if getattr(self, field.name) is not None}
+
+def _validated_layout_attrs(attrs: Dict[str, Any], caller: str) -> Dict[str, Any]:
+    unknown_ = [key for key in attrs if key not in _LayoutMeta.__slots__]
+    if len(unknown_) > 0:
+        raise Exception(f"ERROR: {caller}: unknown layout attribute(s) {unknown_}, expected some of:\n\t{list(_LayoutMeta.__slots__)}")
+    return {key: value for key, value in attrs.items() if value is not None}
+
+_LAYOUT_META: Dict[Union[str, int], Tuple[int, _LayoutMeta]] = {} # tag -> (uuid, metadatele de layout ale elementului); uuid-ul diferit = alt element sub acelasi alias
+
+def _layout_meta_for(tag) -> _LayoutMeta:
+    '''
+    Intoarce (creand-o la prima cerere) inregistrarea de metadate de layout a tag-ului; la creare, preia valorile deja puse
+    de utilizator in user_data-ul dpg (daca e un dict), deci singurul apel dpg se face o data per element.
+    '''
+    uuid_ = _item_uuid(tag)
+    entry_ = _LAYOUT_META.get(tag)
+    if entry_ is None or entry_[0] != uuid_:
+        meta_ = _LayoutMeta()
+        ud_ = dpg.get_item_user_data(tag)
+        if isinstance(ud_, dict):
+            for field in _LayoutMeta.__slots__:
+                if field in ud_:
+                    setattr(meta_, field, ud_[field])
+        entry_ = _LAYOUT_META[tag] = (uuid_, meta_)
+    return entry_[1]
+
+def _on_items_deleted(tags):
+    '''
+    Curata starea tinuta in Python pentru elementele sterse (apelata de EasyDPG la delete/delete_children si de
+    _LayoutManagerController pentru nodurile disparute din arbore).
+    '''
+    for tag in tags:
+        _LAYOUT_META.pop(tag, None)
+        _ITEM_TYPE_CACHE.pop(tag, None)
+        _WRITTEN_GEOMETRY.pop(tag, None)
+        _RECT_SIZE_SNAPSHOT.pop(tag, None)
+        for key_ in _WRAPPER_CACHE_KEYS.pop(tag, ()):
+            _WRAPPER_CACHE.pop(key_, None)
+
+def reset_item_caches():
+    '''
+    Goleste toata starea tinuta in Python per tag (tipuri, metadate de layout, wrapper-e, geometrie, modificari de structura anuntate):
+    dupa dpg.destroy_context / dpg.create_context tag-urile int se refolosesc de la capat, deci intrarile vechi ar apartine altor elemente.
+    EasyDPGApp o apeleaza singur la deschidere si la inchidere; o apelezi manual doar daca creezi tu contextul dpg (ex. teste, rulare fara viewport).
+    '''
+    _ITEM_TYPE_CACHE.clear()
+    _LAYOUT_META.clear()
+    _WRITTEN_GEOMETRY.clear()
+    _RECT_SIZE_SNAPSHOT.clear()
+    _WRAPPER_CACHE.clear()
+    _WRAPPER_CACHE_KEYS.clear()
+    _STRUCTURE_CHANGED_TAGS.clear()
+
+_WRAPPER_CACHE = weakref.WeakValueDictionary() # (clasa wrapper-ului, uuid) -> instanta vie a wrapper-ului (identity map); uuid, nu tag, ca un alias refolosit sa nu primeasca wrapper-ul altui element
+_WRAPPER_CACHE_KEYS: Dict[Union[str, int], set] = {} # tag -> cheile sub care e in cache, pentru invalidarea la stergere (dupa stergere, alias-ul nu mai duce la uuid)
+
+def _remember_wrapper(wrapper, tag):
+    key_ = (type(wrapper), _item_uuid(tag))
+    _WRAPPER_CACHE[key_] = wrapper
+    _WRAPPER_CACHE_KEYS.setdefault(tag, set()).add(key_)
+
+def _cached_wrapper(cls, tag):
+    '''
+    Intoarce wrapper-ul de clasa cls deja existent pentru tag (acelasi obiect, cat timp e tinut in viata de cineva),
+    sau il construieste o singura data; evita reverificarea tipului dpg (_guard_incompatible_type) la fiecare re-impachetare.
+    '''
+    wrapper_ = _WRAPPER_CACHE.get((cls, _item_uuid(tag)))
+    if wrapper_ is None:
+        wrapper_ = cls(tag)
+        _remember_wrapper(wrapper_, tag)
+    return wrapper_
+
+def _collect_subtree_tags(tag, include_root=True):
+    '''
+    Colecteaza tag-urile din subarborele dpg al lui tag (toate sloturile), inainte de o stergere.
+    '''
+    tags_ = [tag] if include_root else []
+    stack_ = [tag]
+    while len(stack_) > 0:
+        children_ = dpg.get_item_children(stack_.pop())
+        for slot_children in (children_.values() if isinstance(children_, dict) else []):
+            tags_.extend(slot_children)
+            stack_.extend(slot_children)
+    return tags_
 
 from .generic_utils import guard_class_against_non_di_instantiation
 
@@ -66,7 +344,7 @@ class _EasyDPGWrapperColor:
     def __init__(self, tag, theme_creator:ThemeCreator = lambda color_hue_or_rgb_and_or_alpha: dpg.add_theme()):
         self.tag_ = tag
         self.theme_creator_ = theme_creator
-        _guard_incompatible_type(tag, _BACKGCOLOR_DPG_ITEMS)
+        _guard_incompatible_type(tag, _CAP_BACKGCOLOR)
 
     def set_background_color(self, background_color_hue_or_rgb_and_or_alpha: UniversalColor = None):
         #print(f"set-color({self}): lambda: {self.theme_creator_}")
@@ -81,15 +359,316 @@ class _EasyDPGWrapperColor:
             new_theme_ = self.theme_creator_(background_color_hue_or_rgb_and_or_alpha)
             dpg.bind_item_theme(element_tag, new_theme_)
 
+_PROFILER_HISTORY = 600 # cate cadre pastreaza profiler-ul (buffer circular), ~10s la 60fps
+
+class FrameProfiler:
+    '''
+    Profiler (optional, create_app(profile=True)) pentru bucla de randare: per cadru, timpii fiecarei faze (listenerii pre/post render,
+    reconstruirea indexului DFS, rezolvarea LM-urilor, randarea dpg) si contoare (ex. cate recalculari de LM, cate render_frame),
+    tinute intr-un buffer circular. Timpii sunt in secunde la inregistrare si in ms in sumar/dump.
+    '''
+    def __init__(self, capacity: int = _PROFILER_HISTORY):
+        self.frames_ = deque(maxlen=capacity)
+        self.current_ = None
+        self.frame_index_ = 0
+
+    def begin_frame(self):
+        self.current_ = {"frame": self.frame_index_, "start": time.perf_counter(), "phases": {}, "counters": {}}
+        self.frame_index_ += 1
+
+    def end_frame(self):
+        if self.current_ is None:
+            return
+        self.current_["total"] = time.perf_counter() - self.current_["start"]
+        self.frames_.append(self.current_)
+        self.current_ = None
+
+    def add_time(self, phase: str, seconds: float):
+        if self.current_ is not None:
+            phases_ = self.current_["phases"]
+            phases_[phase] = phases_.get(phase, 0.0) + seconds
+
+    def count(self, counter: str, n: int = 1):
+        if self.current_ is not None:
+            counters_ = self.current_["counters"]
+            counters_[counter] = counters_.get(counter, 0) + n
+
+    def frames(self) -> List[Dict[str, Any]]: return list(self.frames_)
+
+    def clear(self): self.frames_.clear(); return self
+
+    @staticmethod
+    def __percentile(sorted_values, percent):
+        # nearest-rank, fara numpy
+        rank_ = max(0, math.ceil(percent * len(sorted_values) / 100.0) - 1) # cea mai mica valoare care acopera percent% din esantioane; inmultirea intai, ca 70/100*10 sa nu dea 7.000000000000001
+        return sorted_values[rank_]
+
+    def summary(self, percentiles=(50, 90, 99)) -> Dict[str, Dict[str, float]]:
+        '''
+        :return: {faza sau contor: {'p50': .., 'p90': .., 'p99': .., 'mean': .., 'max': ..}}, timpii in ms; 'total' e durata intreaga a cadrului.
+        Fazele/contoarele care lipsesc dintr-un cadru conteaza ca 0 in acel cadru.
+        '''
+        frames_ = list(self.frames_)
+        if len(frames_) == 0:
+            return {}
+        series_ = {"total": [f["total"] * 1000.0 for f in frames_]}
+        for key in sorted({k for f in frames_ for k in f["phases"].keys()}):
+            series_[key] = [f["phases"].get(key, 0.0) * 1000.0 for f in frames_]
+        for key in sorted({k for f in frames_ for k in f["counters"].keys()}):
+            series_[f"count:{key}"] = [f["counters"].get(key, 0) for f in frames_]
+
+        summary_ = {}
+        for key, values in series_.items():
+            sorted_ = sorted(values)
+            row_ = {f"p{p}": FrameProfiler.__percentile(sorted_, p) for p in percentiles}
+            row_["mean"] = sum(sorted_) / len(sorted_)
+            row_["max"] = sorted_[-1]
+            summary_[key] = row_
+        return summary_
+
+    def format_summary(self, percentiles=(50, 90, 99)) -> str:
+        summary_ = self.summary(percentiles)
+        lines_ = [f"{len(self.frames_)} frames"]
+        for key, row in summary_.items():
+            lines_.append(f"{key}: " + " ".join([f"{k}={v:.3f}" if type(v) is float else f"{k}={v}" for k, v in row.items()]))
+        return "\n".join(lines_)
+
+    def dump(self, path: str):
+        '''
+        Scrie buffer-ul in fisier, cate un cadru JSON pe linie (timpii in ms), pentru analiza offline
+        '''
+        with open(path, "w") as f:
+            for frame_ in self.frames_:
+                f.write(json.dumps({"frame": frame_["frame"], "total_ms": frame_["total"] * 1000.0,
+                                    "phases_ms": {k: v * 1000.0 for k, v in frame_["phases"].items()},
+                                    "counters": frame_["counters"]}) + "\n")
+        return path
+
+class _ReduxUpdateScheduler:
+    '''
+    Coada de actualizari UI venite din Redux, golita o data per cadru (la inceputul pre-render-ului din EasyDPGApp): notificarile
+    pentru aceeasi cheie (widget, xpath, callback) se deduplica, ramanand doar ultima valoare, deci o rafala de dispatch-uri = o singura reconstruire.
+    '''
+    def __init__(self, on_schedule: Callable[[], None] = lambda: None):
+        self.pending_: Dict[Any, Tuple[Callable, tuple]] = {}
+        self.on_schedule_ = on_schedule # trezeste bucla de randare, daca e in repaus
+
+    def schedule(self, key, fn: Callable, *args):
+        self.pending_[key] = (fn, args) # cheie existenta: isi pastreaza locul in coada, dar cu argumentele cele mai noi
+        self.on_schedule_()
+
+    def pending(self) -> int: return len(self.pending_)
+
+    def flush(self) -> int:
+        if len(self.pending_) == 0:
+            return 0
+        pending_, self.pending_ = self.pending_, {} # dispatch-urile facute din callback-uri ajung in coada cadrului urmator
+        for fn, args in pending_.values():
+            try:
+                fn(*args)
+            except Exception as e:
+                _LOG_EVENTS.error("_ReduxUpdateScheduler: flush: UI update callback %s failed: %s", _listener_name(fn), e)
+        return len(pending_)
+
+class _UIThreadQueue:
+    '''
+    Coada prin care firele de executie din fundal (cititori de retea, calcule) trimit lucru catre firul de randare: producatorii doar adauga
+    intr-un deque (append/popleft sunt atomice in CPython, deci fara lock), iar EasyDPGApp o goleste la fiecare cadru, in limita unui buget de timp;
+    ce nu incape in buget ramane pentru cadrul urmator, ca randarea sa nu fie blocata de un producator prea rapid.
+    '''
+    def __init__(self, on_post: Callable[[], None] = lambda: None):
+        self.items_: deque = deque()
+        self.on_post_ = on_post # trezeste bucla de randare, daca e in repaus (trebuie sa fie si ea thread-safe)
+
+    def post(self, fn: Callable, *args):
+        self.items_.append((fn, args))
+        self.on_post_()
+
+    def pending(self) -> int: return len(self.items_)
+
+    def drain(self, budget_s: Union[float, None] = None) -> int:
+        '''
+        :param budget_s: timpul maxim (secunde) de executie per golire; None = tot ce era in coada la inceputul golirii
+        :return: cate elemente s-au executat (macar unul, daca exista, oricat de mic ar fi bugetul)
+        '''
+        limit_ = len(self.items_) # ce se posteaza in timpul golirii asteapta cadrul urmator
+        deadline_ = time.perf_counter() + budget_s if budget_s is not None else None
+        done_ = 0
+        while done_ < limit_:
+            fn, args = self.items_.popleft()
+            try:
+                fn(*args)
+            except Exception as e:
+                _LOG_EVENTS.error("_UIThreadQueue: drain: posted callable %s failed: %s", _listener_name(fn), e)
+            done_ += 1
+            if deadline_ is not None and time.perf_counter() >= deadline_:
+                break
+        return done_
+
+_LISTENER_HANDLES = itertools.count(1) # handle-uri monotone, unice in tot procesul (nu se pot ciocni, spre deosebire de id-urile aleatoare)
+
+class _ListenerHandle:
+    '''
+    Ce intorc metodele register_*_listener: apelat, dezinregistreaza listener-ul (ca lambda-urile de dinainte), in O(1) si idempotent.
+    '''
+    __slots__ = ('registry_', 'id')
+
+    def __init__(self, registry: '_ListenerRegistry', id: int):
+        self.registry_ = registry
+        self.id = id
+
+    def __call__(self):
+        return self.registry_.remove(self.id)
+
+class _ListenerRegistry:
+    '''
+    Registrul listenerilor unui eveniment EasyDPGApp: adaugare/stergere O(1) dupa handle, iar dispatch-ul itereaza un tuplu imutabil
+    (copy-on-write), reconstruit doar cand se schimba listenerii, nu la fiecare cadru / miscare de mouse. Ordinea: prioritate descrescatoare,
+    apoi ordinea inregistrarii; listenerii 'once' se scot inainte de primul apel. Un listener scos in timpul unui dispatch (ex. de unul anterior)
+    nu mai e apelat in acel dispatch, iar unul adaugat intre timp e apelat abia de la dispatch-ul urmator.
+    '''
+    def __init__(self):
+        self.entries_: Dict[int, Tuple[int, Callable, bool]] = {} # handle -> (prioritate, listener, once)
+        self.snapshot_: Union[Tuple[Tuple[int, Callable, bool], ...], None] = None
+
+    def add(self, listener: Callable, priority: int = 0, once: bool = False) -> _ListenerHandle:
+        handle_ = next(_LISTENER_HANDLES)
+        self.entries_[handle_] = (priority, listener, once)
+        self.snapshot_ = None
+        return _ListenerHandle(self, handle_)
+
+    def remove(self, handle: int) -> Union[Callable, None]:
+        entry_ = self.entries_.pop(handle, None)
+        if entry_ is None:
+            return None
+        self.snapshot_ = None
+        return entry_[1]
+
+    def snapshot(self) -> Tuple[Tuple[int, Callable, bool], ...]:
+        '''
+        :return: (handle, listener, once) in ordinea de apel; acelasi tuplu cat timp listenerii nu se schimba
+        '''
+        if self.snapshot_ is None:
+            ordered_ = sorted(self.entries_.items(), key=lambda item: (-item[1][0], item[0])) # handle-urile sunt monotone = ordinea inregistrarii
+            self.snapshot_ = tuple((handle_, listener_, once_) for handle_, (_, listener_, once_) in ordered_)
+        return self.snapshot_
+
+    def claim(self, handle: int, once: bool) -> bool:
+        # un listener 'once' se scoate chiar inainte de apel; daca a fost deja scos (ex. de un listener anterior din acelasi dispatch), nu se mai apeleaza
+        return self.remove(handle) is not None if once else handle in self.entries_
+
+    def dispatch(self, *args):
+        for handle_, listener_, once_ in self.snapshot():
+            if (self.remove(handle_) is None) if once_ else (handle_ not in self.entries_):
+                continue # ca in claim(), dar inline: dispatch-ul e pe calea fierbinte (fiecare cadru / miscare de mouse)
+            listener_(*args)
+
+    def listeners(self) -> Tuple[Callable, ...]: return tuple(listener_ for _, listener_, _ in self.snapshot())
+    def __len__(self): return len(self.entries_)
+
+_MOUSE_REGION_CELL = 128 # latura (px) celulelor grilei din _MouseRegionIndex
+
+class _MouseRegionIndex:
+    '''
+    Index spatial (grila uniforma) al dreptunghiurilor elementelor pe care s-au abonat listeneri de mouse 'pe regiune': o miscare de mouse
+    verifica doar regiunile din celula cursorului, deci listenerii regiunilor departe de cursor nu costa nimic. Grila se reconstruieste doar
+    dupa add() sau invalidate() (layout, structura, scroll etc. anuntate de EasyDPGApp.invalidate_mouse_regions), nu la fiecare cadru.
+    '''
+    def __init__(self, cell: int = _MOUSE_REGION_CELL):
+        self.cell_ = cell
+        self.regions_: Dict[int, Tuple[Union[int, str], MouseMoveListener, Union[Callable[[], None], None]]] = {} # handle -> (tag, listener, on_leave)
+        self.rects_: Dict[int, Tuple[float, float, float, float]] = {} # handle -> (x0, y0, x1, y1)
+        self.grid_: Dict[Tuple[int, int], List[int]] = {}
+        self.built_frame_ = None # cadrul ultimei reconstruiri; None = de reconstruit la urmatoarea rutare
+        self.stale_until_frame_ = -1 # pana la acest cadru (inclusiv) dreptunghiurile se recitesc, cel mult o data per cadru
+        self.hovered_: List[int] = []
+
+    def add(self, tag, listener: MouseMoveListener, on_leave: Callable[[], None] = None) -> _ListenerHandle:
+        handle_ = next(_LISTENER_HANDLES)
+        self.regions_[handle_] = (tag, listener, on_leave)
+        self.built_frame_ = None
+        return _ListenerHandle(self, handle_)
+
+    def remove(self, handle: int) -> Union[MouseMoveListener, None]:
+        region_ = self.regions_.pop(handle, None) # din grila dispare la urmatoarea reconstruire; pana atunci e sarit la rutare
+        return region_[1] if region_ is not None else None
+
+    def __len__(self): return len(self.regions_)
+
+    def invalidate(self, frame: int):
+        # geometria scrisa in cadrul frame ajunge in dpg (get_item_rect_min) abia dupa urmatoarea randare, deci si cadrul urmator reciteste
+        self.stale_until_frame_ = max(self.stale_until_frame_, frame + 1)
+
+    def refresh(self, frame: int):
+        if self.built_frame_ is not None and (frame == self.built_frame_ or frame > self.stale_until_frame_):
+            return # nimic anuntat de la ultima reconstruire: aceleasi dreptunghiuri, aceeasi grila
+        self.built_frame_ = frame
+        self.grid_ = {}
+        self.rects_ = {}
+        for handle_, (tag, _, _) in list(self.regions_.items()):
+            if not dpg.does_item_exist(tag):
+                self.regions_.pop(handle_) # elementul a fost sters: abonarea dispare odata cu el
+                continue
+            x0_, y0_ = dpg.get_item_rect_min(tag)
+            width_, height_ = _rect_size(tag)
+            if width_ <= 0 or height_ <= 0:
+                continue
+            self.rects_[handle_] = (x0_, y0_, x0_ + width_, y0_ + height_)
+            for cx in range(int(x0_ // self.cell_), int((x0_ + width_) // self.cell_) + 1):
+                for cy in range(int(y0_ // self.cell_), int((y0_ + height_) // self.cell_) + 1):
+                    self.grid_.setdefault((cx, cy), []).append(handle_)
+
+    def route(self, x, y, frame: int):
+        self.refresh(frame)
+        hit_ = []
+        for handle_ in self.grid_.get((int(x // self.cell_), int(y // self.cell_)), ()):
+            x0_, y0_, x1_, y1_ = self.rects_[handle_]
+            if handle_ in self.regions_ and x0_ <= x < x1_ and y0_ <= y < y1_:
+                hit_.append(handle_)
+        for handle_ in self.hovered_:
+            if handle_ not in hit_ and handle_ in self.regions_ and self.regions_[handle_][2] is not None:
+                self.regions_[handle_][2]()
+        self.hovered_ = hit_
+        for handle_ in hit_:
+            region_ = self.regions_.get(handle_) # un listener anterior l-ar fi putut scoate
+            if region_ is not None:
+                region_[1](x, y)
+
+def _listener_name(listener) -> str: return getattr(listener, "__qualname__", None) or repr(listener)
+
 @dataclasses.dataclass
 class EasyDPGAppConfigurator:
     background_color: UniversalColor
     pos: Union[Tuple[int, int], None]
     size: Union[Tuple[Union[str, int], Union[str, int]], None]
     fullscreen: bool
+    poll_structure_changes: bool = False # fallback: verifica la fiecare cadru numarul de copii al tuturor nodurilor (pentru UI construit cu apeluri dpg brute)
+    batch_layout_solve: bool = False # rezolva LM-urile proportionale de pe acelasi nivel impreuna, vectorizat cu numpy (daca e instalat)
+    profile: bool = False # inregistreaza timpii per cadru in EasyDPGApp.profiler()
+    coalesce_redux_updates: bool = False # notificarile Redux ale widget-urilor se aplica o data per cadru (ultima valoare), nu sincron la fiecare dispatch
+    coalesce_mouse_moves: bool = False # listenerii de miscare a mouse-ului primesc doar ultima pozitie, o data per cadru, nu fiecare eveniment
+    ui_queue_budget_ms: Union[float, None] = 4.0 # cat timp per cadru se consuma din coada post_to_ui/dispatch_threadsafe (None = nelimitat)
+    background_workers: int = 2 # firele de executie pentru listenerii pre/post render marcati background=True
+    background_deadline_ms: float = 2.0 # cat asteapta un cadru rezultatele listenerilor pre-render din fundal, inainte sa le lase pe cadrele urmatoare
+    target_fps: Union[float, None] = None # plafonul de cadre/secunda cand e ceva de facut; None = cat de repede poate dpg (ca inainte)
+    idle_fps: Union[float, None] = None # cand nu e nimic de facut, bucla coboara la acest ritm (si se trezeste la input / update-uri postate / timere); None = fara repaus
+    resize_throttle_ms: float = 0.0 # cat de des se aplica pe panoul radacina marimea noua a viewport-ului, in timpul tragerii de fereastra (0 = la fiecare cadru)
+    resize_settle_ms: Union[float, None] = None # in timpul redimensionarii (si inca atatea ms dupa ultimul eveniment) layout-ul face doar trecerea rapida; None = mereu layout complet
+
+    def __post_init__(self):
+        self.target_fps = _validated_fps(self.target_fps, "target_fps")
+        self.idle_fps = _validated_fps(self.idle_fps, "idle_fps")
+
+def _validated_fps(fps: Union[float, None], name: str) -> Union[float, None]:
+    # ritmul se foloseste ca 1.0 / fps; fara plafon se cere cu None, nu cu 0
+    if fps is None:
+        return None
+    if fps <= 0:
+        raise Exception(f"ERROR: EasyDPGApp: {name} must be a positive frame rate, or None for no limit; got {fps}")
+    return float(fps)
 
 def _configure_app(binder):
-    configuration = EasyDPGAppConfigurator(background_color=globals()['_APP_BACKGROUND_COLOR'], pos=globals()['_APP_POS'], size=globals()['_APP_SIZE'], fullscreen=globals()['_APP_FULLSCREEN'])
+    configuration = EasyDPGAppConfigurator(background_color=globals()['_APP_BACKGROUND_COLOR'], pos=globals()['_APP_POS'], size=globals()['_APP_SIZE'], fullscreen=globals()['_APP_FULLSCREEN'], poll_structure_changes=globals()['_APP_POLL_STRUCTURE_CHANGES'], batch_layout_solve=globals()['_APP_BATCH_LAYOUT_SOLVE'], profile=globals()['_APP_PROFILE'], coalesce_redux_updates=globals()['_APP_COALESCE_REDUX_UPDATES'], coalesce_mouse_moves=globals()['_APP_COALESCE_MOUSE_MOVES'], ui_queue_budget_ms=globals()['_APP_UI_QUEUE_BUDGET_MS'], background_workers=globals()['_APP_BACKGROUND_WORKERS'], background_deadline_ms=globals()['_APP_BACKGROUND_DEADLINE_MS'], target_fps=globals()['_APP_TARGET_FPS'], idle_fps=globals()['_APP_IDLE_FPS'], resize_throttle_ms=globals()['_APP_RESIZE_THROTTLE_MS'], resize_settle_ms=globals()['_APP_RESIZE_SETTLE_MS'])
     binder.bind(EasyDPGAppConfigurator, to=configuration, scope=singleton) # poate fi singleton sau ne-singleton (instance) ca nici nu conteaza, fiindca oricum va fi folosita o singura data, pentru o singura clasa (care e ea insasi un singleton)...
 
 class EasyDPGApp:
@@ -99,9 +678,29 @@ class EasyDPGApp:
         self.configurator_ = configurator
 
         self.running_ = False
-        self.mouse_position_listeners_: Dict[str, MouseMoveListener] = {}
-        self.mouse_press_listeners_: Dict[str, MousePressListener] = {}
-        self.keyboard_press_listeners_: Dict[str, KeyboardPressListener] = {}
+        self.rendered_frames_ = 0
+        self.profiler_: Union[FrameProfiler, None] = FrameProfiler() if configurator.profile else None
+        self.profiler_overlay_ = None
+        self.wake_ = threading.Event() # setat de orice sursa de lucru (input, update-uri postate, layout murdar); vezi request_frame()
+        self.async_wake_: Union[asyncio.Event, None] = None
+        self.frames_since_activity_ = 0
+        self.timers_: List[list] = [] # heap de [scadenta, nr. ordine, fn, args, anulat]
+        self.timers_seq_ = 0
+        self.pacing_stats_ = {"frames": 0, "idle_frames": 0, "slept_s": 0.0, "busy_wall_s": 0.0, "busy_cpu_s": 0.0}
+        self.redux_scheduler_ = _ReduxUpdateScheduler(on_schedule=self.request_frame)
+        self.ui_queue_ = _UIThreadQueue(on_post=self.request_frame)
+        self.background_pre_render_listeners_ = _ListenerRegistry() # de BackgroundRenderListener
+        self.background_post_render_listeners_ = _ListenerRegistry()
+        self.background_in_flight_: Dict[int, concurrent.futures.Future] = {} # atins si din firele din fundal (la terminare), deci doar sub background_lock_
+        self.background_lock_ = threading.Lock()
+        self.background_executor_: Union[concurrent.futures.ThreadPoolExecutor, None] = None # creat la prima nevoie
+        self.async_loop_: Union[asyncio.AbstractEventLoop, None] = None # doar cat ruleaza async_start
+        self.async_tasks_ = set()
+        self.mouse_position_listeners_ = _ListenerRegistry() # de MouseMoveListener
+        self.mouse_regions_ = _MouseRegionIndex()
+        self.pending_mouse_pos_: Union[Tuple[int, int], None] = None # ultima pozitie, in modul coalesce_mouse_moves
+        self.mouse_press_listeners_ = _ListenerRegistry() # de MousePressListener
+        self.keyboard_press_listeners_ = _ListenerRegistry() # de KeyboardPressListener
         self.key_map_ = { # @TODO NETESTATE prea mult, determinate experimental, verificare sporadic, unde a fost nevoie - lista supusa corectarii si TODO inca nu stiu daca astea sunt scancode-urile de la tastatura fizica, sau codurile interpretate de OS (daca sunt probleme de inconsistenta, mai bine aflu tastele cu alta biblioteca) (totusi, fiindca literele sunt aceleasi cu codul ascii, pp ca OS-ul le da asa, deci ca ar fi interpretate -- luam pp cu sare, ca testul cu ro/en z-y nu mi-a iesit, mereu y e 89 si z e 90)
             257: "enter",
             256: "escape",
@@ -182,13 +781,15 @@ class EasyDPGApp:
         for k in range(65, 90 + 1): # la litere e simplu, sunt aceleasi cu codul ascii
             self.key_map_[k] = chr(k).lower()
 
-        self.pre_render_listeners_ = {}
-        self.post_render_listeners_ = {}
+        self.pre_render_listeners_ = _ListenerRegistry()
+        self.post_render_listeners_ = _ListenerRegistry()
 
         self.root_tag_ = None
 
         self.updated_viewport_width_ = None
         self.updated_viewport_height_ = None
+        self.last_viewport_resize_: Union[float, None] = None # perf_counter-ul ultimului eveniment de redimensionare
+        self.last_root_resize_applied_ = 0.0
 
         self.widgets_store_: Dict[str, 'EasyDPGWidget'] = {}
 
@@ -197,121 +798,492 @@ class EasyDPGApp:
 
     def lookup_widget(self, name) -> Union['EasyDPGWidget', None]: return self.widgets_store_[name] if name in self.widgets_store_ else None
 
-    def __generate_listener_id_(self, prefix="listener"):
-        return f"{prefix}_{int(random.random() * 1000000)}"
+    # toate register_*_listener: priority mai mare = apelat mai devreme (la egalitate, in ordinea inregistrarii), once = apelat o singura data;
+    # intorc un _ListenerHandle: apelat, dezinregistreaza listener-ul (.id e handle-ul stabil)
+    def register_mouse_move_listener(self, listener: MouseMoveListener, priority: int = 0, once: bool = False) -> _ListenerHandle:
+        return self.mouse_position_listeners_.add(listener, priority, once)
 
-    def register_mouse_move_listener(self, listener: MouseMoveListener):
-        id_ = self.__generate_listener_id_("mml")
-        self.mouse_position_listeners_[id_] = listener
-        return lambda: self.mouse_position_listeners_.pop(id_)
+    def register_mouse_region_listener(self, tag_or_wrapper: AnyParent, listener: MouseMoveListener, on_leave: Callable[[], None] = None) -> _ListenerHandle:
+        '''
+        Ca register_mouse_move_listener, dar listener-ul e apelat doar cat timp cursorul e deasupra dreptunghiului elementului dat
+        (on_leave, daca e dat, cand il paraseste); abonarea dispare singura odata cu elementul.
+        '''
+        return self.mouse_regions_.add(tag_or_wrapper if type(tag_or_wrapper) in [int, str] else tag_or_wrapper.tag(), listener, on_leave)
 
-    def register_mouse_press_listener(self, listener: MousePressListener):
-        id_ = self.__generate_listener_id_("mpl")
-        self.mouse_press_listeners_[id_] = listener
-        return lambda: self.mouse_press_listeners_.pop(id_)
+    def invalidate_mouse_regions(self):
+        '''
+        Anunta ca dreptunghiurile regiunilor de mouse (register_mouse_region_listener) s-ar fi putut muta; se recitesc la urmatoarele miscari de mouse.
+        Layout-ul, modificarile de structura, panoul radacina si EasyDPGVirtualList il apeleaza singure; e nevoie de el doar dupa scroll
+        sau geometrie scrisa direct (set_pos / dpg brut) pe elemente care au regiuni.
+        '''
+        self.mouse_regions_.invalidate(self.rendered_frames_); return self
 
-    def register_keyboard_press_listener(self, listener: KeyboardPressListener):
-        id_ = self.__generate_listener_id_("kpl")
-        self.keyboard_press_listeners_[id_] = listener
-        return lambda: self.keyboard_press_listeners_.pop(id_)
+    def register_mouse_press_listener(self, listener: MousePressListener, priority: int = 0, once: bool = False) -> _ListenerHandle:
+        return self.mouse_press_listeners_.add(listener, priority, once)
 
-    def register_pre_render_listener(self, listener: RenderListener = lambda: print("WARNING: EasyDPGApp: register_pre_render_listener: NOP listener for dpg renders, this SHOULD BE REPLACED with a valid implementation, instead !")):
+    def register_keyboard_press_listener(self, listener: KeyboardPressListener, priority: int = 0, once: bool = False) -> _ListenerHandle:
+        return self.keyboard_press_listeners_.add(listener, priority, once)
+
+    def register_pre_render_listener(self, listener: RenderListener = lambda: _LOG_EVENTS.warning("EasyDPGApp: register_pre_render_listener: NOP listener for dpg renders, this SHOULD BE REPLACED with a valid implementation, instead !"), background: bool = False,
+                                     priority: int = 0, once: bool = False) -> _ListenerHandle:
+        '''
+        :param background: True = listener-ul (BackgroundRenderListener) ruleaza pe un fir de executie din fundal, deci NU are voie sa atinga dpg/wrappere;
+            lucrul pe UI il intoarce ca functie, aplicata apoi pe firul de randare (in acelasi cadru, daca termina in background_deadline_ms, altfel mai tarziu).
+            Cat timp rularea anterioara nu s-a terminat, cadrele urmatoare nu il mai pornesc inca o data.
+        '''
         #print(f"@@@@@@@@@@@@@ register_pre_render_listener la timpul {time.time()}")
-        id_ = self.__generate_listener_id_("prl")
-        self.pre_render_listeners_[id_] = listener
-        return lambda: self.pre_render_listeners_.pop(id_)
-    def register_post_render_listener(self, listener: RenderListener = lambda: print("WARNING: EasyDPGApp: register_post_render_listener: NOP listener for dpg renders, this SHOULD BE REPLACED with a valid implementation, instead !")):
+        return (self.background_pre_render_listeners_ if background else self.pre_render_listeners_).add(listener, priority, once)
+    def register_post_render_listener(self, listener: RenderListener = lambda: _LOG_EVENTS.warning("EasyDPGApp: register_post_render_listener: NOP listener for dpg renders, this SHOULD BE REPLACED with a valid implementation, instead !"), background: bool = False,
+                                      priority: int = 0, once: bool = False) -> _ListenerHandle:
+        '''
+        :param background: ca la register_pre_render_listener; rezultatul se aplica la unul din cadrele urmatoare
+        '''
         #print(f"@@@@@@@@@@@@@ register_post_render_listener la timpul {time.time()}")
-        id_ = self.__generate_listener_id_("psrl")
-        self.post_render_listeners_[id_] = listener
-        return lambda: self.post_render_listeners_.pop(id_)
+        return (self.background_post_render_listeners_ if background else self.post_render_listeners_).add(listener, priority, once)
+
+    def __run_background(self, listener: BackgroundRenderListener):
+        # pe firul din fundal; aplicarea rezultatului trece prin coada firului de randare
+        apply_ = listener()
+        if callable(apply_):
+            self.ui_queue_.post(apply_)
+
+    def __submit_background(self, listeners: _ListenerRegistry) -> List[concurrent.futures.Future]:
+        if len(listeners) == 0:
+            return []
+        if self.background_executor_ is None:
+            self.background_executor_ = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, self.configurator_.background_workers), thread_name_prefix="easydpg-bg")
+        submitted_ = []
+        for id_, l, once in listeners.snapshot():
+            with self.background_lock_:
+                previous_ = self.background_in_flight_.get(id_)
+            if previous_ is not None and not previous_.done():
+                if self.profiler_ is not None:
+                    self.profiler_.count("background_skipped")
+                continue
+            if not listeners.claim(id_, once):
+                continue
+            future_ = self.background_executor_.submit(self.__run_background, l)
+            with self.background_lock_:
+                self.background_in_flight_[id_] = future_
+            future_.add_done_callback(functools.partial(self.__background_done, id_, l)) # dupa inregistrare (daca future_ e deja gata, ruleaza imediat, pe acest fir)
+            submitted_.append(future_)
+        if self.profiler_ is not None:
+            self.profiler_.count("background_submitted", len(submitted_))
+        return submitted_
+
+    def __background_done(self, id_, listener, future: concurrent.futures.Future):
+        with self.background_lock_: # verificarea si stergerea impreuna, altfel o trimitere noua pentru acelasi id_ poate fi stearsa din greseala
+            if self.background_in_flight_.get(id_) is future:
+                del self.background_in_flight_[id_]
+        if not future.cancelled() and future.exception() is not None:
+            _LOG_EVENTS.error("EasyDPGApp: background render listener %s failed: %s", _listener_name(listener), future.exception())
+
+    def __wait_background(self, futures: List[concurrent.futures.Future]):
+        # asteapta rezultatele din fundal cel mult background_deadline_ms, apoi le aplica pe cele gata; restul raman in coada pentru cadrele urmatoare
+        if len(futures) == 0:
+            return
+        t0_ = time.perf_counter()
+        _, pending_ = concurrent.futures.wait(futures, timeout=self.configurator_.background_deadline_ms / 1000.0)
+        self.drain_ui_queue()
+        if self.profiler_ is not None:
+            self.profiler_.count("background_late", len(pending_))
+            self.profiler_.add_time("background_wait", time.perf_counter() - t0_)
+
+    def __shutdown_background(self):
+        if self.background_executor_ is not None:
+            self.background_executor_.shutdown(wait=False, cancel_futures=True)
+            self.background_executor_ = None
+        with self.background_lock_:
+            self.background_in_flight_.clear()
+
+
+    def post_to_ui(self, fn: Callable, *args):
+        '''
+        Singurul mod sigur de a atinge UI-ul (wrappere, dpg, listeneri) dintr-un alt fir de executie: fn(*args) va fi apelata pe firul de randare,
+        inainte de urmatorul cadru (sau de cele urmatoare, daca bugetul per cadru e depasit), in ordinea postarii.
+        '''
+        self.ui_queue_.post(fn, *args)
 
+    def dispatch_threadsafe(self, redux_store: ReduxStore, action):
+        '''
+        Ca redux_store.dispatch(action), dar apelabila din orice fir de executie: dispatch-ul (si deci listenerii UI) ruleaza pe firul de randare.
+        '''
+        self.ui_queue_.post(redux_store.dispatch, action)
+
+    def drain_ui_queue(self) -> int:
+        budget_ms_ = self.configurator_.ui_queue_budget_ms
+        return self.ui_queue_.drain(budget_ms_ / 1000.0 if budget_ms_ is not None else None)
 
     def __dispatch_pre_render_event(self):
-        listeners_ = list(self.pre_render_listeners_.values()) # pentru daca apelezi register_<blah>_listener during calback, otherwise it will throw a "RuntimeError: dictionary changed size during iteration"
-        for l in listeners_:
-            l()
+        background_ = self.__submit_background(self.background_pre_render_listeners_) # pornesc primii, ca sa ruleze in paralel cu tot restul cadrului
+
+        # miscarea de mouse amanata (coalesce_mouse_moves): doar ultima pozitie din cadrul precedent
+        if self.pending_mouse_pos_ is not None:
+            x_, y_ = self.pending_mouse_pos_
+            self.pending_mouse_pos_ = None
+            self.__deliver_mouse_move(x_, y_)
+
+        # apoi ce au postat celelalte fire de executie (de regula dispatch-uri, care pot alimenta coada de mai jos)
+        if self.profiler_ is not None:
+            t0_ = time.perf_counter()
+            self.profiler_.count("ui_queue_items", self.drain_ui_queue())
+            self.profiler_.add_time("ui_queue", time.perf_counter() - t0_)
+        else:
+            self.drain_ui_queue()
+
+        # apoi actualizarile UI din Redux, ca modificarile de structura pe care le fac sa fie preluate de LM-uri chiar in acest cadru
+        if self.profiler_ is not None:
+            t0_ = time.perf_counter()
+            self.profiler_.count("redux_updates", self.redux_scheduler_.flush())
+            self.profiler_.add_time("redux_flush", time.perf_counter() - t0_)
+        else:
+            self.redux_scheduler_.flush()
+
+        # registrul itereaza un tuplu imutabil, deci register_<blah>_listener apelat din callback nu strica iteratia curenta
+        if self.profiler_ is not None:
+            self.__dispatch_profiled(self.pre_render_listeners_, "pre_render")
+        else:
+            self.pre_render_listeners_.dispatch()
+        self.__wait_background(background_)
 
     def __dispatch_post_render_event(self):
         #print(f"@@@@@@@@@@@@@ __dispatch_post_render_event la timpul {time.time()}")
-        listeners_ = list(self.post_render_listeners_.values())
-        for l in listeners_:
+        if self.profiler_ is not None:
+            self.__dispatch_profiled(self.post_render_listeners_, "post_render")
+        else:
+            self.post_render_listeners_.dispatch()
+        self.__submit_background(self.background_post_render_listeners_) # rezultatele lor se aplica la cadrele urmatoare, nu le asteptam
+
+    def __dispatch_profiled(self, listeners: _ListenerRegistry, phase):
+        for id_, l, once in listeners.snapshot():
+            if not listeners.claim(id_, once):
+                continue
+            t0_ = time.perf_counter()
             l()
+            self.profiler_.add_time(f"{phase}:{_listener_name(l)}", time.perf_counter() - t0_)
     def __dispatch_mouse_move(self, x, y):
-        listeners_ = list(self.mouse_position_listeners_.values())
-        for l in listeners_:
-            l(x, y)
+        self.request_frame()
+        if self.configurator_.coalesce_mouse_moves:
+            self.pending_mouse_pos_ = (x, y) # livrata la inceputul urmatorului pre-render; pozitiile intermediare se pierd
+            if self.profiler_ is not None:
+                self.profiler_.count("mouse_move_events")
+            return
+        self.__deliver_mouse_move(x, y)
+
+    def __deliver_mouse_move(self, x, y):
+        if self.profiler_ is not None:
+            self.profiler_.count("mouse_move_deliveries")
+        self.mouse_position_listeners_.dispatch(x, y)
+        if len(self.mouse_regions_) > 0:
+            self.mouse_regions_.route(x, y, self.rendered_frames_)
     def __dispatch_mouse_press(self, pressed_button: MousePressedButton):
-        listeners_ = list(self.mouse_press_listeners_.values())
-        for l in listeners_:
-            l(pressed_button)
+        self.request_frame()
+        self.mouse_press_listeners_.dispatch(pressed_button)
     def __dispatch_keyboard_press(self, pressed_scancode: KeyboardPressedScancode):
+        self.request_frame()
         if pressed_scancode == 342: # nu stiu de ce mereu tot genereaza tasta asta, dupa orice alta tasta...
             #print(342) # cu asta @TODO pot detecta secvente, desi si combinatii de taste, daca de ex detectez ca in secventa e o tasta extinsa (sau mai multe) o pot considera combinatie sau mai multe combinatii cu acea tasta extinsa, altfel doar o apasare succesiva la timp scurt, deci o pot desparti in taste individuale -- dar nu stiu daca se merita, odata ca la dpg nu-mi trebuie chestii poate atat de avansate (desi combinatiile, ca scurtaturi de la tastatura ba) si nu cumva e mai bine sa oflosesc atatea alte pachete de detectare evenimente tastatura, care deja fac logica de genul in spate
             return
         #print(self.key_map_[pressed_scancode])
 
-        listeners_ = list(self.keyboard_press_listeners_.values())
-        for l in listeners_:
-            l(pressed_scancode, self.key_map_[pressed_scancode])
+        self.keyboard_press_listeners_.dispatch(pressed_scancode, self.key_map_[pressed_scancode])
 
     def __viewport_resized(self):
         self.updated_viewport_width_ = dpg.get_viewport_client_width()
         self.updated_viewport_height_ = dpg.get_viewport_client_height()
+        self.last_viewport_resize_ = time.perf_counter()
+        self.request_frame()
+
+    def is_resizing(self) -> bool:
+        '''
+        True cat timp fereastra e redimensionata (si inca resize_settle_ms dupa ultimul eveniment): layout-ul face atunci doar trecerea rapida.
+        '''
+        settle_ms_ = self.configurator_.resize_settle_ms
+        if settle_ms_ is None or self.last_viewport_resize_ is None:
+            return False
+        return self.updated_viewport_width_ is not None or (time.perf_counter() - self.last_viewport_resize_) * 1000.0 < settle_ms_
+
+    def request_frame(self):
+        '''
+        Marcheaza ca e ceva de facut: bucla de randare iese din repaus (idle_fps) si ruleaza la ritmul normal. Apelabila din orice fir de executie;
+        input-ul, coada post_to_ui, actualizarile Redux amanate, timerele si layout-ul o apeleaza singure.
+        '''
+        self.wake_.set()
+        loop_, wake_ = self.async_loop_, self.async_wake_ # citite o singura data: async_start le poate goli intre timp, pe firul lui
+        if loop_ is not None and wake_ is not None:
+            try:
+                loop_.call_soon_threadsafe(wake_.set)
+            except RuntimeError:
+                pass # loop-ul tocmai s-a inchis; nu mai are cine sa fie trezit
+
+    def call_later(self, delay: float, fn: Callable, *args):
+        '''
+        Apeleaza fn(*args) pe firul de randare, la primul cadru de dupa delay secunde (bucla se trezeste la timp si din repaus).
+        Doar de pe firul de randare; din alte fire de executie: post_to_ui(app.call_later, delay, fn).
+        :return: functie de anulare
+        '''
+        timer_ = [time.perf_counter() + delay, self.timers_seq_, fn, args, False]
+        self.timers_seq_ += 1
+        heapq.heappush(self.timers_, timer_)
+        def _cancel(): timer_[4] = True
+        return _cancel
+
+    def __run_due_timers(self):
+        now_ = time.perf_counter()
+        while len(self.timers_) > 0 and self.timers_[0][0] <= now_:
+            _, _, fn, args, cancelled = heapq.heappop(self.timers_)
+            if cancelled:
+                continue
+            self.wake_.set()
+            try:
+                self.spawn_if_awaitable(fn(*args))
+            except Exception as e:
+                _LOG_EVENTS.error("EasyDPGApp: timer callback %s failed: %s", _listener_name(fn), e)
+
+    def __is_dirty(self) -> bool:
+        return self.wake_.is_set() or self.ui_queue_.pending() > 0 or self.redux_scheduler_.pending() > 0 or \
+            len(_STRUCTURE_CHANGED_TAGS) > 0 or self.updated_viewport_width_ is not None or self.pending_mouse_pos_ is not None
+
+    def __frame_delay(self, frame_start: float, frame_interval: Union[float, None] = None) -> Tuple[float, bool]:
+        '''
+        :return: (cat sa astepte bucla inainte de cadrul urmator, daca e in repaus); in repaus se asteapta doar dupa _IDLE_GRACE_FRAMES cadre
+            fara activitate, ca animatiile dpg si layout-ul (care se aseaza in cateva cadre) sa se termine la ritmul normal
+        '''
+        idle_ = self.configurator_.idle_fps is not None and self.frames_since_activity_ >= _IDLE_GRACE_FRAMES and not self.__is_dirty()
+        if idle_:
+            interval_ = 1.0 / self.configurator_.idle_fps
+        elif frame_interval is not None:
+            interval_ = frame_interval
+        elif self.configurator_.target_fps is not None:
+            interval_ = 1.0 / self.configurator_.target_fps
+        else:
+            return 0.0, False
+        now_ = time.perf_counter()
+        delay_ = frame_start + interval_ - now_
+        if len(self.timers_) > 0:
+            delay_ = min(delay_, self.timers_[0][0] - now_)
+        return max(0.0, delay_), idle_
+
+    def __account_frame(self, wall_t0: float, cpu_t0: float, slept: float, idle: bool):
+        stats_ = self.pacing_stats_
+        stats_["frames"] += 1
+        stats_["idle_frames"] += 1 if idle else 0
+        stats_["slept_s"] += slept
+        stats_["busy_wall_s"] += time.perf_counter() - wall_t0 - slept
+        stats_["busy_cpu_s"] += time.process_time() - cpu_t0
+        if self.profiler_ is not None:
+            self.profiler_.add_time("pacing_sleep", slept)
+            if idle:
+                self.profiler_.count("idle_frames")
+
+    def pacing_stats(self) -> Dict[str, float]:
+        '''
+        Statistici de ritm ale buclei de randare: cadre (si cate in repaus), timpul dormit, timpul de lucru (perete si CPU);
+        estimated_cpu_saved_s = timpul dormit * gradul de ocupare al CPU cand bucla lucreaza, adica ce ar fi ars o bucla fara pauze in acelasi timp.
+        '''
+        stats_ = dict(self.pacing_stats_)
+        busy_ratio_ = stats_["busy_cpu_s"] / stats_["busy_wall_s"] if stats_["busy_wall_s"] > 0 else 0.0
+        stats_["cpu_ms_per_frame"] = stats_["busy_cpu_s"] * 1000.0 / stats_["frames"] if stats_["frames"] > 0 else 0.0
+        stats_["estimated_cpu_saved_s"] = stats_["slept_s"] * busy_ratio_
+        return stats_
 
     def start(self, create_ui: Callable=lambda: None):
         if not self.running_:
             self.running_ = True
-            dpg.create_context()
-            self._install_controller_listeners()
-            with EasyDPGWrapperPrimaryPanel.build(background_color_hue_or_rgb_and_or_alpha=self.configurator_.background_color) as w:
-                #w.set_movable() # just for DEBUGGING purposes...
-                #w.set_resizable()
-                self.root_tag_ = w.tag()
-                create_ui()
-
-            fs_width_, fs_height_ = get_fullscreen_dimensions()
-            size = [None, None]
-            if self.configurator_.size is None:
-                size = [fs_width_, fs_height_]
-            size[0] = int(self.configurator_.size[0]) if type(self.configurator_.size[0]) is int or (type(self.configurator_.size[0]) is float and self.configurator_.size[0] > 1.0) else (float(int(self.configurator_.size[0].strip()[:-1]) / 100.0) if type(self.configurator_.size[0]) is str and '%' in self.configurator_.size[0] else (self.configurator_.size[0] if type(self.configurator_.size[0]) is float else None))
-            if size[0] is None:
-                raise Exception(f"EasyDPGApp: invalid size[0] (width) given: {size[0]}. Should be [0,1] float, or an absolute integer or a % specified percentage (as str) !")
-            size[1] = int(self.configurator_.size[1]) if type(self.configurator_.size[1]) is int or (type(self.configurator_.size[1]) is float and self.configurator_.size[1] > 1.0) else (float(int(self.configurator_.size[1].strip()[:-1]) / 100.0) if type(self.configurator_.size[1]) is str and '%' in self.configurator_.size[1] else (self.configurator_.size[1] if type(self.configurator_.size[1]) is float else None))
-            if size[1] is None:
-                raise Exception(f"EasyDPGApp: invalid size[1] (height) given: {size[1]}. Should be [0,1] float, or an absolute integer or a % specified percentage (as str) !")
-            
-            size[0] = self.configurator_.size[0] if type(self.configurator_.size[0]) is int else int(fs_width_ * size[0])
-            size[1] = self.configurator_.size[1] if type(self.configurator_.size[1]) is int else int(fs_height_ * size[1])
-
-            size = tuple(size)            
-            pos = self.configurator_.pos if self.configurator_.pos is not None else (int((fs_width_ - size[0]) / 2), int((fs_height_ - size[1]) / 2))
-
-            dpg.create_viewport(decorated=not(self.configurator_.fullscreen is not None and self.configurator_.fullscreen), always_on_top=self.configurator_.fullscreen is not None and self.configurator_.fullscreen, y_pos=pos[1], x_pos=pos[0], width=size[0], height=size[1])
-            #dpg.create_viewport(y_pos=pos[1], x_pos=pos[0])
-            dpg.setup_dearpygui()
-
-            # @TODO se poate face un switch la constructor prin care sa poti activa chestii de depanare (si poate sa obligi cumva fereastra principala sa fie 'mutabila' ca altfel nu te poti uita la panourile astea de depanare...
-            #dpg.show_item_registry() # for DEBUGGING purposes
-
-            dpg.set_viewport_resize_callback(callback=self.__viewport_resized)
-
-            dpg.show_viewport()
-            while self.running_ and dpg.is_dearpygui_running():
-                self.__dispatch_pre_render_event() # @TODO nu ar strica astea doua dispatch-uri sa fie executate in fir de executie separat, de fapt asa s-ar cere, ca firul de randare (iata, si calcule) UI, sa se intample cat mai 'la sigur', neimpiedicat de nimeni...
-                self.render_frame()
-                self.__dispatch_post_render_event()
-                if self.updated_viewport_width_ is not None:# or self.updated_viewport_height_ is not None:
-                    EasyDPGWrapperPrimaryPanel(self.root_tag_).set_width(self.updated_viewport_width_)
-                    EasyDPGWrapperPrimaryPanel(self.root_tag_).set_height(self.updated_viewport_height_)
-                    self.updated_viewport_width_ = None
-                    self.updated_viewport_height_ = None
-
-            dpg.destroy_context()
-
-    def render_frame(self): dpg.render_dearpygui_frame()
+            try:
+                self.__open(create_ui)
+                while self.running_ and dpg.is_dearpygui_running():
+                    wall_t0_, cpu_t0_ = time.perf_counter(), time.process_time()
+                    self._step_frame()
+                    delay_, idle_ = self.__frame_delay(wall_t0_)
+                    if delay_ > 0:
+                        t0_ = time.perf_counter()
+                        if idle_:
+                            self.wake_.wait(delay_) # in repaus, orice request_frame() (ex. din alt fir de executie) scurteaza asteptarea
+                        else:
+                            time.sleep(delay_)
+                        self.__account_frame(wall_t0_, cpu_t0_, time.perf_counter() - t0_, idle_)
+                    else:
+                        self.__account_frame(wall_t0_, cpu_t0_, 0.0, idle_)
+            finally:
+                self.running_ = False
+                self.__close()
+
+    async def async_start(self, create_ui: Callable=lambda: None, frame_interval: float = None):
+        '''
+        Ca start(), dar bucla de randare e o corutina: intre cadre cedeaza controlul event loop-ului asyncio (socket-uri, subprocese etc. pe acelasi fir),
+        iar callback-urile widget-urilor / Redux pot intoarce corutine, care ruleaza ca task-uri in acest loop (vezi spawn()).
+        :param frame_interval: durata tinta a unui cadru (secunde); restul pana la ea e timp dat event loop-ului (macar un sleep(0) per cadru);
+            None = dupa target_fps de la create_app (sau 1/60, daca nu e dat); repausul (idle_fps) functioneaza ca la start()
+        '''
+        if not self.running_:
+            self.running_ = True
+            self.async_loop_ = asyncio.get_running_loop()
+            self.async_wake_ = asyncio.Event()
+            if frame_interval is None and self.configurator_.target_fps is None:
+                frame_interval = 1.0 / 60.0
+            try:
+                self.__open(create_ui)
+                while self.running_ and dpg.is_dearpygui_running():
+                    wall_t0_, cpu_t0_ = time.perf_counter(), time.process_time()
+                    self._step_frame()
+                    delay_, idle_ = self.__frame_delay(wall_t0_, frame_interval)
+                    t0_ = time.perf_counter()
+                    if idle_ and delay_ > 0:
+                        self.async_wake_.clear()
+                        try:
+                            await asyncio.wait_for(self.async_wake_.wait(), delay_)
+                        except asyncio.TimeoutError:
+                            pass
+                    else:
+                        await asyncio.sleep(delay_)
+                    self.__account_frame(wall_t0_, cpu_t0_, time.perf_counter() - t0_, idle_)
+            finally:
+                # si la exceptie (inclusiv din create_ui) sau la anularea corutinei: contextul dpg si firele de fundal nu trebuie sa ramana deschise
+                for task_ in list(self.async_tasks_):
+                    task_.cancel()
+                self.async_loop_ = None
+                self.async_wake_ = None
+                self.running_ = False
+                self.__close()
+
+    def run_async(self, create_ui: Callable=lambda: None, frame_interval: float = None):
+        asyncio.run(self.async_start(create_ui, frame_interval)) # pentru cand aplicatia nu are deja un event loop al ei
+
+    def spawn(self, awaitable):
+        '''
+        Ruleaza awaitable ca task in event loop-ul lui async_start (pe firul de randare, intre cadre, deci poate atinge UI-ul).
+        '''
+        if self.async_loop_ is None:
+            raise Exception(f"ERROR: EasyDPGApp: spawn: awaitables can only be scheduled while the app runs through async_start()/run_async(), got {awaitable}")
+        task_ = asyncio.ensure_future(awaitable, loop=self.async_loop_)
+        self.async_tasks_.add(task_) # referinta tare, altfel task-ul poate fi colectat inainte sa termine
+        task_.add_done_callback(self.__async_task_done)
+        return task_
+
+    def spawn_if_awaitable(self, result):
+        return self.spawn(result) if inspect.isawaitable(result) else result
+
+    def __async_task_done(self, task: asyncio.Task):
+        self.async_tasks_.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            _LOG_EVENTS.error("EasyDPGApp: async task %s failed: %s", task, task.exception())
+
+    def __open(self, create_ui: Callable):
+        dpg.create_context()
+        reset_item_caches()
+        self._install_controller_listeners()
+        with EasyDPGWrapperPrimaryPanel.build(background_color_hue_or_rgb_and_or_alpha=self.configurator_.background_color) as w:
+            #w.set_movable() # just for DEBUGGING purposes...
+            #w.set_resizable()
+            self.root_tag_ = w.tag()
+            create_ui()
+
+        fs_width_, fs_height_ = get_fullscreen_dimensions()
+        size = [None, None]
+        if self.configurator_.size is None:
+            size = [fs_width_, fs_height_]
+        size[0] = int(self.configurator_.size[0]) if type(self.configurator_.size[0]) is int or (type(self.configurator_.size[0]) is float and self.configurator_.size[0] > 1.0) else (float(int(self.configurator_.size[0].strip()[:-1]) / 100.0) if type(self.configurator_.size[0]) is str and '%' in self.configurator_.size[0] else (self.configurator_.size[0] if type(self.configurator_.size[0]) is float else None))
+        if size[0] is None:
+            raise Exception(f"EasyDPGApp: invalid size[0] (width) given: {size[0]}. Should be [0,1] float, or an absolute integer or a % specified percentage (as str) !")
+        size[1] = int(self.configurator_.size[1]) if type(self.configurator_.size[1]) is int or (type(self.configurator_.size[1]) is float and self.configurator_.size[1] > 1.0) else (float(int(self.configurator_.size[1].strip()[:-1]) / 100.0) if type(self.configurator_.size[1]) is str and '%' in self.configurator_.size[1] else (self.configurator_.size[1] if type(self.configurator_.size[1]) is float else None))
+        if size[1] is None:
+            raise Exception(f"EasyDPGApp: invalid size[1] (height) given: {size[1]}. Should be [0,1] float, or an absolute integer or a % specified percentage (as str) !")
+
+        size[0] = self.configurator_.size[0] if type(self.configurator_.size[0]) is int else int(fs_width_ * size[0])
+        size[1] = self.configurator_.size[1] if type(self.configurator_.size[1]) is int else int(fs_height_ * size[1])
+
+        size = tuple(size)            
+        pos = self.configurator_.pos if self.configurator_.pos is not None else (int((fs_width_ - size[0]) / 2), int((fs_height_ - size[1]) / 2))
+
+        dpg.create_viewport(decorated=not(self.configurator_.fullscreen is not None and self.configurator_.fullscreen), always_on_top=self.configurator_.fullscreen is not None and self.configurator_.fullscreen, y_pos=pos[1], x_pos=pos[0], width=size[0], height=size[1])
+        #dpg.create_viewport(y_pos=pos[1], x_pos=pos[0])
+        dpg.setup_dearpygui()
+
+        # @TODO se poate face un switch la constructor prin care sa poti activa chestii de depanare (si poate sa obligi cumva fereastra principala sa fie 'mutabila' ca altfel nu te poti uita la panourile astea de depanare...
+        #dpg.show_item_registry() # for DEBUGGING purposes
+
+        dpg.set_viewport_resize_callback(callback=self.__viewport_resized)
+
+        dpg.show_viewport()
+
+    def _step_frame(self, render: bool = True):
+        '''
+        Un singur cadru al buclei din start()/async_start(): timere, listenerii pre-render (mouse amanat, coada UI, Redux, lucrul de fundal),
+        randarea, listenerii post-render si marimea amanata a panoului radacina.
+        :param render: False sare doar peste dpg.render_dearpygui_frame() (rulare fara viewport, ex. benchmarks/); restul cadrului e acelasi
+        '''
+        if self.profiler_ is not None:
+            self.profiler_.end_frame()
+            self.profiler_.begin_frame()
+        if self.wake_.is_set():
+            self.wake_.clear() # ce se cere de acum incolo (inclusiv din acest cadru) trezeste bucla pentru cadrul urmator
+            self.frames_since_activity_ = 0
+        else:
+            self.frames_since_activity_ += 1
+        self.__run_due_timers()
+        self.__dispatch_pre_render_event() # calculele grele se pot muta in fundal cu register_pre/post_render_listener(..., background=True), ca firul de randare sa nu fie impiedicat de nimeni; ce atinge UI-ul ramane aici
+        if render:
+            self.render_frame()
+        else:
+            self.rendered_frames_ += 1
+            _forget_rect_size()
+        self.__dispatch_post_render_event()
+        # in timpul tragerii de fereastra, marimea panoului radacina se aplica cel mult o data la resize_throttle_ms (doar ultima marime conteaza)
+        if self.updated_viewport_width_ is not None and (time.perf_counter() - self.last_root_resize_applied_) * 1000.0 >= self.configurator_.resize_throttle_ms:# or self.updated_viewport_height_ is not None:
+            EasyDPGWrapperPrimaryPanel(self.root_tag_).set_width(self.updated_viewport_width_)
+            EasyDPGWrapperPrimaryPanel(self.root_tag_).set_height(self.updated_viewport_height_)
+            self.invalidate_mouse_regions()
+            self.updated_viewport_width_ = None
+            self.updated_viewport_height_ = None
+            self.last_root_resize_applied_ = time.perf_counter()
+
+    def __close(self):
+        if self.profiler_ is not None:
+            self.profiler_.end_frame()
+        self.__shutdown_background()
+        dpg.destroy_context()
+        reset_item_caches()
+
+    def render_frame(self):
+        if self.profiler_ is not None:
+            t0_ = time.perf_counter()
+            dpg.render_dearpygui_frame()
+            self.profiler_.add_time("dpg_render", time.perf_counter() - t0_)
+            self.profiler_.count("render_frame_calls")
+        else:
+            dpg.render_dearpygui_frame()
+        self.rendered_frames_ += 1
+        _forget_rect_size()
+
+    def profiler(self) -> Union[FrameProfiler, None]: return self.profiler_
+    def redux_scheduler(self) -> _ReduxUpdateScheduler: return self.redux_scheduler_
+
+    def show_profiler_overlay(self, refresh_every_frames: int = 30):
+        '''
+        Afiseaza (in aplicatie) un panou cu sumarul profiler-ului (percentile), reimprospatat la fiecare refresh_every_frames cadre;
+        necesita create_app(profile=True). Se poate apela doar dupa start (contextul dpg trebuie sa existe).
+        '''
+        if self.profiler_ is None:
+            _LOG_EVENTS.warning("EasyDPGApp: show_profiler_overlay: the profiler is disabled, use create_app(profile=True) to enable it")
+            return self
+        if self.profiler_overlay_ is not None:
+            return self
+        window_ = dpg.add_window(label="EasyDPG profiler", width=520, height=300, pos=(10, 10))
+        text_ = dpg.add_text("", parent=window_)
+        self.profiler_overlay_ = window_
+
+        def _refresh():
+            if self.rendered_frames_ % max(1, refresh_every_frames) == 0 and dpg.does_item_exist(text_):
+                pacing_ = self.pacing_stats()
+                dpg.set_value(text_, self.profiler_.format_summary() + f"\npacing: {pacing_['idle_frames']}/{pacing_['frames']} idle frames, slept {pacing_['slept_s']:.1f}s, "
+                                                                       f"{pacing_['cpu_ms_per_frame']:.2f} ms CPU/frame, ~{pacing_['estimated_cpu_saved_s']:.1f}s CPU saved")
+        self.register_post_render_listener(_refresh)
+        return self
+    def rendered_frames(self): return self.rendered_frames_
 
     def root_tag(self): return self.root_tag_
+    def _set_root_tag(self, tag: Union[int, str]): self.root_tag_ = tag # in mod normal il seteaza start(); pentru rularea fara viewport (_step_frame(render=False))
 
     def _install_controller_listeners(self):
         # Assuming dpg functions to attach these handlers
@@ -319,11 +1291,147 @@ class EasyDPGApp:
             dpg.add_mouse_move_handler(callback=lambda sender, app_data: self.__dispatch_mouse_move(app_data[0], app_data[1]))
             dpg.add_mouse_click_handler(callback=lambda sender, app_data: self.__dispatch_mouse_press("l" if app_data == 0 else ("r" if app_data == 1 else "m")))
             dpg.add_key_release_handler(callback=lambda sender, app_data: self.__dispatch_keyboard_press(app_data))
+            # doar pentru trezirea buclei din repaus (idle_fps)
+            dpg.add_key_press_handler(callback=lambda sender, app_data: self.request_frame())
+            dpg.add_mouse_wheel_handler(callback=lambda sender, app_data: self.request_frame())
 
     def stop(self):
         self.running_ = False
 
 
+_DFS_LABEL_GAP = 1024 # spatiul lasat intre doua etichete entry/exit consecutive, ca sa putem insera subarbori noi fara sa renumerotam tot pomul
+
+class _DFSTreeIndex:
+    '''
+    Indexul DFS al arborelui dpg (adancimi, copii, parinti si intervale entry/exit), intretinut incremental:
+    la o modificare de structura se re-scaneaza (prin dpg) doar subarborele atins, restul pomului ramane neatins.
+    Intervalele entry/exit sunt etichete rare (cu goluri intre ele), deci un subarbore re-scanat se renumeroteaza
+    in interiorul propriului interval; doar daca nu mai e loc urcam la primul stramos care are destul loc.
+    '''
+
+    def __init__(self, children_provider: Callable[[Union[str, int]], List[Union[str, int]]] = lambda tag: dpg.get_item_children(tag, 1)):
+        self.children_provider_ = children_provider
+
+        self.root_ = None
+        self.entry_index_: Dict[Union[str, int], int] = {}
+        self.exit_index_: Dict[Union[str, int], int] = {}
+        self.depths_: Dict[Union[str, int], int] = {}
+        self.children_: Dict[Union[str, int], List[Union[str, int]]] = {}
+        self.parents_: Dict[Union[str, int], Union[str, int, None]] = {}
+
+    def is_built(self): return self.root_ is not None
+    def root(self): return self.root_
+    def __contains__(self, tag): return tag in self.depths_
+    def __len__(self): return len(self.depths_)
+    def nodes(self): return self.depths_.keys()
+    def depth(self, tag): return self.depths_[tag]
+    def parent(self, tag): return self.parents_[tag]
+    def children_count(self, tag): return len(self.children_[tag])
+
+    def is_ancestor(self, ancestor_tag, tag):
+        return self.entry_index_[ancestor_tag] <= self.entry_index_[tag] and self.exit_index_[tag] <= self.exit_index_[ancestor_tag]
+
+    def build(self, root_tag):
+        '''
+        Construieste indexul de la zero (parcurgere DFS completa prin dpg).
+        :return: multimea tag-urilor descoperite
+        '''
+        self.root_ = root_tag
+        self.entry_index_, self.exit_index_, self.depths_, self.children_, self.parents_ = {}, {}, {}, {}, {}
+
+        scanned_ = self.__scan(root_tag, parent=None, depth=0)
+        self.__label(root_tag, 0, len(scanned_) * _DFS_LABEL_GAP, len(scanned_))
+        return set(scanned_)
+
+    def rescan(self, tags):
+        '''
+        Re-scaneaza (prin dpg) doar subarborii nodurilor date si corecteaza pe loc adancimile si intervalele entry/exit.
+        Nodurile care sunt descendenti ai altor noduri din lista sunt ignorate (sunt oricum acoperite de stramos).
+        :return: (added, removed) - multimile de tag-uri aparute, respectiv disparute
+        '''
+        tags_ = sorted(set(t for t in tags if t in self.depths_), key=lambda t: self.depths_[t])
+        roots_ = []
+        for tag in tags_:
+            if not any(self.is_ancestor(r, tag) for r in roots_):
+                roots_.append(tag)
+
+        # intai uitam TOATE subarborii vechi, abia apoi scanam: un nod mutat dintr-un subarbore in altul (ex. de la un parinte adanc
+        # la unul mai putin adanc, scanat primul) ar fi altfel re-adaugat de o scanare si apoi sters de uitarea subarborelui sau vechi
+        old_ = set()
+        for tag in roots_:
+            stale_ = self.__subtree(tag)
+            old_.update(stale_)
+            for node_tag in stale_[1:]:
+                self.__forget(node_tag)
+
+        new_ = set()
+        for tag in roots_:
+            scanned_ = self.__scan(tag, parent=self.parents_[tag], depth=self.depths_[tag])
+            self.__relabel_with_room(tag, len(scanned_))
+            new_.update(scanned_)
+        return new_ - old_, old_ - new_
+
+    def __scan(self, tag, parent, depth):
+        scanned_ = []
+        def dfs_scan(node_tag, parent_tag, node_depth):
+            self.parents_[node_tag] = parent_tag
+            self.depths_[node_tag] = node_depth
+            children_ = list(self.children_provider_(node_tag))
+            self.children_[node_tag] = children_
+            scanned_.append(node_tag)
+            for child in children_:
+                dfs_scan(child, node_tag, node_depth + 1)
+
+        dfs_scan(tag, parent, depth)
+        return scanned_
+
+    def __subtree(self, tag):
+        result_ = []
+        def dfs_collect(node_tag):
+            result_.append(node_tag)
+            for child in self.children_[node_tag]:
+                dfs_collect(child)
+
+        dfs_collect(tag)
+        return result_
+
+    def __forget(self, tag):
+        for struct_ in (self.entry_index_, self.exit_index_, self.depths_, self.children_, self.parents_):
+            struct_.pop(tag, None)
+
+    def __label(self, tag, lo, hi, count):
+        # intervalul [lo, hi) e impartit egal intre cele count noduri ale subarborelui; nodul tag isi pastreaza tot intervalul
+        step_ = (hi - lo) // count
+        index = 0
+
+        def dfs_label(node_tag):
+            nonlocal index
+            self.entry_index_[node_tag] = lo + index * step_
+            index += 1
+            for child in self.children_[node_tag]:
+                dfs_label(child)
+            self.exit_index_[node_tag] = lo + index * step_
+
+        dfs_label(tag)
+        self.entry_index_[tag] = lo
+        self.exit_index_[tag] = hi
+
+    def __relabel_with_room(self, tag, count):
+        # urcam din stramos in stramos pana gasim un interval in care incape subarborele; la radacina, renumerotam tot cu goluri noi
+        node_tag = tag
+        while node_tag != self.root_:
+            if self.exit_index_[node_tag] - self.entry_index_[node_tag] >= count:
+                self.__label(node_tag, self.entry_index_[node_tag], self.exit_index_[node_tag], count)
+                return
+            node_tag = self.parents_[node_tag]
+            count = len(self.__subtree(node_tag))
+
+        count = len(self.__subtree(self.root_))
+        self.__label(self.root_, 0, max(self.exit_index_[self.root_], count * _DFS_LABEL_GAP), count)
+
+
+_RESIZE_STATS_HISTORY = 256 # cate evenimente de redimensionare pastram in statistica frames_per_resize
+
 class _LayoutManagerController:
 
     def __init__(self):
@@ -331,50 +1439,63 @@ class _LayoutManagerController:
         self.app_.register_pre_render_listener(self.__do_pre_render_operations)
         self.app_.register_post_render_listener(self.__do_post_render_operations)
 
-        self.entry_index_ = None
-        self.exit_index_ = None
-        self.dfs_nodes_depth_ = None
-        self.dfs_nodes_children_count_: Dict[Union[str, int], int] = None
+        self.tree_index_ = _DFSTreeIndex()
+        self.resize_handled_lms_ = set()
+        self.geometry_ctrls_: Dict[Union[str, int], _EasyDPGWrapperPositionController] = {} # tinute in viata aici, altfel dispar din _WRAPPER_CACHE (slab) intre cadre
         self.lms_: Dict[Union[str, int], Dict[str, Any]] = {}
         self.resized_lms_: Dict[Union[str, int], bool] = {}
 
         self.first_postrender_run_ = True
+        self.frames_per_resize_ = deque(maxlen=_RESIZE_STATS_HISTORY)
+        self.resize_started_frame_ = None # cadrul in care s-a observat redimensionarea in curs (pentru frames_per_resize)
+        self.fast_layout_pending_ = False # s-au facut treceri rapide (in timpul redimensionarii), urmeaza o rezolvare completa cand se stabilizeaza
 
     def is_lm_registered(self, tag): return tag in self.lms_.keys()
 
     def _register_lm(self, lm_instance: '_EasyDPGLayoutManagerBase'):
-        print(f'inregistrez lm _EasyDPGLayoutManagerBase cu tag {lm_instance.tag()} : {lm_instance}')
+        _LOG_LAYOUT.debug("inregistrez lm _EasyDPGLayoutManagerBase cu tag %s : %s", lm_instance.tag(), lm_instance)
         self.lms_[lm_instance.tag()] = {
             "instance": lm_instance
         }
     def _deregister_lm(self, lm_instance):
-        del self.lms_[lm_instance.tag()]
-
-    def __apply_lm_recalculate_results(self, lm_tag, results: LMRecalculateResult):
+        self.lms_.pop(lm_instance.tag(), None) # poate fi deja scos, daca elementul a disparut din pom (vezi pre-render)
 
+    def __apply_lm_recalculate_results(self, lm_tag, results: LMRecalculateResult, geometry_batch: List[Dict[str, Any]], fast: bool = False):
+        '''
+        Calculeaza geometria finala a copiilor unui LM si o adauga in geometry_batch (nu scrie nimic in dpg, scrierea se face in lot, la final).
+        :param fast: trecerea rapida (in timpul redimensionarii): copiii care nu sunt LM-uri primesc direct celula alocata, fara min/max/scale/justify/padding
+            si fara citiri de marime reala din dpg; geometria exacta vine la rezolvarea completa, dupa stabilizare
+        :return: dimensiunile (width, height) alocate copiilor care sunt la randul lor LM-uri
+        '''
+        child_lm_sizes_ = {}
         for child_tag in dpg.get_item_children(lm_tag, 1):
             if child_tag not in results:
-                print(f"INFO: {child_tag} of type {dpg.get_item_type(child_tag)} was not allocated by the LayoutManager of tag {lm_tag} !")
+                if _LOG_LAYOUT.debug_enabled:
+                    _LOG_LAYOUT.debug("%s of type %s was not allocated by the LayoutManager of tag %s !", child_tag, _get_simplified_type(child_tag), lm_tag)
                 continue
 
             if self.is_lm_registered(child_tag):
-                _EasyDPGWrapperFullGeometryController(child_tag).set_pos_x(results[child_tag]['pos_x']).set_pos_y(
-                    results[child_tag]['pos_y']).set_width(results[child_tag]['width']).set_height(
-                    results[child_tag]['height'])
+                geometry_batch.append({"tag": child_tag, "pos_x": results[child_tag]['pos_x'], "pos_y": results[child_tag]['pos_y'],
+                                       "width": results[child_tag]['width'], "height": results[child_tag]['height']})
+                child_lm_sizes_[child_tag] = (results[child_tag]['width'], results[child_tag]['height'])
+            elif fast:
+                size_manageable_ = _has_capability(child_tag, _CAP_GEOMETRY_SIZE_MANAGEABLE)
+                geometry_batch.append({"tag": child_tag, "pos_x": results[child_tag]['pos_x'], "pos_y": results[child_tag]['pos_y'],
+                                       "width": results[child_tag]['width'] if size_manageable_ else None, "height": results[child_tag]['height'] if size_manageable_ else None})
             else:  # aici e logica preferentiala per camp
-                child_meta_ = EasyDPGWrapper(child_tag)
-                min_x_ = child_meta_.min_x()
-                min_y_ = child_meta_.min_y()
-                max_x_ = child_meta_.max_x()
-                max_y_ = child_meta_.max_y()
-                padding_left = child_meta_.padding_left()
-                padding_right = child_meta_.padding_right()
-                padding_top = child_meta_.padding_top()
-                padding_bottom = child_meta_.padding_bottom()
-                scale_x_ = child_meta_.scale_x()
-                scale_y_ = child_meta_.scale_y()
-                justify_x_ = child_meta_.justify_x()
-                justify_y_ = child_meta_.justify_y()
+                child_meta_ = _layout_meta_for(child_tag)
+                min_x_ = child_meta_.min_x
+                min_y_ = child_meta_.min_y
+                max_x_ = child_meta_.max_x
+                max_y_ = child_meta_.max_y
+                padding_left = child_meta_.padding_left
+                padding_right = child_meta_.padding_right
+                padding_top = child_meta_.padding_top
+                padding_bottom = child_meta_.padding_bottom
+                scale_x_ = child_meta_.scale_x
+                scale_y_ = child_meta_.scale_y
+                justify_x_ = child_meta_.justify_x
+                justify_y_ = child_meta_.justify_y
                 container_width_ = results[child_tag]['width']
                 container_height_ = results[child_tag]['height']
                 container_px_ = results[child_tag]['pos_x']
@@ -385,175 +1506,251 @@ class _LayoutManagerController:
                 final_width_ = min(max_x_ if max_x_ > 0 else 10000000, max(min_x_ if min_x_ > 0 else 0, temp_width_))
                 final_height_ = min(max_y_ if max_y_ > 0 else 10000000, max(min_y_ if min_y_ > 0 else 0, temp_height_))
 
-                try:
-                    print(f"{child_tag}: old f width si height {final_width_} {final_height_}")
-                    size_ctrl_ = _EasyDPGWrapperSizeController(child_tag)
-                    size_ctrl_.set_width(final_width_).set_height(final_height_)
-                except:
-                    pass
-
-                try:
-                    final_width_ = dpg.get_item_rect_size(child_tag)[0] # incercam sa le mai luam o data (la mvtext nu merge de asta try:except:) pentru ca intre a seta si a se aplica identic e o diferenta
-                    final_height_ = dpg.get_item_rect_size(child_tag)[1]
-                except:
-                    pass
+                size_manageable_ = _has_capability(child_tag, _CAP_GEOMETRY_SIZE_MANAGEABLE)
+                if not size_manageable_:
+                    try:
+                        final_width_, final_height_ = _rect_size(child_tag) # la elementele fara marime gestionabila (ex. mvtext) justificam dupa marimea lor reala
+                    except:
+                        pass
 
                 final_pos_x = container_px_ + (abs(final_width_ - container_width_) / 2 if justify_x_ == 0 else (
                     padding_left if justify_x_ < 0 else container_width_ - final_width_ - padding_right))
                 final_pos_y = container_py_ + (abs(final_height_ - container_height_) / 2 if justify_y_ == 0 else (
                     padding_top if justify_y_ < 0 else container_height_ - final_height_ - padding_bottom))
 
-                _EasyDPGWrapperPositionController(child_tag).set_pos_x(final_pos_x).set_pos_y(final_pos_y)
+                geometry_batch.append({"tag": child_tag, "pos_x": final_pos_x, "pos_y": final_pos_y,
+                                       "width": final_width_ if size_manageable_ else None, "height": final_height_ if size_manageable_ else None})
+
+        return child_lm_sizes_
+
+    def __geometry_ctrl(self, tag, size_manageable: bool):
+        ctrl_ = self.geometry_ctrls_.get(tag)
+        if ctrl_ is None or (size_manageable and not isinstance(ctrl_, _EasyDPGWrapperSizeController)):
+            ctrl_ = _cached_wrapper(_EasyDPGWrapperFullGeometryController if size_manageable else _EasyDPGWrapperPositionController, tag)
+            self.geometry_ctrls_[tag] = ctrl_
+        return ctrl_
+
+    def __flush_geometry_batch(self, geometry_batch: List[Dict[str, Any]]):
+        # o singura scriere per element (ultima geometrie calculata castiga), iar scrierile identice cu cele precedente se sar
+        final_geometry_ = {geometry_['tag']: geometry_ for geometry_ in geometry_batch}
+        for tag, geometry_ in final_geometry_.items():
+            if geometry_['width'] is not None:
+                try:
+                    #print(f"{tag}: f width si height {geometry_['width']} {geometry_['height']}")
+                    self.__geometry_ctrl(tag, size_manageable=True).set_geometry(geometry_['pos_x'], geometry_['pos_y'], geometry_['width'], geometry_['height'], skip_unchanged=True)
+                    continue
+                except:
+                    pass
+            self.__geometry_ctrl(tag, size_manageable=False).set_pos(geometry_['pos_x'], geometry_['pos_y'], skip_unchanged=True)
+
+    def __solve_layout(self, lm_tags, fast: bool = False):
+        '''
+        Rezolva geometria finala a ierarhiei de LM-uri de sus in jos, intr-o singura trecere, fara render_frame intermediare:
+        marimea unui LM descendent vine din LMRecalculateResult-ul parintelui, nu din get_item_rect_size dupa o randare.
+        Toate scrierile de geometrie se aplica la final, intr-un singur lot, inainte de urmatorul cadru real.
+        :param fast: doar trecerea proportionala a LM-urilor, vezi __apply_lm_recalculate_results
+        '''
+        profiler_ = self.app_.profiler()
+        t0_ = time.perf_counter() if profiler_ is not None else None
+
+        queue_ = [(self.tree_index_.depth(tag), i, tag) for i, tag in enumerate(lm_tags) if tag in self.tree_index_]
+        heapq.heapify(queue_)
+        counter_ = len(queue_)
+
+        known_sizes_ = {}
+        solved_ = set()
+        geometry_batch_ = []
+        while len(queue_) > 0:
+            # consumam coada nivel cu nivel (toate LM-urile de aceeasi adancime), ca sa le putem rezolva si in lot
+            depth_ = queue_[0][0]
+            level_ = []
+            while len(queue_) > 0 and queue_[0][0] == depth_:
+                _, _, lm_tag_ = heapq.heappop(queue_)
+                if lm_tag_ not in solved_ and self.is_lm_registered(lm_tag_):
+                    solved_.add(lm_tag_)
+                    level_.append(lm_tag_)
+
+            sizes_ = {}
+            for lm_tag_ in level_:
+                width_, height_ = known_sizes_[lm_tag_] if lm_tag_ in known_sizes_ else _rect_size(lm_tag_)
+                sizes_[lm_tag_] = (width_, height_)
+                self.lms_[lm_tag_]['solved_size_'] = (width_, height_)
+
+            for lm_tag_, results_ in self.__recalculate_level(level_, sizes_).items():
+                child_lm_sizes_ = self.__apply_lm_recalculate_results(lm_tag_, results_, geometry_batch_, fast)
+                for child_tag, size_ in child_lm_sizes_.items():
+                    known_sizes_[child_tag] = size_
+                    heapq.heappush(queue_, (depth_ + 1, counter_, child_tag)) # LM-ul descendent trebuie rezolvat si el, cu noua marime
+                    counter_ += 1
+
+        self.__flush_geometry_batch(geometry_batch_)
+        self.app_.invalidate_mouse_regions()
+        if profiler_ is not None:
+            profiler_.add_time("layout:solve_fast" if fast else "layout:solve", time.perf_counter() - t0_)
+            profiler_.count("lm_recalculations", len(solved_))
+
+    def __recalculate_level(self, lm_tags, sizes) -> Dict[Union[str, int], LMRecalculateResult]:
+        # in modul batch_layout_solve, LM-urile proportionale de pe acelasi nivel se rezolva impreuna (vectorizat, daca e numpy); restul, unul cate unul
+        results_ = {}
+        batch_tags_ = []
+        for lm_tag_ in lm_tags:
+            lm_: _EasyDPGLayoutManagerBase = self.lms_[lm_tag_]['instance']
+            if self.app_.configurator_.batch_layout_solve and hasattr(lm_, 'proportional_job'):
+                batch_tags_.append(lm_tag_)
+            else:
+                results_[lm_tag_] = lm_.recalculate(*sizes[lm_tag_])
 
-                self.app_.render_frame()
+        if len(batch_tags_) > 0:
+            jobs_ = [self.lms_[lm_tag_]['instance'].proportional_job(*sizes[lm_tag_]) for lm_tag_ in batch_tags_]
+            for lm_tag_, lm_results_ in zip(batch_tags_, _EasyDPGLayoutManagerBase.compute_proportional_adjuster_parts_batch(jobs_)):
+                results_[lm_tag_] = lm_results_
+        return results_
 
+    def frames_per_resize(self) -> List[int]:
+        '''
+        Pentru fiecare redimensionare procesata (ultimele _RESIZE_STATS_HISTORY), cate cadre s-au randat de la cadrul care a expus-o
+        pana la primul cadru dupa care nici un LM nu a mai fost redimensionat (layout-ul s-a stabilizat); minimul e 1.
+        '''
+        return list(self.frames_per_resize_)
 
     def __do_post_render_operations(self):
 
-        # (e nevoie de) o prima recalculare LM-uri, la inceput
+        # (e nevoie de) o prima rezolvare a tuturor LM-urilor, la inceput
         if self.first_postrender_run_:
-            #import pdb; pdb.set_trace()
-            processing_queue_ = sorted([[tag, self.dfs_nodes_depth_[tag]] for tag in self.lms_.keys()],
-                                       key=lambda x: x[1], reverse=False)
-            for lm_meta_ in processing_queue_:
-                instance_: _EasyDPGLayoutManagerBase = self.lms_[lm_meta_[0]]['instance']
-                self.__apply_lm_recalculate_results(instance_.tag(), instance_.recalculate())
-                print("render frame")
-                self.app_.render_frame()
-
+            self.__solve_layout(list(self.lms_.keys()))
             self.first_postrender_run_ = False
 
-        while True:
+        # detectie redimensionare - inregistrare LM-uri 'atinse'; ignoram LM-urile care au exact marimea calculata de noi (e doar layout-ul nostru care s-a aplicat)
+        for lm_tag in self.lms_.keys():
+            width_, height_ = _rect_size(lm_tag)
+            if (height_ != self.lms_[lm_tag]['pre_height_'] or width_ != self.lms_[lm_tag]['pre_width_']) and \
+                    (width_, height_) != self.lms_[lm_tag].get('solved_size_'):
+                self.__add_resized_lm(lm_tag)
+
+        # procesare Lm-uri 'atinse'
+        if len(self.resized_lms_.keys()) > 0: # aici e toata treaba
+            if self.resize_started_frame_ is None:
+                self.resize_started_frame_ = self.app_.rendered_frames()
 
-            # detectie redimensionare - inregistrare LM-uri 'atinse'
             for lm_tag in self.lms_.keys():
-                if dpg.get_item_rect_size(lm_tag)[1] != self.lms_[lm_tag]['pre_height_'] or \
-                        dpg.get_item_rect_size(lm_tag)[0] != self.lms_[lm_tag]['pre_width_']:
-                    self.__add_resized_lm(lm_tag)
-
-            # procesare Lm-uri 'atinse'
-            if len(self.resized_lms_.keys()) > 0: # aici e toata treaba
-
-                for lm_tag in self.lms_.keys():
-                    self.lms_[lm_tag]['pre_height_'] = dpg.get_item_rect_size(lm_tag)[1]
-                    self.lms_[lm_tag]['pre_width_'] = dpg.get_item_rect_size(lm_tag)[0]
-
-                if any([tag not in self.dfs_nodes_depth_ for tag in self.resized_lms_.keys()]):
-                    # postpone, internal data si not yet synced
-                    print(f"WARNING: _LayoutManagerController: __do_post_render_operations: resized_lms_ tags are not yet registered in the tree !")
-                else:
-                    # 1 sortez lista dupa adancime si o transform sa stochez si adancimea - devine o coada de consum
-                    processing_queue_ = sorted([[tag, self.dfs_nodes_depth_[tag]] for tag in self.resized_lms_.keys()], key=lambda x: x[1], reverse=False)
-
-                    # 2 consum coada nivel cu nivel, si apelez app_render_frame() numai daca e diferenta mai mult de 1 intre nivelul curent si cel urmator
-                    head_ = 0
-                    c_depth_ = processing_queue_[head_][1]
-                    while head_ < len(processing_queue_):
-                        i = head_
-                        while head_ < len(processing_queue_) and processing_queue_[head_][1] == c_depth_:
-                            # 2.1. get width/height pe nod LM
-                            lm_tag_ = processing_queue_[head_][0]
-                            lm_: _EasyDPGLayoutManagerBase = self.lms_[lm_tag_]['instance']
-                            # 2.2. recalculate pe nod LM
-                            self.__apply_lm_recalculate_results(lm_.tag(), lm_.recalculate())
-                            head_ += 1
-
-                        if head_ >= len(processing_queue_):
-                            print("render frame")
-                            self.app_.render_frame()
-                            break
-                        if abs(c_depth_ - processing_queue_[head_][1]) > 1:
-                            print("render frame")
-                            self.app_.render_frame()
-                        c_depth_ = processing_queue_[head_][1]
-
-                    self.resized_lms_ = {}
+                self.lms_[lm_tag]['pre_width_'], self.lms_[lm_tag]['pre_height_'] = _rect_size(lm_tag)
+
+            if any([tag not in self.tree_index_ for tag in self.resized_lms_.keys()]):
+                # postpone, internal data si not yet synced
+                _LOG_LAYOUT.warning("_LayoutManagerController: __do_post_render_operations: resized_lms_ tags are not yet registered in the tree !")
             else:
-                break
+                fast_ = self.app_.is_resizing()
+                self.__solve_layout([tag for tag in self.resized_lms_.keys() if self.is_lm_registered(tag)], fast=fast_)
+                self.fast_layout_pending_ = self.fast_layout_pending_ or fast_
+                self.resized_lms_ = {}
+        elif self.resize_started_frame_ is not None and not self.fast_layout_pending_:
+            # cadrul randat cu layout-ul nostru nu a mai declansat nici o redimensionare: stabil
+            self.frames_per_resize_.append(self.app_.rendered_frames() - self.resize_started_frame_)
+            self.resize_started_frame_ = None
+
+        # redimensionarea s-a stabilizat: o singura rezolvare completa (min/max/justify etc.) peste tot ce s-a facut doar rapid
+        if self.fast_layout_pending_:
+            if self.app_.is_resizing():
+                self.app_.request_frame() # bucla nu are voie sa intre in repaus inainte de rezolvarea completa
+            else:
+                self.__solve_layout(list(self.lms_.keys()))
+                self.fast_layout_pending_ = False
 
     def __do_pre_render_operations(self):
 
-        # inregistrare dimensiuni inainte de randare (pentru detectie schimbari din partea mecanismului nativ dpg din render_frame)
-        for lm_tag in self.lms_.keys():
-            self.lms_[lm_tag]['pre_height_'] = dpg.get_item_rect_size(lm_tag)[1]
-            self.lms_[lm_tag]['pre_width_'] = dpg.get_item_rect_size(lm_tag)[0]
+        profiler_ = self.app_.profiler()
+        t0_ = time.perf_counter() if profiler_ is not None else None
 
         # la inceput, cream pomul DFS...
-        if self.dfs_nodes_depth_ is None:
-            self.__build_tree(build_children=True, build_depths=True, build_entry_exit_indexes=True) # pt prima oara (UI-ul e deja construit)
+        if not self.tree_index_.is_built():
+            self.tree_index_.build(self.app_.root_tag()) # pt prima oara (UI-ul e deja construit)
+            _STRUCTURE_CHANGED_TAGS.clear() # acoperite deja de constructia completa
+            self.__build_resize_callbacks()
+            if profiler_ is not None:
+                profiler_.count("tree_rebuilds")
+
+        # consumam modificarile de structura anuntate (build/delete/move prin EasyDPG) si re-scanam doar subarborii atinsi; un cadru fara modificari nu face nimic aici
+        changed_nodes_ = self.__consume_structure_changes()
+        if self.app_.configurator_.poll_structure_changes:
+            changed_nodes_ += self.__poll_structure_changes()
+
+        if len(changed_nodes_) > 0:
+            _LOG_TREE.debug("actualizam structurile (doar subarborii modificati): %s", changed_nodes_)
+            _, removed_ = self.tree_index_.rescan(changed_nodes_)
+            self.resize_handled_lms_ -= removed_
+            for tag in removed_:
+                self.geometry_ctrls_.pop(tag, None)
+                self.lms_.pop(tag, None) # LM-urile sterse nu mai participa la layout
+                self.resized_lms_.pop(tag, None)
+            _on_items_deleted(removed_) # si elementele sterse prin dpg brut, nu doar prin wrapper-e
             self.__build_resize_callbacks()
+            self.app_.invalidate_mouse_regions()
+            if profiler_ is not None:
+                profiler_.count("tree_rescans")
+
+        if profiler_ is not None:
+            profiler_.add_time("layout:tree_index", time.perf_counter() - t0_)
+
+        # inregistrare dimensiuni inainte de randare (pentru detectie schimbari din partea mecanismului nativ dpg din render_frame), dupa curatarea LM-urilor sterse
+        for lm_tag in self.lms_.keys(): # (din snapshot-ul cadrului precedent, deja citit la post-render: intre timp nu s-a mai randat nimic)
+            self.lms_[lm_tag]['pre_width_'], self.lms_[lm_tag]['pre_height_'] = _rect_size(lm_tag)
+
+    def __consume_structure_changes(self):
+        if len(_STRUCTURE_CHANGED_TAGS) <= 0:
+            return []
+        tags_ = list(_STRUCTURE_CHANGED_TAGS)
+        _STRUCTURE_CHANGED_TAGS.clear()
+
+        changed_nodes_ = []
+        for tag in tags_:
+            node_tag = self.__resolve_indexed_node(tag)
+            if node_tag is not None:
+                changed_nodes_.append(node_tag)
+        return changed_nodes_
+
+    def __resolve_indexed_node(self, tag):
+        # un container nou (inca neindexat) e acoperit de re-scanarea primului stramos indexat
+        node_tag = tag
+        while node_tag is not None and node_tag not in self.tree_index_:
+            node_tag = dpg.get_item_parent(node_tag) if dpg.does_item_exist(node_tag) else None
+        if node_tag is None:
+            return None
+        return node_tag if dpg.does_item_exist(node_tag) else self.__nearest_existing_ancestor(node_tag)
+
+    def __poll_structure_changes(self):
+        # fallback (poll_structure_changes=True): detectam descendenti noi/eliminati facuti prin apeluri dpg brute, comparand numarul de copii al fiecarui nod
+        changed_nodes_ = []
+        for node_tag in list(self.tree_index_.nodes()):
 
-        #import pdb; pdb.set_trace()
-        # detectam descendenti noi (structura modificata) pentru a recrea pomul DFS
-        for node_tag in self.dfs_nodes_children_count_.keys():
-            
             try:
                 child_count_ = len(dpg.get_item_children(node_tag, 1))
             except:
                 # node_tag does not exist (so children removed event)
-                print(f"eliminare descendent detectata: {node_tag}")
-                must_recompute_structs_ = True
-                break
-            
-            must_recompute_structs_ = False
-            #print(f'{node_tag}: (current) {child_count_} vs {self.dfs_nodes_children_count_[node_tag]} (stored)')
-            if child_count_ != self.dfs_nodes_children_count_[node_tag]:
-                print(f"descendent detectat: {node_tag}")
+                _LOG_TREE.debug("eliminare descendent detectata: %s", node_tag)
+                changed_nodes_.append(self.__nearest_existing_ancestor(node_tag))
+                continue
+
+            #print(f'{node_tag}: (current) {child_count_} vs {self.tree_index_.children_count(node_tag)} (stored)')
+            if child_count_ != self.tree_index_.children_count(node_tag):
+                _LOG_TREE.debug("descendent detectat: %s", node_tag)
                 # de sus in jos, avem un nod care si-a modificat numarul de copii
-                must_recompute_structs_ = True
-                break
-        if must_recompute_structs_:
-            print("refacem structurile fiindca s-au modificat..., recalculam ?!")
-            self.__build_tree(build_children=True, build_depths=True, build_entry_exit_indexes=True)  # @TODO erau bune actualizari selective, dar e treaba un pic mai complexa...
-            self.__build_resize_callbacks()
+                changed_nodes_.append(node_tag)
+        return changed_nodes_
+
+    def __nearest_existing_ancestor(self, tag):
+        node_tag = self.tree_index_.parent(tag)
+        while node_tag is not None and not dpg.does_item_exist(node_tag):
+            node_tag = self.tree_index_.parent(node_tag)
+        return node_tag if node_tag is not None else self.tree_index_.root()
 
     def __build_resize_callbacks(self):
         #print(f"adaugat callback-uri resized pt {self.lms_}")
         for lm_ in self.lms_.keys():
-            self.__register_resize_handler(lm_)
-
+            if lm_ not in self.resize_handled_lms_ and lm_ in self.tree_index_:
+                self.__register_resize_handler(lm_)
+                self.resize_handled_lms_.add(lm_)
 
-    def __build_tree(self, root_node=None, build_entry_exit_indexes=False, build_depths=False, build_children=False):
-        if root_node is None:
-            root_node = self.app_.root_tag()
-
-        # Inițializăm structurile pentru a stoca arborele și indecșii
-        if build_entry_exit_indexes:
-            self.entry_index_ = {}
-            self.exit_index_ = {}
-
-        if build_depths:
-            self.dfs_nodes_depth_ = {}
-
-        if build_children:
-            self.dfs_nodes_children_count_ = {}
-
-        index = 0
-
-        # Funcție pentru parcurgerea în adâncime și calculul indecșilor
-        def dfs_scan(node_tag, depth=0):
-            nonlocal index
-
-            if build_entry_exit_indexes:
-                self.entry_index_[node_tag] = index
-
-            if build_depths:
-                self.dfs_nodes_depth_[node_tag] = depth
-
-            children_ = dpg.get_item_children(node_tag, 1)
-            if build_children:
-                self.dfs_nodes_children_count_[node_tag] = len(children_)
-            # print([dpg.get_item_configuration(child) for child in children_])
-            index += 1
-            for child in children_:  # Accesăm copiii itemului
-                dfs_scan(child, depth + 1)
-
-            if build_entry_exit_indexes:
-                self.exit_index_[node_tag] = index
-
-        dfs_scan(root_node)
-
-    def __add_resized_lm(self, tag): print(f"adaug lm la resized-list: {tag}"); self.resized_lms_[tag] = True # ma intereseaza doar hash-ul, deci valoarea e dummy
+    def __add_resized_lm(self, tag): _LOG_LAYOUT.debug("adaug lm la resized-list: %s", tag); self.resized_lms_[tag] = True; self.app_.request_frame() # ma intereseaza doar hash-ul, deci valoarea e dummy; layout murdar = bucla nu intra in repaus
 
     def __register_resize_handler(self, tag):
         try:
@@ -564,7 +1761,7 @@ class _LayoutManagerController:
             dpg.bind_item_handler_registry(tag, f"{tag}-{id_}_resizer")
 
         except Exception as e:
-            print(f"ERROR: could not call dpg.item_handler_registry and .bind_item_handler_registry on tag {tag} but it should have worked: {str(e)}")
+            _LOG_LAYOUT.error("could not call dpg.item_handler_registry and .bind_item_handler_registry on tag %s but it should have worked: %s", tag, e)
 
 
 #####################################################
@@ -597,7 +1794,9 @@ def FACTORY(cls, *args, **kwargs):
 #####################################################
 
 ## PUBLIC METHOD
-def create_app(background_color: UniversalColor = (0.5,0.5,0.5,1.0), pos=None, size=["70%", "70%"], fullscreen=False):
+def create_app(background_color: UniversalColor = (0.5,0.5,0.5,1.0), pos=None, size=["70%", "70%"], fullscreen=False, poll_structure_changes=False, batch_layout_solve=False, profile=False, coalesce_redux_updates=False, coalesce_mouse_moves=False, ui_queue_budget_ms=4.0, background_workers=2, background_deadline_ms=2.0, target_fps=None, idle_fps=None, resize_throttle_ms=0.0, resize_settle_ms=None):
+    target_fps = _validated_fps(target_fps, "target_fps") # inainte de orice modificare a configurarii
+    idle_fps = _validated_fps(idle_fps, "idle_fps")
     #global _APP_BACKGROUND_COLOR
     if "_APP_BACKGROUND_COLOR" not in globals():
         globals()['_APP_BACKGROUND_COLOR'] = (0.5,0.5,0.5,0.5)
@@ -607,11 +1806,47 @@ def create_app(background_color: UniversalColor = (0.5,0.5,0.5,1.0), pos=None, s
         globals()['_APP_SIZE'] = ('100%', '100%')
     if "_APP_FULLSCREEN" not in globals():
         globals()['_APP_FULLSCREEN'] = False
+    if "_APP_POLL_STRUCTURE_CHANGES" not in globals():
+        globals()['_APP_POLL_STRUCTURE_CHANGES'] = False
+    if "_APP_BATCH_LAYOUT_SOLVE" not in globals():
+        globals()['_APP_BATCH_LAYOUT_SOLVE'] = False
+    if "_APP_PROFILE" not in globals():
+        globals()['_APP_PROFILE'] = False
+    if "_APP_COALESCE_REDUX_UPDATES" not in globals():
+        globals()['_APP_COALESCE_REDUX_UPDATES'] = False
+    if "_APP_COALESCE_MOUSE_MOVES" not in globals():
+        globals()['_APP_COALESCE_MOUSE_MOVES'] = False
+    if "_APP_UI_QUEUE_BUDGET_MS" not in globals():
+        globals()['_APP_UI_QUEUE_BUDGET_MS'] = 4.0
+    if "_APP_BACKGROUND_WORKERS" not in globals():
+        globals()['_APP_BACKGROUND_WORKERS'] = 2
+    if "_APP_BACKGROUND_DEADLINE_MS" not in globals():
+        globals()['_APP_BACKGROUND_DEADLINE_MS'] = 2.0
+    if "_APP_TARGET_FPS" not in globals():
+        globals()['_APP_TARGET_FPS'] = None
+    if "_APP_IDLE_FPS" not in globals():
+        globals()['_APP_IDLE_FPS'] = None
+    if "_APP_RESIZE_THROTTLE_MS" not in globals():
+        globals()['_APP_RESIZE_THROTTLE_MS'] = 0.0
+    if "_APP_RESIZE_SETTLE_MS" not in globals():
+        globals()['_APP_RESIZE_SETTLE_MS'] = None
 
     globals()['_APP_BACKGROUND_COLOR'] = background_color
     globals()['_APP_POS'] = tuple(pos) if pos is not None else None
     globals()['_APP_SIZE'] = tuple(size) if size is not None else None
     globals()['_APP_FULLSCREEN'] = fullscreen is True
+    globals()['_APP_POLL_STRUCTURE_CHANGES'] = poll_structure_changes is True
+    globals()['_APP_BATCH_LAYOUT_SOLVE'] = batch_layout_solve is True
+    globals()['_APP_PROFILE'] = profile is True
+    globals()['_APP_COALESCE_REDUX_UPDATES'] = coalesce_redux_updates is True
+    globals()['_APP_COALESCE_MOUSE_MOVES'] = coalesce_mouse_moves is True
+    globals()['_APP_UI_QUEUE_BUDGET_MS'] = float(ui_queue_budget_ms) if ui_queue_budget_ms is not None else None
+    globals()['_APP_BACKGROUND_WORKERS'] = int(background_workers)
+    globals()['_APP_BACKGROUND_DEADLINE_MS'] = float(background_deadline_ms)
+    globals()['_APP_TARGET_FPS'] = target_fps
+    globals()['_APP_IDLE_FPS'] = idle_fps
+    globals()['_APP_RESIZE_THROTTLE_MS'] = float(resize_throttle_ms)
+    globals()['_APP_RESIZE_SETTLE_MS'] = float(resize_settle_ms) if resize_settle_ms is not None else None
 
     return FACTORY(EasyDPGApp)
 #####################################################
@@ -619,25 +1854,42 @@ def create_app(background_color: UniversalColor = (0.5,0.5,0.5,1.0), pos=None, s
 class _EasyDPGWrapperContainer:
     def __init__(self, tag):
         self.tag_ = tag
-        _guard_incompatible_type(tag, _CONTEXT_MANAGEABLE_DPG_ITEMS)
+        _guard_incompatible_type(tag, _CAP_CONTEXT_MANAGEABLE)
 
     def __enter__(self):
         dpg.push_container_stack(self.tag_); return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None or exc_val is not None or exc_tb is not None:
-            print(f"ERROR: _EasyDPGWrapperContainer: exception on tag {self.tag_}, during managed context execution: {exc_type}: {exc_val}:\n{exc_tb}")
+            _LOG_WIDGETS.error("_EasyDPGWrapperContainer: exception on tag %s, during managed context execution: %s: %s:\n%s", self.tag_, exc_type, exc_val, exc_tb)
         dpg.pop_container_stack()
 
-    def delete(self): dpg.delete_item(self.tag_); return self
-    def delete_children(self): dpg.delete_item(self.tag_, children_only=True); return self
+    def delete(self):
+        parent_ = dpg.get_item_parent(self.tag_)
+        deleted_ = _collect_subtree_tags(self.tag_)
+        dpg.delete_item(self.tag_)
+        _on_items_deleted(deleted_)
+        notify_structure_changed(parent_)
+        return self
+    def delete_children(self):
+        deleted_ = _collect_subtree_tags(self.tag_, include_root=False)
+        dpg.delete_item(self.tag_, children_only=True)
+        _on_items_deleted(deleted_)
+        notify_structure_changed(self.tag_)
+        return self
 
-    def move_child_here(self, tag: Union[str, int]):
-        dpg.move_item(tag, parent=self.tag_)
+    def move_child_here(self, tag: Union[str, int], before: Union[str, int] = 0):
+        '''
+        :before copilul (al acestui container) inaintea caruia se muta tag; 0 (implicit) inseamna la final
+        '''
+        old_parent_ = dpg.get_item_parent(tag)
+        dpg.move_item(tag, parent=self.tag_, before=before)
+        notify_structure_changed(old_parent_)
+        notify_structure_changed(self.tag_)
 
 class _EasyDPGWrapperVisibility:
     def __init__(self, tag):
-        _guard_incompatible_type(tag, _VISIBILITY_DPG_ITEMS)
+        _guard_incompatible_type(tag, _CAP_VISIBILITY)
         self.tag_ = tag
 
     def is_visible(self): return dpg.is_item_visible(self.tag_); return self
@@ -652,12 +1904,52 @@ class _EasyDPGWrapperVisibility:
 
 class _EasyDPGWrapperSingleValueController:
     def __init__(self, tag):
-        _guard_incompatible_type(tag, _SINGLEVALUE_DPG_ITEMS)
+        _guard_incompatible_type(tag, _CAP_SINGLEVALUE)
         self.tag_ = tag
 
     def value(self): return dpg.get_value(self.tag_)
     def set_value(self, value): dpg.set_value(self.tag_, value); return self
 
+_WRITTEN_GEOMETRY: Dict[Union[str, int], Tuple[int, List[Any]]] = {} # tag -> (uuid, [pos_x, pos_y, width, height] scrise ultima data prin controllerele EasyDPG) (comun tuturor wrapper-elor aceluiasi tag)
+
+def _written_geometry_for(tag) -> List[Any]:
+    uuid_ = _item_uuid(tag)
+    entry_ = _WRITTEN_GEOMETRY.get(tag)
+    if entry_ is None or entry_[0] != uuid_: # alias refolosit de alt element: nimic scris inca pe el
+        entry_ = _WRITTEN_GEOMETRY[tag] = (uuid_, [None, None, None, None])
+    return entry_[1]
+
+_RECT_SIZE_SNAPSHOT: Dict[Union[str, int], Tuple[Any, Any]] = {} # tag -> rect size (width, height) citit o singura data per cadru; golit dupa fiecare randare reala
+
+def _rect_size(tag) -> Tuple[Any, Any]:
+    '''
+    get_item_rect_size servit din snapshot-ul cadrului curent: dpg il actualizeaza oricum doar la randare, deci il citim o data per tag si per cadru
+    '''
+    size_ = _RECT_SIZE_SNAPSHOT.get(tag)
+    if size_ is None:
+        width_, height_ = dpg.get_item_rect_size(tag)
+        size_ = _RECT_SIZE_SNAPSHOT[tag] = (width_, height_)
+    return size_
+
+def invalidate_geometry_snapshot(tag: AnyParent = None):
+    '''
+    Invalideaza geometria memorata pentru tag, sau pentru toate elementele daca tag e None: marimea citita in cadrul curent si ultima
+    geometrie scrisa prin EasyDPG (cu care layout-ul sare peste scrierile neschimbate). O apelezi manual dupa modificari de geometrie
+    prin dpg brut (set_item_pos, configure_item(width=...) etc.), altfel layout-ul poate crede ca elementul are inca geometria lui.
+    '''
+    _forget_rect_size(tag)
+    if tag is None:
+        _WRITTEN_GEOMETRY.clear()
+    else:
+        _WRITTEN_GEOMETRY.pop(tag if type(tag) in [int, str] else tag.tag(), None)
+
+def _forget_rect_size(tag: AnyParent = None):
+    # doar snapshot-ul cadrului (la fiecare randare si dupa scrierile de marime prin wrapper-e, care isi tin singure evidenta scrierilor)
+    if tag is None:
+        _RECT_SIZE_SNAPSHOT.clear()
+    else:
+        _RECT_SIZE_SNAPSHOT.pop(tag if type(tag) in [int, str] else tag.tag(), None)
+
 class _EasyDPGWrapperPositionController:
     def __init__(self, tag):
         #_guard_incompatible_type(tag, ) # all can be positioned
@@ -667,12 +1959,26 @@ class _EasyDPGWrapperPositionController:
         pos_ = dpg.get_item_pos(self.tag_)
         pos_[1] = pos_y
         dpg.set_item_pos(self.tag_, pos_)
+        _written_geometry_for(self.tag_)[0:2] = pos_
         return self
 
     def set_pos_x(self, pos_x: int):
         pos_ = dpg.get_item_pos(self.tag_)
         pos_[0] = pos_x
         dpg.set_item_pos(self.tag_, pos_)
+        _written_geometry_for(self.tag_)[0:2] = pos_
+        return self
+
+    def set_pos(self, pos_x: int, pos_y: int, skip_unchanged: bool = False):
+        '''
+        Seteaza ambele coordonate printr-un singur apel dpg (fara get_item_pos)
+        :skip_unchanged sare peste scriere daca pozitia e cea scrisa ultima data prin EasyDPG (pentru layout; o scriere prin dpg brut
+            nu se vede aici, vezi invalidate_geometry_snapshot)
+        '''
+        written_ = _written_geometry_for(self.tag_)
+        if not skip_unchanged or written_[0] != pos_x or written_[1] != pos_y:
+            dpg.set_item_pos(self.tag_, [pos_x, pos_y])
+            written_[0:2] = [pos_x, pos_y]
         return self
 
     def pos_x(self): return dpg.get_item_pos(self.tag_)[0]
@@ -680,7 +1986,7 @@ class _EasyDPGWrapperPositionController:
 
 class _EasyDPGWrapperSizeController:
     def __init__(self, tag, external_resize_listener = lambda real_width, real_height: None):
-        _guard_incompatible_type(tag, _GEOMETRY_SIZE_MANAGEABLE_DPG_ITEMS)
+        _guard_incompatible_type(tag, _CAP_GEOMETRY_SIZE_MANAGEABLE)
         self.tag_ = tag
 
     def width(self):
@@ -690,13 +1996,13 @@ class _EasyDPGWrapperSizeController:
         return dpg.get_item_height(self.tag_)
 
     def real_height(self):
-        return dpg.get_item_rect_size(self.tag_)[1]
+        return _rect_size(self.tag_)[1]
 
     def real_width(self):
-        return dpg.get_item_rect_size(self.tag_)[0]
+        return _rect_size(self.tag_)[0]
 
     def set_width(self, width: int):
-        dpg.configure_item(self.tag_, width=width); return self
+        dpg.configure_item(self.tag_, width=width); _written_geometry_for(self.tag_)[2] = width; _forget_rect_size(self.tag_); return self
 
     def increase_width(self, more_width_percent_or_scalar: Union[int, float]):
         self.set_width(self.width() + (
@@ -706,7 +2012,7 @@ class _EasyDPGWrapperSizeController:
 
     def set_height(self, height: int):
         #print(f"setting height for {self.tag_} ({dpg.get_item_type(self.tag_)}): {height}")
-        dpg.configure_item(self.tag_, height=height); return self
+        dpg.configure_item(self.tag_, height=height); _written_geometry_for(self.tag_)[3] = height; _forget_rect_size(self.tag_); return self
 
     def increase_height(self, more_height_percent_or_scalar: Union[int, float]):
         self.set_height(self.height() + (
@@ -714,15 +2020,75 @@ class _EasyDPGWrapperSizeController:
                 self.height() * more_height_percent_or_scalar)))
         return self
 
+    def set_size(self, width: Union[int, None] = None, height: Union[int, None] = None, skip_unchanged: bool = False):
+        '''
+        Seteaza width si/sau height printr-un singur configure_item
+        :width, height None inseamna neschimbat
+        :skip_unchanged sare peste valorile egale cu ultima scriere prin EasyDPG (ca la set_pos)
+        '''
+        written_ = _written_geometry_for(self.tag_)
+        params_ = {}
+        if width is not None and (not skip_unchanged or width != written_[2]):
+            params_["width"] = width
+        if height is not None and (not skip_unchanged or height != written_[3]):
+            params_["height"] = height
+        if len(params_) > 0:
+            dpg.configure_item(self.tag_, **params_)
+            written_[2] = params_.get("width", written_[2])
+            written_[3] = params_.get("height", written_[3])
+            _forget_rect_size(self.tag_)
+        return self
+
 class _EasyDPGWrapperFullGeometryController(_EasyDPGWrapperPositionController, _EasyDPGWrapperSizeController):
     def __init__(self, tag, external_resize_listener = lambda real_width, real_height: None):
         _EasyDPGWrapperPositionController.__init__(self, tag)
         _EasyDPGWrapperSizeController.__init__(self, tag, external_resize_listener)
 
+    def set_geometry(self, pos_x: Union[int, None] = None, pos_y: Union[int, None] = None, width: Union[int, None] = None, height: Union[int, None] = None,
+                     skip_unchanged: bool = False):
+        '''
+        Aplica toata geometria dintr-o data: cel mult un configure_item (marimea) si un set_item_pos (pozitia).
+        :pos_x, pos_y, width, height None inseamna neschimbat
+        :skip_unchanged ca la set_pos / set_size (layout-ul il foloseste, ca sa nu rescrie geometria neschimbata a copiilor)
+        '''
+        self.set_size(width, height, skip_unchanged)
+        if pos_x is not None and pos_y is not None:
+            self.set_pos(pos_x, pos_y, skip_unchanged)
+        elif pos_x is not None or pos_y is not None:
+            pos_ = dpg.get_item_pos(self.tag_)
+            self.set_pos(pos_x if pos_x is not None else pos_[0], pos_y if pos_y is not None else pos_[1], skip_unchanged)
+        return self
+
+    def geometry_transaction(self) -> '_GeometryTransaction':
+        '''
+        Tranzactie de geometrie: set_pos_x/set_pos_y/set_width/set_height in interiorul lui with doar se memoreaza,
+        iar la iesire se aplica o singura data, prin set_geometry:
+            with ctrl.geometry_transaction() as g:
+                g.set_pos_x(10).set_width(200)
+        '''
+        return _GeometryTransaction(self)
+
+class _GeometryTransaction:
+    def __init__(self, ctrl: _EasyDPGWrapperFullGeometryController):
+        self.ctrl_ = ctrl
+        self.pending_ = {}
+
+    def set_pos_x(self, pos_x: int): self.pending_["pos_x"] = pos_x; return self
+    def set_pos_y(self, pos_y: int): self.pending_["pos_y"] = pos_y; return self
+    def set_width(self, width: int): self.pending_["width"] = width; return self
+    def set_height(self, height: int): self.pending_["height"] = height; return self
+
+    def __enter__(self): return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.ctrl_.set_geometry(**self.pending_)
+        self.pending_ = {}
+
 
 class _EasyDPGDefaultCallback:
     def __init__(self, tag, is_submit_valid: lambda tag, app, user_data: True, validate_submit: lambda tag, app, user_data: True, get_submit_value: lambda tag, app, user_data: None):
-        _guard_incompatible_type(tag, _DEFCALLBACK_DPG_ITEMS)
+        _guard_incompatible_type(tag, _CAP_DEFCALLBACK)
         self.tag_ = tag
 
         self.is_submit_valid_ = is_submit_valid
@@ -743,7 +2109,7 @@ class _EasyDPGDefaultCallback:
 
     def set_submit_callback(self, callback: lambda tag, value: None):
         if self.preregistered_submit_callback_ is not None: # previous callback set,
-            print(f"INFO: _EasyDPGDefaultCallback: set_submit_callback: you also have a previous callback (before wrapping) set, so you could call remove_preregistered_submit_callback to remove that and to remain with the current one only, if you want ...")
+            _LOG_EVENTS.info("_EasyDPGDefaultCallback: set_submit_callback: you also have a previous callback (before wrapping) set, so you could call remove_preregistered_submit_callback to remove that and to remain with the current one only, if you want ...")
 
         self.custom_submit_callback_ = callback; return self
 
@@ -764,135 +2130,124 @@ class EasyDPGWrapper:
             raise Exception(f"EasyDPGWrapper: provided tag {tag} is not an int or a str, could it be that you passed an already wrapped tag in another EasyDPGWrapper ?!...")
         self.tag_ = tag
 
-        ud_ = dpg.get_item_user_data(tag)
-        ud_ = {} if ud_ is None else ud_
-        ud_ = {**{
-            'scale_x': 1.0, # pt LM-uri, cum sa se incadreze in spatiul virtual dat de LM
-            'scale_y': 1.0,
-            'justify_x': -1, # tot pt LM-uri, 0 e centru, -1 e stanga, 1 e dreapta
-            'justify_y': -1,
-            'min_x': 0, # tot pt LM-uri, limitele preferentiale sub care LM-ul nu mai scaleaza elementul; cealalta, limita maxima peste care nu o mai scaleaza...
-            'max_x': 0,
-            'min_y': 0,
-            'max_y': 0,
-            'padding_left': 0,
-            'padding_right': 0,
-            'padding_top': 0,
-            'padding_bottom': 0,
-        }, **ud_}
-        dpg.set_item_user_data(tag, ud_)
-
-    def scale_x(self): return dpg.get_item_user_data(self.tag_)['scale_x']
-    def scale_y(self): return dpg.get_item_user_data(self.tag_)['scale_y']
-    def justify_x(self): return dpg.get_item_user_data(self.tag_)['justify_x']
-    def justify_y(self): return dpg.get_item_user_data(self.tag_)['justify_y']
-    def min_x(self): return dpg.get_item_user_data(self.tag_)['min_x']
-    def min_y(self): return dpg.get_item_user_data(self.tag_)['min_y']
-    def max_x(self): return dpg.get_item_user_data(self.tag_)['max_x']
-    def max_y(self): return dpg.get_item_user_data(self.tag_)['max_y']
-    def padding_left(self): return dpg.get_item_user_data(self.tag_)['padding_left']
-    def padding_right(self): return dpg.get_item_user_data(self.tag_)['padding_right']
-    def padding_top(self): return dpg.get_item_user_data(self.tag_)['padding_top']
-    def padding_bottom(self): return dpg.get_item_user_data(self.tag_)['padding_bottom']
+        self.layout_meta_ = _layout_meta_for(tag)
+        _remember_wrapper(self, tag)
+
+    def scale_x(self): return self.layout_meta_.scale_x
+    def scale_y(self): return self.layout_meta_.scale_y
+    def justify_x(self): return self.layout_meta_.justify_x
+    def justify_y(self): return self.layout_meta_.justify_y
+    def min_x(self): return self.layout_meta_.min_x
+    def min_y(self): return self.layout_meta_.min_y
+    def max_x(self): return self.layout_meta_.max_x
+    def max_y(self): return self.layout_meta_.max_y
+    def padding_left(self): return self.layout_meta_.padding_left
+    def padding_right(self): return self.layout_meta_.padding_right
+    def padding_top(self): return self.layout_meta_.padding_top
+    def padding_bottom(self): return self.layout_meta_.padding_bottom
     def set_scale_x(self, new_scale):
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['scale_x'] = new_scale
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.scale_x = new_scale
         return self
     def set_scale_y(self, new_scale):
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['scale_y'] = new_scale
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.scale_y = new_scale
         return self
     def set_justify_x(self, justify):
         '''
         Sets justify value (for LMs) for X axis
         :justify 0 center, 1 right, -1 left
         '''
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['justify_x'] = justify
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.justify_x = justify
         return self
     def set_justify_y(self, justify):
         '''
         Sets justify value (for LMs) for Y axis
         :justify 0 center, 1 right, -1 left
         '''
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['justify_y'] = justify
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.justify_y = justify
         return self
     def set_min_x(self, limit):
         '''
         Sets minimal value (for LMs) for X axis scale (preferential min limit)
         :limit 0 means disabled (scaling is never stopped), strict pozitive value is a valid limiting value for the scale
         '''
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['min_x'] = limit
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.min_x = limit
         return self
     def set_min_y(self, limit):
         '''
         Sets minimal value (for LMs) for Y axis scale (preferential min limit)
         :limit 0 means disabled (scaling is never stopped), strict pozitive value is a valid limiting value for the scale
         '''
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['min_y'] = limit
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.min_y = limit
         return self
     def set_max_x(self, limit):
         '''
         Sets maximal value (for LMs) for X axis scale (preferential max limit)
         :limit 0 means disabled (scaling is never stopped), strict pozitive value is a valid limiting value for the scale
         '''
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['max_x'] = limit
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.max_x = limit
         return self
     def set_max_y(self, limit):
         '''
         Sets maximal value (for LMs) for Y axis scale (preferential max limit)
         :limit 0 means disabled (scaling is never stopped), strict pozitive value is a valid limiting value for the scale
         '''
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['max_y'] = limit
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.max_y = limit
         return self
     def set_padding_left(self, padding):
         '''
         Sets padding value (for LMs) for the left side
         :padding any int pixels value
         '''
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['padding_left'] = padding
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.padding_left = padding
         return self
     def set_padding_right(self, padding):
         '''
         Sets padding value (for LMs) for the right side
         :padding any int pixels value
         '''
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['padding_right'] = padding
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.padding_right = padding
         return self
     def set_padding_top(self, padding):
         '''
         Sets padding value (for LMs) for the top side
         :padding any int pixels value
         '''
-        ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['padding_top'] = padding
-        dpg.set_item_user_data(self.tag_, ud_)
+        self.layout_meta_.padding_top = padding
         return self
     def set_padding_bottom(self, padding):
         '''
         Sets padding value (for LMs) for the bottom side
         :padding any int pixels value
         '''
+        self.layout_meta_.padding_bottom = padding
+        return self
+    def configure_layout(self, **attrs):
+        '''
+        Seteaza dintr-o data oricare dintre metadatele de layout (scale_x/y, justify_x/y, min_x/y, max_x/y, padding_*), ex:
+            w.configure_layout(scale_x=0.5, justify_x=0, padding_left=4)
+        :attrs valorile None sunt ignorate (raman cele existente)
+        '''
+        self.layout_meta_.apply(_validated_layout_attrs(attrs, "EasyDPGWrapper: configure_layout"))
+        return self
+    def set_layout(self, spec: LayoutSpec): self.layout_meta_.apply(spec.attrs()); return self
+
+    @staticmethod
+    def apply_layout(tags_or_wrappers, spec: LayoutSpec = None, **attrs):
+        '''
+        Aplica aceleasi metadate de layout pe mai multe elemente (ex. toti copiii unui adjuster), fara a crea wrapper-e.
+        :spec un LayoutSpec; attrs suplimentare (aceleasi chei ca la configure_layout) il suprascriu
+        '''
+        attrs_ = {**(spec.attrs() if spec is not None else {}), **_validated_layout_attrs(attrs, "EasyDPGWrapper: apply_layout")}
+        for item in tags_or_wrappers:
+            _layout_meta_for(item if type(item) in [int, str] else item.tag()).apply(attrs_)
+
+    def export_layout_meta(self):
+        '''
+        Copiaza metadatele de layout in user_data-ul dpg al elementului (pastrand celelalte chei), pentru cod care le citeste direct din dpg
+        '''
         ud_ = dpg.get_item_user_data(self.tag_)
-        ud_['padding_bottom'] = padding
-        dpg.set_item_user_data(self.tag_, ud_)
+        ud_ = {} if not isinstance(ud_, dict) else ud_
+        dpg.set_item_user_data(self.tag_, {**ud_, **self.layout_meta_.as_dict()})
         return self
 
     @staticmethod
@@ -943,7 +2298,7 @@ class EasyDPGWrapperFileDialog(EasyDPGWrapper, _EasyDPGWrapperFullGeometryContro
         _EasyDPGWrapperVisibility.__init__(self, tag)
 
         def _is_submit_valid(tag, app_data, user_data):
-            single_selection_ = user_data['single_selection'] if 'single_selection' in user_data else False
+            single_selection_ = user_data['single_selection'] if isinstance(user_data, dict) and 'single_selection' in user_data else False
             current_selections_ = list(app_data["selections"].values())
             if single_selection_ and len(current_selections_) > 1:
                 error_or_info_box("You must make only one selection, please try again !", lambda: self.open(),
@@ -962,7 +2317,7 @@ class EasyDPGWrapperFileDialog(EasyDPGWrapper, _EasyDPGWrapperFullGeometryContro
                 return result_
             else:
                 return selections
-        def _get_submit_value(tag, app_data, user_data): print(app_data); print(app_data['selections']); return __pprocess_selections(tag, list(app_data["selections"].values()))
+        def _get_submit_value(tag, app_data, user_data): _LOG_EVENTS.debug("file dialog submit: %s", app_data); return __pprocess_selections(tag, list(app_data["selections"].values()))
 
         _EasyDPGDefaultCallback.__init__(self, tag, is_submit_valid=_is_submit_valid, validate_submit=_validate_submit, get_submit_value=_get_submit_value)
 
@@ -1012,9 +2367,10 @@ class EasyDPGWrapperFileDialog(EasyDPGWrapper, _EasyDPGWrapperFullGeometryContro
         if start_path is not None and os.path.exists(start_path):
             params_['default_path'] = start_path
         elif start_path is not None:
-            print(f"WARNING: start_path ('{start_path}') is an invalid path; it was ignored !")
+            _LOG_WIDGETS.warning("EasyDPGWrapperFileDialog: build: start_path ('%s') is an invalid path; it was ignored !", start_path)
 
         element_id = dpg.add_file_dialog(**params_)
+        _notify_item_added(element_id)
         for filter in file_filters:
             dpg.add_file_extension(filter, parent=element_id)
 
@@ -1048,6 +2404,7 @@ class EasyDPGWrapperText(EasyDPGWrapper, _EasyDPGWrapperVisibility):
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_text(**params_)
+        _notify_item_added(element_id)
 
         return EasyDPGWrapperText(tag=element_id)
 
@@ -1077,6 +2434,7 @@ class EasyDPGWrapperCheckbox(EasyDPGWrapper, _EasyDPGWrapperSingleValueControlle
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_checkbox(**params_)
+        _notify_item_added(element_id)
 
         return EasyDPGWrapperCheckbox(tag=element_id)
 
@@ -1111,6 +2469,7 @@ class EasyDPGWrapperGroup(EasyDPGWrapper, _EasyDPGWrapperFullGeometryController,
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_group(**params_)
+        _notify_item_added(element_id)
 
         return EasyDPGWrapperGroup(tag=element_id)
 
@@ -1185,7 +2544,7 @@ class EasyDPGWrapperPrimaryPanel(EasyDPGWrapper, _EasyDPGWrapperVisibility, _Eas
                 params_["no_scrollbar"] = False
                 params_["horizontal_scrollbar"] = True
             else:
-                print(f"WARNING: EasyDPGWrapperPrimaryPanel: build: didn't recognized visible_scrollbars parameter: {visible_scrollbars}")
+                _LOG_WIDGETS.warning("EasyDPGWrapperPrimaryPanel: build: didn't recognized visible_scrollbars parameter: %s", visible_scrollbars)
 
         if has_explicit_size_:
             if width is not None:
@@ -1194,6 +2553,7 @@ class EasyDPGWrapperPrimaryPanel(EasyDPGWrapper, _EasyDPGWrapperVisibility, _Eas
                 params_['height'] = height
 
         element_id = dpg.add_window(**params_)
+        _notify_item_added(element_id)
 
         ref_ = EasyDPGWrapperPrimaryPanel(tag=element_id)
         ref_.set_background_color(background_color_hue_or_rgb_and_or_alpha)
@@ -1258,7 +2618,7 @@ class EasyDPGWrapperInnerPanel(EasyDPGWrapper, _EasyDPGWrapperVisibility, _EasyD
                 params_["no_scrollbar"] = False
                 params_["horizontal_scrollbar"] = True
             else:
-                print(f"WARNING: EasyDPGWrapperInnerPanel: build: didn't recognized visible_scrollbars parameter: {visible_scrollbars}")
+                _LOG_WIDGETS.warning("EasyDPGWrapperInnerPanel: build: didn't recognized visible_scrollbars parameter: %s", visible_scrollbars)
 
         #"autosize_x": (autosize is None and not has_explicit_width_) or autosize is True, # la child_window, nu e nevoie (dupa testele mele practice) de autosize_x/y fiindca sunt implicite, practic, sunt pe True, daca lipseste width/height si False, daca dai explicit width sau height, par sa fie syntactic sugar... (mai merita reconfirmat dar asa imi pare mie)
         #"autosize_y": (autosize is None and not has_explicit_height_) or autosize is True,
@@ -1272,6 +2632,7 @@ class EasyDPGWrapperInnerPanel(EasyDPGWrapper, _EasyDPGWrapperVisibility, _EasyD
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_child_window(**params_)
+        _notify_item_added(element_id)
 
         #print(f"{element_id}: has_explicit_width_: {has_explicit_width_}")
         #print(f"{element_id}: has_explicit_height_: {has_explicit_height_}")
@@ -1340,7 +2701,7 @@ class EasyDPGWrapperPopup(EasyDPGWrapper, _EasyDPGWrapperVisibility, _EasyDPGWra
                 params_["no_scrollbar"] = False
                 params_["horizontal_scrollbar"] = True
             else:
-                print(f"WARNING: EasyDPGWrapperPrimaryPanel: build: didn't recognized visible_scrollbars parameter: {visible_scrollbars}")
+                _LOG_WIDGETS.warning("EasyDPGWrapperPrimaryPanel: build: didn't recognized visible_scrollbars parameter: %s", visible_scrollbars)
 
         if has_explicit_size_:
             if width is not None:
@@ -1349,6 +2710,7 @@ class EasyDPGWrapperPopup(EasyDPGWrapper, _EasyDPGWrapperVisibility, _EasyDPGWra
                 params_['height'] = height
 
         element_id = dpg.add_window(**params_)
+        _notify_item_added(element_id)
 
         return EasyDPGWrapperPopup(tag=element_id)
 
@@ -1413,7 +2775,7 @@ class EasyDPGWrapperModal(EasyDPGWrapper, _EasyDPGWrapperVisibility, _EasyDPGWra
                 params_["no_scrollbar"] = False
                 params_["horizontal_scrollbar"] = True
             else:
-                print(f"WARNING: EasyDPGWrapperPrimaryPanel: build: didn't recognized visible_scrollbars parameter: {visible_scrollbars}")
+                _LOG_WIDGETS.warning("EasyDPGWrapperPrimaryPanel: build: didn't recognized visible_scrollbars parameter: %s", visible_scrollbars)
 
         if has_explicit_size_:
             if width is not None:
@@ -1422,6 +2784,7 @@ class EasyDPGWrapperModal(EasyDPGWrapper, _EasyDPGWrapperVisibility, _EasyDPGWra
                 params_['height'] = height
 
         element_id = dpg.add_window(**params_)
+        _notify_item_added(element_id)
 
         return EasyDPGWrapperModal(tag=element_id)
 
@@ -1453,6 +2816,7 @@ class EasyDPGWrapperSpacer(EasyDPGWrapper, _EasyDPGWrapperFullGeometryController
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_spacer(**params_)
+        _notify_item_added(element_id)
 
         return EasyDPGWrapperSpacer(tag=element_id)
 
@@ -1478,6 +2842,7 @@ class EasyDPGWrapperHorizontalSpacer(EasyDPGWrapper, _EasyDPGWrapperFullGeometry
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_spacer(**params_)
+        _notify_item_added(element_id)
 
         return EasyDPGWrapperHorizontalSpacer(tag=element_id)
 
@@ -1503,6 +2868,7 @@ class EasyDPGWrapperVerticalSpacer(EasyDPGWrapper, _EasyDPGWrapperFullGeometryCo
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_spacer(**params_)
+        _notify_item_added(element_id)
 
         return EasyDPGWrapperVerticalSpacer(tag=element_id)
 
@@ -1544,6 +2910,7 @@ class EasyDPGWrapperButton(EasyDPGWrapper, _EasyDPGWrapperFullGeometryController
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_button(**params_)
+        _notify_item_added(element_id)
         if tooltip:
             dpg.set_item_tooltip(element_id, tooltip)
 
@@ -1583,6 +2950,7 @@ class EasyDPGWrapperTree(EasyDPGWrapper, _EasyDPGWrapperVisibility, _EasyDPGWrap
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_tree_node(**params_)
+        _notify_item_added(element_id)
 
         ref_ = EasyDPGWrapperTree(tag=element_id)
         return ref_
@@ -1624,6 +2992,7 @@ class EasyDPGWrapperInputText(EasyDPGWrapper, _EasyDPGWrapperPositionController,
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_input_text(**params_)
+        _notify_item_added(element_id)
 
         ref_ = EasyDPGWrapperInputText(tag=element_id)
         ref_.set_background_color(background_color_hue_or_rgb)
@@ -1664,6 +3033,7 @@ class EasyDPGWrapperInputPassword(EasyDPGWrapper, _EasyDPGWrapperPositionControl
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_input_text(**params_)
+        _notify_item_added(element_id)
 
         ref_ = EasyDPGWrapperInputPassword(tag=element_id)
         ref_.set_background_color(background_color_hue_or_rgb)
@@ -1714,6 +3084,7 @@ class EasyDPGWrapperInputInt(EasyDPGWrapper, _EasyDPGWrapperPositionController,
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_input_int(**params_)
+        _notify_item_added(element_id)
 
         ref_ = EasyDPGWrapperInputInt(tag=element_id)
         ref_.set_background_color(background_color_hue_or_rgb)
@@ -1732,7 +3103,7 @@ class EasyDPGWrapperProgressBar(EasyDPGWrapper, _EasyDPGWrapperSizeController, _
         _guard_incompatible_type(self.tag(), ["mvprogressbar"])
 
         udata_ = dpg.get_item_user_data(tag)
-        self.clbk_ = udata_['progress_callback'] if 'progress_callback' in udata_ else lambda progress: progress
+        self.clbk_ = udata_['progress_callback'] if isinstance(udata_, dict) and 'progress_callback' in udata_ else lambda progress: progress
 
     def progress(self): return dpg.get_item_user_data(self.tag_)['progress_value']
     def update_progress(self, value01):
@@ -1761,6 +3132,7 @@ class EasyDPGWrapperProgressBar(EasyDPGWrapper, _EasyDPGWrapperSizeController, _
         params_ = _try_inject_explicit_parent(explicit_parent, params_)
 
         element_id = dpg.add_progress_bar(**params_)
+        _notify_item_added(element_id)
 
         dpg.set_item_user_data(element_id, {
             "progress_callback": overlay_callback
@@ -1771,6 +3143,105 @@ class EasyDPGWrapperProgressBar(EasyDPGWrapper, _EasyDPGWrapperSizeController, _
         return ref_
 
 
+class EasyDPGVirtualList(EasyDPGWrapperInnerPanel):
+    '''
+    Lista virtualizata: un panou interior derulabil care materializeaza doar randurile din fereastra vizibila (plus overscan),
+    reciclandu-le la derulare; numarul de elemente dpg ramane constant indiferent de marimea datelor.
+    Randurile au inaltime fixa (row_height) si sunt pozitionate absolut, iar un spacer plasat la capatul listei da intinderea derularii.
+    '''
+    def __init__(self, tag, data_source: VirtualListDataSource, row_builder: VirtualListRowBuilder = None, row_updater: VirtualListRowUpdater = None,
+                 row_height: int = 20, overscan: int = 2):
+        EasyDPGWrapperInnerPanel.__init__(self, tag)
+        self.app_: EasyDPGApp = FACTORY(EasyDPGApp)
+
+        self.data_source_ = data_source
+        self.row_builder_ = row_builder if row_builder is not None else lambda parent, index, item: EasyDPGWrapperText.build(str(item), explicit_parent=parent)
+        self.row_updater_ = row_updater if row_updater is not None else (lambda row, index, item: row.set_text(str(item))) if row_builder is None else None
+        self.row_height_ = row_height
+        self.overscan_ = overscan
+
+        self.slots_: List[Dict[str, Any]] = [] # randurile reciclabile: {"group": EasyDPGWrapperGroup, "row": ce a intors row_builder, "index": indexul legat acum sau None}
+        self.extent_spacer_ = EasyDPGWrapperSpacer.build(width=1, height=1, pos=(0, 0), explicit_parent=self)
+        self.window_ = None # (first, last, count) sincronizat ultima oara
+        self.synced_data_ = None # secventa legata ultima oara; alta secventa (chiar de aceeasi lungime) re-leaga randurile vizibile
+        self.dirty_ = True
+        self.unregister_sync_ = self.app_.register_post_render_listener(self.__sync)
+
+    def set_data(self, data_source: VirtualListDataSource):
+        self.data_source_ = data_source; return self.refresh()
+    def refresh(self):
+        '''
+        Forteaza re-legarea randurilor vizibile la urmatorul cadru (ex. datele s-au modificat pe loc, in aceeasi secventa, fara set_data);
+        daca data_source intoarce o secventa noua, re-legarea se face singura
+        '''
+        self.dirty_ = True; return self
+    def materialized_rows(self): return len(self.slots_)
+
+    def __data(self) -> Sequence[Any]: return self.data_source_() if callable(self.data_source_) else self.data_source_
+
+    def __bind(self, slot, index, item):
+        if self.row_updater_ is not None and slot["row"] is not None:
+            self.row_updater_(slot["row"], index, item)
+        else:
+            slot["group"].delete_children()
+            slot["row"] = self.row_builder_(slot["group"], index, item)
+        slot["index"] = index
+
+    def __sync(self):
+        if not dpg.does_item_exist(self.tag_):
+            self.unregister_sync_()
+            return
+
+        data_ = self.__data()
+        count_ = len(data_)
+        visible_rows_ = int(_rect_size(self.tag_)[1] // self.row_height_) + 1 + 2 * self.overscan_
+        first_ = max(0, min(int(dpg.get_y_scroll(self.tag_) // self.row_height_) - self.overscan_, count_ - visible_rows_))
+        last_ = min(count_, first_ + visible_rows_)
+        dirty_ = self.dirty_ or data_ is not self.synced_data_
+        if not dirty_ and self.window_ == (first_, last_, count_) and len(self.slots_) >= visible_rows_:
+            return # nimic derulat, nimic schimbat: un cadru obisnuit costa doua citiri
+
+        while len(self.slots_) < visible_rows_: # pool-ul creste doar cand panoul devine mai inalt
+            self.slots_.append({"group": EasyDPGWrapperGroup.build("v", explicit_parent=self), "row": None, "index": None})
+        self.extent_spacer_.set_pos(0, count_ * self.row_height_)
+
+        # fiecare index ocupa slotul index % marime_pool, deci la derularea cu un rand se re-leaga un singur slot
+        pool_size_ = len(self.slots_)
+        used_ = set()
+        for index in range(first_, last_):
+            slot_ = self.slots_[index % pool_size_]
+            used_.add(index % pool_size_)
+            if dirty_ or slot_["index"] != index:
+                self.__bind(slot_, index, data_[index])
+            slot_["group"].set_pos(0, index * self.row_height_).show()
+        for i, slot_ in enumerate(self.slots_):
+            if i not in used_:
+                slot_["group"].hide()
+                slot_["index"] = None
+
+        self.window_ = (first_, last_, count_)
+        self.app_.invalidate_mouse_regions() # randurile s-au mutat / re-legat
+        self.synced_data_ = data_
+        self.dirty_ = False
+
+    @staticmethod
+    def build(data_source: VirtualListDataSource, row_builder: VirtualListRowBuilder = None, row_updater: VirtualListRowUpdater = None,
+              row_height: int = 20, overscan: int = 2, width: int = None, height: int = None, explicit_parent: AnyParent = None) -> 'EasyDPGVirtualList':
+        """
+        Crează o lista virtualizata (doar randurile vizibile exista ca elemente dpg).
+        :param data_source: secventa de date, sau un callable care intoarce secventa curenta
+        :param row_builder: (container, index, element) -> rand; construieste continutul unui rand in containerul dat; implicit un text cu str(element)
+        :param row_updater: (rand, index, element) -> None; refoloseste un rand existent pentru alt element; daca lipseste (dar ai dat row_builder), randul se reconstruieste in acelasi container
+        :param row_height: inaltimea fixa a unui rand, in pixeli
+        :param overscan: cate randuri in plus se materializeaza deasupra si dedesubtul ferestrei vizibile
+        :param width: Lățimea listei; implicit toata latimea containerului parinte
+        :param height: Înălțimea listei; implicit toata inaltimea containerului parinte
+        :param explicit_parent: Containerul părinte în care se va plasa lista.
+        """
+        panel_ = EasyDPGWrapperInnerPanel.build(width=width, height=height, visible_scrollbars="v", show_borders=False, explicit_parent=explicit_parent)
+        return EasyDPGVirtualList(panel_.tag(), data_source, row_builder=row_builder, row_updater=row_updater, row_height=row_height, overscan=overscan)
+
+
 class _EasyDPGLayoutManagerBase:
 
     def __init__(self, tag):
@@ -1783,156 +3254,324 @@ class _EasyDPGLayoutManagerBase:
 
     def tag(self): return self.tag_
 
-    def recalculate(self):
+    def configure_children_layout(self, spec: LayoutSpec = None, **attrs):
+        '''
+        Aplica aceleasi metadate de layout pe toti copiii (directi) ai LM-ului; vezi EasyDPGWrapper.apply_layout
+        '''
+        EasyDPGWrapper.apply_layout(dpg.get_item_children(self.tag_, 1), spec, **attrs)
+        return self
+
+    def recalculate(self, width: Union[int, float, None] = None, height: Union[int, float, None] = None) -> LMRecalculateResult:
+        '''
+        :width, height marimea (virtuala) a LM-ului, deja stabilita de LM-ul parinte; None inseamna marimea reala (get_item_rect_size)
+        '''
         raise Exception("not implemented")
 
-    # @TODO in mod normal, functia de mai jos nu ar trebui sa primeasca regula incat sa o parseze el, ci parametrii in dictionar, care sa specifice cele necesare calculului proportional, urmand ca regula (structura ei) sa fie definita si analizat-extractata (parsed) de apelant, caci asa se poate crea si o metoda de validare specifica etc... deocamdata lasam asa, dar mai corect ar fi cum am spus
     @staticmethod
     def compute_proportional_adjuster_parts(container_tag: Union[str, int], adjust_rule: str,
                                             total_dim_in_container: int, alter_dim_total: int,
                                             result_row_provider: LMProportionalAdjusterResultRowProvider,
-                                            adjuster_class_name: str = "EasyDPGWrapperProportionalVerticalAdjuster"):
-
-        dpg_sub_elements_ = dpg.get_item_children(container_tag, 1)  # Index 1 pentru copii obișnuiți; index 0 pentru "slotul de început" ???!
-        child_count_ = len(dpg_sub_elements_)
-        if child_count_ <= 0:
-            return {} # no descendents (children elements) so no adjusting to do
-
-        if adjust_rule is None or len(adjust_rule) <= 0:
-            perc_ = int(100.0 / child_count_)
-            adjust_rule = f"{perc_}%," * child_count_
-            adjust_rule = adjust_rule[:-1]
-            print(
-                f"WARNING: {adjuster_class_name}: provided empty rule, defaulted it with equal virtual spaces between child elements, so {perc_} % for each of them")
-
-        # pasul 1 - determinare total unitati
-        total_units_ = None
-        if '%' in adjust_rule:
-            total_units_ = 100
-        else:
-            if ':' in adjust_rule:
-                try:
-                    total_units_ = int(adjust_rule.split(':')[0].strip())
-                except:
-                    raise Exception(
-                        f"ERROR: {adjuster_class_name}: recalculate: total units wrongly specified, expecting a number (followed by the : delimiter) as an adjust rule prefix, but rule seems to be broken: {adjust_rule}")
-        if total_units_ is None:
-            print(
-                f"WARNING: {adjuster_class_name}: recalculate: total units missing, not specified: please use % in the rule parts to induce an implicit 100 as the total units or use an explicit <total_units:<rule parts> syntax for an explicit specification; current incomplete specified rule: {adjust_rule}. For now, we will default total units to 100 (so unit=percent). Adjust rule (for localisation and fixing): {adjust_rule}")
-            total_units_ = 100
-
-        # pasul 2 - extragere "parti"...
-        parts_fullchunk_raw_ = adjust_rule.split(":")[1] if ":" in adjust_rule else adjust_rule
-        temp_ = [p.strip().lower() for p in re.split(r'[;,]', parts_fullchunk_raw_)]
-        p_ = 0
-        # 'parsare' mai specifica, fiindca si extra argumentele au delimitator , sau ; si atunci nu pot folosi un simplu split, trebuie sa tin cotn si de expresiile dintre [ .. ]
-        parts_raw_ = []
-        while p_ < len(temp_):
-            chunk_ = temp_[p_]
-            if "[" in temp_[p_] and "]" not in temp_[p_]:
-                while "]" not in temp_[p_]:
-                    p_ += 1
-                    if "[" in temp_[p_] or p_ >= len(temp_):
-                        raise Exception(f"ERROR: {adjuster_class_name}: recalculate: syntax invalid adjust rule, regarding extra-args specification, see [ and ] symbols to not be missing or not being too many: {adjust_rule}")
-                    chunk_ += ',' + temp_[p_]
-            parts_raw_.append(chunk_)
-            p_ += 1
-
-        # 2.1. extragere extra argumente
-        extra_args_ = {}
-        parts_ = []
-        i = 0
-        for p in parts_raw_:
-            if '[' in p:
-                c_part_ = p[:p.find('[')]
-                parts_.append(c_part_)
-                args_raw_ = p[p.find('[') + 1: p.rfind(']')]
-                expr_list_raw_ = [p.strip().lower() for p in re.split(r'[;,]', args_raw_)]
-                extra_args_[i] = {}
-                for e in expr_list_raw_:
-                    arg_name_, argv_val_ = [c.strip() for c in e.split('=')]
-                    if arg_name_ in ['min', 'max']:
-                        argv_val_ = int(argv_val_)
-                    extra_args_[i][arg_name_] = argv_val_
-
-                    if 'u' not in c_part_ and '%' not in c_part_ and arg_name_ in ["min", "max"]: # R-urile nu au voie la min-max @ TODO asta se poate folosi si la validatorul de reguli - cum am spus, in fine, fiecare LM ar trebui sa parseze singur regula si aici sa-mi dea direct doar parametrii clari, dar e ideal ce spun, merge si asa, logica comuna la doua LM-uri...-, in fine...
-                        raise Exception(f"ERROR: {adjuster_class_name}: 'max' and 'min' extra-arg cannot reside in an R part (only in parts - not in subparts- allowed); for localisation purposes, the whole rule is {adjust_rule}")
-
-            else:
-                extra_args_[i] = {}
-                parts_.append(p)
-            i += 1
+                                            adjuster_class_name: str = "EasyDPGWrapperProportionalVerticalAdjuster",
+                                            adjust_plan: '_AdjustRulePlan' = None):
+        job_ = _ProportionalSolveJob(container_tag=container_tag, adjust_rule=adjust_rule, total_dim=total_dim_in_container, alter_dim_total=alter_dim_total,
+                                     result_row_provider=result_row_provider, adjuster_class_name=adjuster_class_name, adjust_plan=adjust_plan)
+        return _EasyDPGLayoutManagerBase.compute_proportional_adjuster_parts_batch([job_], vectorized=False)[0]
 
-        # 2.2. o mica validare...
-        if len(parts_) != child_count_:
-            raise Exception(
-                f"ERROR: {adjuster_class_name}: you provided an incomplete/confussing rule as the specified rule part-count ({len(parts_)}) is not the same number as the current child count ({child_count_}): {adjust_rule}")
-
-        # pasul 3 - calcul numar unitati
-        num_units_ = sum(extract_int_scalar(p, throw_exception=True, reject_float=True) if 'u' in p or '%' in p else 0 for p in parts_)
-        if num_units_ > total_units_:
-            raise Exception(f"ERROR: {adjuster_class_name}: sum of all non-R part units ({num_units_}) are exceeding total units ({total_units_}). For localisation purposes, here is the whole adjust rule: {adjust_rule}")
-
-        # pasul 4 - calcul numar subunitati (unitati-"remaining")
-        num_r_units_ = sum(extract_int_scalar(p, throw_exception=True, reject_float=True) if 'r' in p else 0 for p in parts_)
+    @staticmethod
+    def compute_proportional_adjuster_parts_batch(jobs: List['_ProportionalSolveJob'], vectorized: bool = True) -> List[LMRecalculateResult]:
+        '''
+        Rezolva impreuna mai multe LM-uri proportionale (de ex. toate cele de pe acelasi nivel de adancime).
+        :vectorized daca e True, numpy e disponibil si sunt destule LM-uri (_VECTORIZED_SOLVE_MIN_JOBS), aritmetica tuturor se face intr-un singur pas vectorizat; altfel, LM cu LM, in Python (rezultate identice)
+        '''
+        results_ = [{} for _ in jobs]
+        children_, plans_, active_ = [], [], []
+        for job_idx_, job_ in enumerate(jobs):
+            dpg_sub_elements_ = dpg.get_item_children(job_.container_tag, 1)  # Index 1 pentru copii obișnuiți; index 0 pentru "slotul de început" ???!
+            child_count_ = len(dpg_sub_elements_)
+            if child_count_ <= 0:
+                continue # no descendents (children elements) so no adjusting to do
+
+            # regula vine, de obicei, deja compilata (de la set_adjust_rule); aici doar facem aritmetica
+            adjust_plan_ = job_.adjust_plan
+            if adjust_plan_ is None:
+                adjust_rule_ = job_.adjust_rule
+                if adjust_rule_ is None or len(adjust_rule_) <= 0:
+                    perc_ = int(100.0 / child_count_)
+                    adjust_rule_ = f"{perc_}%," * child_count_
+                    adjust_rule_ = adjust_rule_[:-1]
+                    _LOG_LAYOUT.debug("%s: provided empty rule, defaulted it with equal virtual spaces between child elements, so %s %% for each of them", job_.adjuster_class_name, perc_)
+                adjust_plan_ = _compile_adjust_rule(adjust_rule_, job_.adjuster_class_name)
+
+            # o mica validare... (numarul de copii se poate schimba oricand, deci nu poate fi verificat la compilare)
+            if len(adjust_plan_.parts) != child_count_:
+                raise Exception(
+                    f"ERROR: {job_.adjuster_class_name}: you provided an incomplete/confussing rule as the specified rule part-count ({len(adjust_plan_.parts)}) is not the same number as the current child count ({child_count_}): {adjust_plan_.rule}")
+
+            children_.append(dpg_sub_elements_)
+            plans_.append(adjust_plan_)
+            active_.append(job_idx_)
+
+        if len(active_) <= 0:
+            return results_
+
+        totals_ = [jobs[job_idx_].total_dim for job_idx_ in active_]
+        names_ = [jobs[job_idx_].adjuster_class_name for job_idx_ in active_]
+        if vectorized and np is not None and len(active_) >= _VECTORIZED_SOLVE_MIN_JOBS:
+            dims_per_job_ = _solve_proportional_parts_vectorized(plans_, totals_, names_)
+        else:
+            dims_per_job_ = [_solve_proportional_parts(plan_, total_, name_) for plan_, total_, name_ in zip(plans_, totals_, names_)]
 
-        # pasul 5, calcul valori absolute per unitati (subunitatile (R-urile) se amana fiindca vedem daca unitatile raman asa sau trebuie modificate pentru constrangeri)
-        unit_mu_ = total_dim_in_container / total_units_  # mu=measurement-unit
+        # -pasul 8 - ultimul pas, returnam rezultatele finale
+        for k, job_idx_ in enumerate(active_):
+            job_ = jobs[job_idx_]
+            increm_pos_ = 0
+            for part_idx_, new_dim_ in dims_per_job_[k]:
+                se_tag = children_[k][part_idx_]
+                results_[job_idx_][se_tag] = job_.result_row_provider(new_dim_, job_.alter_dim_total, increm_pos_)
+                increm_pos_ += new_dim_
+
+        return results_
+
+@dataclasses.dataclass(frozen=True)
+class _AdjustRulePart:
+    raw: str # textul partii (fara extra-argumente), pentru mesaje
+    scalar: int
+    fixed: bool # True pentru partile 'u'/'%' (unitati), False pentru partile R (din spatiul ramas)
+    r_units: int # contributia partii la totalul de subunitati R (doar partile cu 'r' explicit)
+    min_limit: Union[int, None] = None
+    max_limit: Union[int, None] = None
+    extra_args: Tuple[Tuple[str, Any], ...] = ()
+
+@dataclasses.dataclass(frozen=True)
+class _AdjustRulePlan:
+    rule: str
+    total_units: int
+    parts: Tuple[_AdjustRulePart, ...]
+    num_units: int
+    num_r_units: int
+    columns: Any = dataclasses.field(default=(), compare=False, repr=False) # cu numpy: matrice (parti x 4) cu scalar, fixed, min, max, pentru rezolvarea vectorizata
+
+@functools.lru_cache(maxsize=1024)
+def _compile_adjust_rule(adjust_rule: str, adjuster_class_name: str = "EasyDPGWrapperProportionalVerticalAdjuster") -> _AdjustRulePlan:
+    '''
+    Compileaza (o singura data, rezultatul e pastrat in cache dupa textul regulii) o regula de ajustare proportionala intr-un plan imuabil;
+    arunca exceptie pentru orice regula invalida, deci erorile apar la set_adjust_rule, nu in mijlocul unui cadru.
+    '''
+    # pasul 1 - determinare total unitati
+    total_units_ = None
+    if '%' in adjust_rule:
+        total_units_ = 100
+    else:
+        if ':' in adjust_rule:
+            try:
+                total_units_ = int(adjust_rule.split(':')[0].strip())
+            except:
+                raise Exception(
+                    f"ERROR: {adjuster_class_name}: recalculate: total units wrongly specified, expecting a number (followed by the : delimiter) as an adjust rule prefix, but rule seems to be broken: {adjust_rule}")
+    if total_units_ is None:
+        _LOG_LAYOUT.warning("%s: recalculate: total units missing, not specified: please use %% in the rule parts to induce an implicit 100 as the total units or use an explicit <total_units:<rule parts> syntax for an explicit specification; current incomplete specified rule: %s. For now, we will default total units to 100 (so unit=percent). Adjust rule (for localisation and fixing): %s", adjuster_class_name, adjust_rule, adjust_rule)
+        total_units_ = 100
+
+    # pasul 2 - extragere "parti"...
+    parts_fullchunk_raw_ = adjust_rule.split(":")[1] if ":" in adjust_rule else adjust_rule
+    temp_ = [p.strip().lower() for p in re.split(r'[;,]', parts_fullchunk_raw_)]
+    p_ = 0
+    # 'parsare' mai specifica, fiindca si extra argumentele au delimitator , sau ; si atunci nu pot folosi un simplu split, trebuie sa tin cotn si de expresiile dintre [ .. ]
+    parts_raw_ = []
+    while p_ < len(temp_):
+        chunk_ = temp_[p_]
+        if "[" in temp_[p_] and "]" not in temp_[p_]:
+            while "]" not in temp_[p_]:
+                p_ += 1
+                if p_ >= len(temp_) or "[" in temp_[p_]:
+                    raise Exception(f"ERROR: {adjuster_class_name}: recalculate: syntax invalid adjust rule, regarding extra-args specification, see [ and ] symbols to not be missing or not being too many: {adjust_rule}")
+                chunk_ += ',' + temp_[p_]
+        parts_raw_.append(chunk_)
+        p_ += 1
+
+    # 2.1. extragere extra argumente
+    parts_ = []
+    for p in parts_raw_:
+        extra_args_ = {}
+        c_part_ = p
+        if '[' in p:
+            c_part_ = p[:p.find('[')]
+            args_raw_ = p[p.find('[') + 1: p.rfind(']')]
+            expr_list_raw_ = [p.strip().lower() for p in re.split(r'[;,]', args_raw_)]
+            for e in expr_list_raw_:
+                arg_name_, argv_val_ = [c.strip() for c in e.split('=')]
+                if arg_name_ in ['min', 'max']:
+                    argv_val_ = int(argv_val_)
+                extra_args_[arg_name_] = argv_val_
+
+                if 'u' not in c_part_ and '%' not in c_part_ and arg_name_ in ["min", "max"]: # R-urile nu au voie la min-max
+                    raise Exception(f"ERROR: {adjuster_class_name}: 'max' and 'min' extra-arg cannot reside in an R part (only in parts - not in subparts- allowed); for localisation purposes, the whole rule is {adjust_rule}")
+
+        scalar_ = extract_int_scalar(c_part_, throw_exception=True, reject_float=True)
+        parts_.append(_AdjustRulePart(raw=c_part_,
+                                      scalar=scalar_,
+                                      fixed='u' in c_part_ or '%' in c_part_,
+                                      r_units=scalar_ if 'r' in c_part_ else 0,
+                                      min_limit=extra_args_.pop('min', None),
+                                      max_limit=extra_args_.pop('max', None),
+                                      extra_args=tuple(extra_args_.items())))
+
+    # pasul 3 - calcul numar unitati
+    num_units_ = sum(p.scalar for p in parts_ if p.fixed)
+    if num_units_ > total_units_:
+        raise Exception(f"ERROR: {adjuster_class_name}: sum of all non-R part units ({num_units_}) are exceeding total units ({total_units_}). For localisation purposes, here is the whole adjust rule: {adjust_rule}")
+
+    # pasul 4 - calcul numar subunitati (unitati-"remaining")
+    num_r_units_ = sum(p.r_units for p in parts_)
+
+    columns_ = ()
+    if np is not None:
+        columns_ = np.array([(float(p.scalar), 1.0 if p.fixed else 0.0,
+                              float(p.min_limit) if p.min_limit is not None else 0.0,
+                              float(p.max_limit) if p.max_limit is not None else 1000000.0) for p in parts_], dtype=float).reshape(-1, 4)
+        columns_.setflags(write=False) # planul e imuabil (si partajat prin cache)
+    return _AdjustRulePlan(rule=adjust_rule, total_units=total_units_, parts=tuple(parts_), num_units=num_units_, num_r_units=num_r_units_, columns=columns_)
+
+_VECTORIZED_SOLVE_MIN_JOBS = 128 # masurat (benchmarks/proportional_solver.py): ~la egalitate pe la 64 LM-uri pe nivel, ~1.5x la 128, ~2x de la 200 in sus
 
-        # 5.1. calculam, de sondaj, doar partile non-R..., dar aplicam si min-max-urile...
-        final_dims_per_part_ = {}
-        remaining_dim_ = total_dim_in_container
-        for part_idx_ in range(child_count_):
-            c_part_ = parts_[part_idx_]
-            if 'u' not in c_part_ and '%' not in c_part_:
-                continue
-            scalar_ = extract_int_scalar(c_part_, throw_exception=True, reject_float=True)
-            new_dim_ = int(scalar_ * unit_mu_)
-            new_dim_ = min(extra_args_[part_idx_]['max'] if 'max' in extra_args_[part_idx_] else 1000000,
-                           max(extra_args_[part_idx_]['min'] if 'min' in extra_args_[part_idx_] else 0, new_dim_))
-            final_dims_per_part_[part_idx_] = new_dim_
-            remaining_dim_ -= new_dim_
-
-        # -pasul 6- pana acum avem toate dimensiunile (obligatorii -care au min specificat-) calculate dupa potentialul spatiu pe care il doresc
-        # verificam daca mai e loc de R-uri (cele mai joase ca prioritate), si daca da, le calculam si pe astea, daca nu, le ignoram complet (nu vor aparea pe ecran, "ghinion"...)
-        if remaining_dim_ > 0:
-            if num_r_units_:
-                subunit_mu_ = remaining_dim_ / num_r_units_ if num_r_units_ > 0 else 0
-                optional_subparts_ = [[i, subunit_mu_ * extract_int_scalar(parts_[i], throw_exception=True, reject_float=True)] for i in
-                                      range(child_count_) if
-                                      i not in final_dims_per_part_.keys()]
-                for s in optional_subparts_:
-                    final_dims_per_part_[s[0]] = s[1]
-                    remaining_dim_ -= s[1]
-
-        elif remaining_dim_ < 0 and num_r_units_ > 0:
-            default_r_units_ = [parts_[i] for i in range(child_count_) if i not in final_dims_per_part_.keys()]
+@dataclasses.dataclass
+class _ProportionalSolveJob:
+    container_tag: Union[str, int]
+    adjust_rule: Union[str, None]
+    total_dim: Union[int, float]
+    alter_dim_total: Union[int, float]
+    result_row_provider: LMProportionalAdjusterResultRowProvider
+    adjuster_class_name: str = "EasyDPGWrapperProportionalVerticalAdjuster"
+    adjust_plan: Union['_AdjustRulePlan', None] = None
+
+def _solve_proportional_parts(plan: '_AdjustRulePlan', total_dim: Union[int, float], adjuster_class_name: str) -> List[Tuple[int, Union[int, float]]]:
+    '''
+    Aritmetica unei reguli compilate (varianta Python pura, de referinta).
+    :return: lista [part_idx, dim] ordonata dupa part_idx, doar pentru partile carora li s-a alocat spatiu
+    '''
+    parts_ = plan.parts
+    child_count_ = len(parts_)
+
+    # pasul 5, calcul valori absolute per unitati (subunitatile (R-urile) se amana fiindca vedem daca unitatile raman asa sau trebuie modificate pentru constrangeri)
+    unit_mu_ = total_dim / plan.total_units  # mu=measurement-unit
+
+    # 5.1. calculam, de sondaj, doar partile non-R..., dar aplicam si min-max-urile...
+    final_dims_per_part_ = {}
+    remaining_dim_ = total_dim
+    for part_idx_ in range(child_count_):
+        c_part_ = parts_[part_idx_]
+        if not c_part_.fixed:
+            continue
+        new_dim_ = int(c_part_.scalar * unit_mu_)
+        new_dim_ = min(c_part_.max_limit if c_part_.max_limit is not None else 1000000,
+                       max(c_part_.min_limit if c_part_.min_limit is not None else 0, new_dim_))
+        final_dims_per_part_[part_idx_] = new_dim_
+        remaining_dim_ -= new_dim_
+
+    # -pasul 6- pana acum avem toate dimensiunile (obligatorii -care au min specificat-) calculate dupa potentialul spatiu pe care il doresc
+    # verificam daca mai e loc de R-uri (cele mai joase ca prioritate), si daca da, le calculam si pe astea, daca nu, le ignoram complet (nu vor aparea pe ecran, "ghinion"...)
+    num_r_units_ = plan.num_r_units
+    if remaining_dim_ > 0:
+        if num_r_units_:
+            subunit_mu_ = remaining_dim_ / num_r_units_ if num_r_units_ > 0 else 0
+            optional_subparts_ = [[i, subunit_mu_ * parts_[i].scalar] for i in
+                                  range(child_count_) if
+                                  i not in final_dims_per_part_.keys()]
+            for s in optional_subparts_:
+                final_dims_per_part_[s[0]] = s[1]
+                remaining_dim_ -= s[1]
+
+    elif remaining_dim_ < 0 and num_r_units_ > 0 and _LOG_LAYOUT.debug_enabled:
+        # mesajele rezolvarii sunt DEBUG: apar la fiecare rezolvare (deci la fiecare cadru al unei redimensionari), uneori doar din reziduuri float
+        default_r_units_ = [parts_[i].raw for i in range(child_count_) if i not in final_dims_per_part_.keys()]
+        if len(default_r_units_) > 0:
+            _LOG_LAYOUT.debug("%s: R parts were excluded because of no space left: %s", adjuster_class_name, default_r_units_)
+
+    # -pasul 7 - penultimul pas: micsoram proportional toate partile deja calculate, ca sa incapa in total_dim
+    if remaining_dim_ < 0:
+        _LOG_LAYOUT.debug("%s: after computing mandatory and optionaly parts, we exceeded the total container dimension by %s (total dimension is %s). We will shrink all parts proportionally to fit into that space !", adjuster_class_name, -remaining_dim_, total_dim)
+        dim_ = sum([part_dim_ for part_dim_ in final_dims_per_part_.values()])
+        subunitar_factor_ = total_dim / dim_
+        tmp_ = {}
+        for p_idx in final_dims_per_part_.keys():
+            tmp_[p_idx] = int(final_dims_per_part_[p_idx] * subunitar_factor_)
+        final_dims_per_part_ = tmp_
+
+    return sorted(final_dims_per_part_.items())
+
+def _solve_proportional_parts_vectorized(plans: List['_AdjustRulePlan'], totals: List[Union[int, float]], adjuster_class_names: List[str]) -> List[List[Tuple[int, Union[int, float]]]]:
+    '''
+    Aceeasi aritmetica ca _solve_proportional_parts, dar pentru toate regulile deodata, cu numpy (o linie per LM, o coloana per parte).
+    Pastreaza exact ordinea operatiilor in virgula mobila din varianta Python (sumele se fac coloana cu coloana, in aceeasi ordine), deci rezultatele sunt identice.
+    '''
+    rows_ = len(plans)
+    lengths_ = np.fromiter((len(plan_.parts) for plan_ in plans), dtype=np.intp, count=rows_)
+    cols_ = int(lengths_.max())
+
+    # coloanele fiecarui plan sunt pregatite o singura data, la compilare (planurile sunt imuabile); aici le lipim intr-un singur tablou
+    # si le imprastiem in matricele (LM-uri x parti) printr-o singura indexare, fara bucle Python per element
+    flat_ = np.concatenate([plan_.columns for plan_ in plans])
+    row_idx_ = np.repeat(np.arange(rows_), lengths_)
+    col_idx_ = np.arange(len(flat_)) - np.repeat(np.cumsum(lengths_) - lengths_, lengths_)
+
+    def _matrix(column, fill):
+        matrix_ = np.full((rows_, cols_), fill)
+        matrix_[row_idx_, col_idx_] = flat_[:, column]
+        return matrix_
+    scalars_ = _matrix(0, 0.0)
+    fixed_ = _matrix(1, 0.0) != 0.0
+    mins_ = _matrix(2, 0.0)
+    maxs_ = _matrix(3, 1000000.0)
+    valid_ = np.arange(cols_)[None, :] < lengths_[:, None]
+    totals_ = np.array(totals, dtype=float)
+    units_ = np.array([(plan_.total_units, plan_.num_r_units) for plan_ in plans], dtype=float)
+    total_units_, num_r_units_ = units_[:, 0], units_[:, 1]
+
+    # pasul 5 - partile non-R (unitati), cu min-max
+    unit_mu_ = totals_ / total_units_
+    fixed_mask_ = valid_ & fixed_
+    dims_ = np.where(fixed_mask_, np.minimum(maxs_, np.maximum(mins_, np.trunc(scalars_ * unit_mu_[:, None]))), 0.0)
+    remaining_ = totals_.copy()
+    for j in range(cols_):
+        remaining_ = np.where(fixed_mask_[:, j], remaining_ - dims_[:, j], remaining_)
+
+    # pasul 6 - partile R, doar daca a mai ramas loc
+    has_r_room_ = (remaining_ > 0) & (num_r_units_ != 0)
+    subunit_mu_ = np.where(num_r_units_ > 0, remaining_ / np.where(num_r_units_ != 0, num_r_units_, 1.0), 0.0)
+    r_mask_ = valid_ & ~fixed_ & has_r_room_[:, None]
+    dims_ = np.where(r_mask_, subunit_mu_[:, None] * scalars_, dims_)
+    for j in range(cols_):
+        remaining_ = np.where(r_mask_[:, j], remaining_ - dims_[:, j], remaining_)
+
+    # pasul 7 - micsorare proportionala unde s-a depasit containerul (suma in ordinea din varianta Python: intai partile non-R, apoi R-urile)
+    shrink_ = remaining_ < 0
+    dim_sum_ = np.zeros(rows_)
+    for mask_ in (fixed_mask_, r_mask_):
+        for j in range(cols_):
+            dim_sum_ = np.where(mask_[:, j], dim_sum_ + dims_[:, j], dim_sum_)
+    factor_ = totals_ / np.where(shrink_, dim_sum_, 1.0)
+    present_ = fixed_mask_ | r_mask_
+    dims_ = np.where(shrink_[:, None] & present_, np.trunc(dims_ * factor_[:, None]), dims_)
+    int_mask_ = fixed_ | shrink_[:, None]
+
+    for i in (np.flatnonzero(shrink_).tolist() if _LOG_LAYOUT.debug_enabled else ()): # mesajele (DEBUG), ca in varianta Python (doar pentru LM-urile care au depasit)
+        plan_ = plans[i]
+        if not has_r_room_[i] and num_r_units_[i] > 0:
+            default_r_units_ = [part_.raw for part_ in plan_.parts if not part_.fixed]
             if len(default_r_units_) > 0:
-                print(f"WARNING: {adjuster_class_name}: R parts were excluded because of no space left: {default_r_units_}")
-
-        # -pasul 7 - penultimul pas: micsoram proportional toate partile deja calculate, ca sa incapa in total_dim_in_container_
-        if remaining_dim_ < 0:
-            print(
-                f"WARNING: {adjuster_class_name}: after computing mandatory and optionaly parts, we exceeded the total container dimension by {-remaining_dim_} (total dimension is {total_dim_in_container}). We will shrink all parts proportionally to fit into that space !")
-            dim_ = sum([part_dim_ for part_dim_ in final_dims_per_part_.values()])
-            subunitar_factor_ = total_dim_in_container / dim_
-            tmp_ = {}
-            for p_idx in final_dims_per_part_.keys():
-                tmp_[p_idx] = int(final_dims_per_part_[p_idx] * subunitar_factor_)
-            final_dims_per_part_ = tmp_
+                _LOG_LAYOUT.debug("%s: R parts were excluded because of no space left: %s", adjuster_class_names[i], default_r_units_)
+        _LOG_LAYOUT.debug("%s: after computing mandatory and optionaly parts, we exceeded the total container dimension by %s (total dimension is %s). We will shrink all parts proportionally to fit into that space !", adjuster_class_names[i], -float(remaining_[i]), totals[i])
+
+    # doar celulele prezente, in ordinea (LM, parte); valorile intregi se convertesc tot vectorizat, apoi lista se taie pe LM-uri
+    present_rows_, present_cols_ = np.nonzero(present_)
+    values_ = dims_[present_rows_, present_cols_]
+    is_int_ = int_mask_[present_rows_, present_cols_]
+    mixed_ = [int_value_ if is_int_value_ else float_value_ for int_value_, is_int_value_, float_value_ in
+              zip(np.where(is_int_, values_, 0.0).astype(np.int64).tolist(), is_int_.tolist(), values_.tolist())]
+    pairs_ = list(zip(present_cols_.tolist(), mixed_))
+    counts_ = np.bincount(present_rows_, minlength=rows_)
+    return [pairs_[end_ - count_:end_] for end_, count_ in zip(np.cumsum(counts_).tolist(), counts_.tolist())]
 
-        # -pasul 8 - ultimul pas, returnam rezultatele finale
-        increm_pos_ = 0
-        results = {}
-        final_dims_per_part_ = sorted(map(lambda part_idx: [part_idx, final_dims_per_part_[part_idx]], final_dims_per_part_.keys()), key=lambda o: o[0])
-        for part_raw__ in final_dims_per_part_:
-            part_idx_ = part_raw__[0]
-            new_dim_ = part_raw__[1]
-            se_tag = dpg_sub_elements_[part_idx_]
-            results[se_tag] = result_row_provider(new_dim_, alter_dim_total, increm_pos_)
-            increm_pos_ += new_dim_
-
-        return results
 
 class EasyDPGProportionalVerticalAdjuster(_EasyDPGLayoutManagerBase, EasyDPGWrapperInnerPanel):
     def __init__(self, tag): # sa fie numai prin injector, pentru ca EasyDPGApp e un singleton si e dependinta dorita -> sunt multe forme de a lucra cu DI vs mai-putin-DI, o forma era sa instantiez automat EasyDPGApp prin injector, manual, mai jos la self.app_ =, si atunci nu mai era nevoie de gardarea asta si nici ideea sa construiesti asa ceva prin DI, dar e un alt motiv pentru care merg pe modelul asta (iarasi, unul din mai multe cu care se putea merge): ** i-am eliminat cuvantul Wrapper, pentru ca instanta asta va trebui sa aiba un lifetime cat aplicatia (de vreme ce are chestii de ajustare continua, dupa niste reguli, etc), deci NU e wrapper, si daca nu e wrapper, nu e ceva ce ai nevoie sa-l instantiezi direct, deci o poti face prin metoda statica .build(...) (care foloseste di), deci pot folosi "oficial" (in lista de parametrii ai constructorului) DI si asta e logica de convenienta acum, pentru ca e o convenienta sa doar pun o dependinta in constructor si ea sa-mi fie furnizata "magic" (nu foarte magic, dar aproape magic, ca e vorba de folosirea injectorului :) )
@@ -1941,28 +3580,36 @@ class EasyDPGProportionalVerticalAdjuster(_EasyDPGLayoutManagerBase, EasyDPGWrap
 
         self.app_: EasyDPGApp = FACTORY(EasyDPGApp)
         self.adjust_rule_ = ""
+        self.adjust_plan_: Union[_AdjustRulePlan, None] = None
 
     def __validate_rule(self, rule):
-        # @TODO...
+        # compilarea arunca exceptie pentru orice regula invalida; regula goala se decide abia la recalculare, dupa numarul de copii
+        if rule is not None and len(rule) > 0:
+            _compile_adjust_rule(rule, "EasyDPGProportionalVerticalAdjuster")
         return True
 
     def set_adjust_rule(self, rule=""):
-        self.adjust_rule_ = rule
+        if self.__validate_rule(rule):
+            self.adjust_rule_ = rule
+            self.adjust_plan_ = _compile_adjust_rule(rule, "EasyDPGProportionalVerticalAdjuster") if rule is not None and len(rule) > 0 else None
         return self
 
-    def recalculate(self) -> LMRecalculateResult:
-        return _EasyDPGLayoutManagerBase.compute_proportional_adjuster_parts(adjust_rule = self.adjust_rule_,
-                                                                             container_tag = self.tag_,
-                                                                                total_dim_in_container = dpg.get_item_rect_size(self.tag_)[1],
-                                                                                alter_dim_total = dpg.get_item_rect_size(self.tag_)[0],
-                                                                                result_row_provider = lambda new_dim, alter_dim_total, increm_pos: {
-                                                                                    "width": alter_dim_total,
-                                                                                    "height": new_dim,
-                                                                                    "pos_x": 0,
-                                                                                    "pos_y": increm_pos
-                                                                                },
-                                                                                adjuster_class_name = "EasyDPGProportionalVerticalAdjuster")
-
+    def proportional_job(self, width: Union[int, float, None] = None, height: Union[int, float, None] = None) -> _ProportionalSolveJob:
+        return _ProportionalSolveJob(container_tag = self.tag_,
+                                     adjust_rule = self.adjust_rule_,
+                                     total_dim = height if height is not None else _rect_size(self.tag_)[1],
+                                     alter_dim_total = width if width is not None else _rect_size(self.tag_)[0],
+                                     result_row_provider = lambda new_dim, alter_dim_total, increm_pos: {
+                                         "width": alter_dim_total,
+                                         "height": new_dim,
+                                         "pos_x": 0,
+                                         "pos_y": increm_pos
+                                     },
+                                     adjuster_class_name = "EasyDPGProportionalVerticalAdjuster",
+                                     adjust_plan = self.adjust_plan_)
+
+    def recalculate(self, width: Union[int, float, None] = None, height: Union[int, float, None] = None) -> LMRecalculateResult:
+        return _EasyDPGLayoutManagerBase.compute_proportional_adjuster_parts_batch([self.proportional_job(width, height)], vectorized=False)[0]
 
     @staticmethod
     def build(adjust_rule="", explicit_parent: AnyParent = None) -> 'EasyDPGProportionalVerticalAdjuster':
@@ -1982,27 +3629,36 @@ class EasyDPGProportionalHorizontalAdjuster(_EasyDPGLayoutManagerBase, EasyDPGWr
 
         self.app_ = FACTORY(EasyDPGApp)
         self.adjust_rule_ = ""
+        self.adjust_plan_: Union[_AdjustRulePlan, None] = None
 
     def __validate_rule(self, rule):
-        # @TODO...
+        # compilarea arunca exceptie pentru orice regula invalida; regula goala se decide abia la recalculare, dupa numarul de copii
+        if rule is not None and len(rule) > 0:
+            _compile_adjust_rule(rule, "EasyDPGProportionalHorizontalAdjuster")
         return True
 
     def set_adjust_rule(self, rule=""):
-        self.adjust_rule_ = rule
+        if self.__validate_rule(rule):
+            self.adjust_rule_ = rule
+            self.adjust_plan_ = _compile_adjust_rule(rule, "EasyDPGProportionalHorizontalAdjuster") if rule is not None and len(rule) > 0 else None
         return self
 
-    def recalculate(self) -> LMRecalculateResult:
-        return _EasyDPGLayoutManagerBase.compute_proportional_adjuster_parts(adjust_rule = self.adjust_rule_,
-                                                                        container_tag = self.tag_,
-                                                                        total_dim_in_container = dpg.get_item_rect_size(self.tag_)[0],
-                                                                        alter_dim_total=dpg.get_item_rect_size(self.tag_)[1],
-                                                                        result_row_provider = lambda new_dim, alter_dim_total, increm_pos: {
-                                                                          "width": new_dim,
-                                                                          "height": alter_dim_total,
-                                                                          "pos_x": increm_pos,
-                                                                          "pos_y": 0
-                                                                        },
-                                                                        adjuster_class_name = "EasyDPGProportionalHorizontalAdjuster")
+    def proportional_job(self, width: Union[int, float, None] = None, height: Union[int, float, None] = None) -> _ProportionalSolveJob:
+        return _ProportionalSolveJob(container_tag = self.tag_,
+                                     adjust_rule = self.adjust_rule_,
+                                     total_dim = width if width is not None else _rect_size(self.tag_)[0],
+                                     alter_dim_total = height if height is not None else _rect_size(self.tag_)[1],
+                                     result_row_provider = lambda new_dim, alter_dim_total, increm_pos: {
+                                         "width": new_dim,
+                                         "height": alter_dim_total,
+                                         "pos_x": increm_pos,
+                                         "pos_y": 0
+                                     },
+                                     adjuster_class_name = "EasyDPGProportionalHorizontalAdjuster",
+                                     adjust_plan = self.adjust_plan_)
+
+    def recalculate(self, width: Union[int, float, None] = None, height: Union[int, float, None] = None) -> LMRecalculateResult:
+        return _EasyDPGLayoutManagerBase.compute_proportional_adjuster_parts_batch([self.proportional_job(width, height)], vectorized=False)[0]
 
     @staticmethod
     def build(adjust_rule="", explicit_parent: AnyParent = None) -> 'EasyDPGProportionalHorizontalAdjuster':
@@ -2031,6 +3687,7 @@ class EasyDPGPopupBoxManager:
         if not globals()["__popupbox_box_opened"] and len(globals()["__popupbox_queue"]) > 0:
             request_ = globals()["__popupbox_queue"].pop()
             globals()["__popupbox_box_opened"] = True
+            _LOG_POPUP.debug("opening %s box for message %s", request_['type'], request_['id'])
             if '__popupbox_max_chars_per_row' in globals():
                 error_or_info_box(text=request_['msg'], is_info_box=request_['type'] == "info", callback=lambda: _callback(), max_chars_per_row=globals()['__popupbox_max_chars_per_row'])
             else:
@@ -2054,6 +3711,7 @@ class EasyDPGPopupBoxManager:
             "msg": msg,
             "id": unique_id
         })
+        _LOG_POPUP.debug("queued info message %s (%s pending)", unique_id, len(globals()["__popupbox_queue"]))
         EasyDPGPopupBoxManager.__execute()
 
     @staticmethod
@@ -2074,6 +3732,7 @@ class EasyDPGPopupBoxManager:
             "msg": msg,
             "id": unique_id
         })
+        _LOG_POPUP.debug("queued error message %s (%s pending)", unique_id, len(globals()["__popupbox_queue"]))
         EasyDPGPopupBoxManager.__execute()
 
 class EasyDPGLayoutManagers:
@@ -2087,32 +3746,89 @@ class EasyDPGWrapperFactory:
                              "mvchildwindow", "mvspacer"]  # ,TODO...]
     @staticmethod
     def create_wrapper(tag):
-        type_ = dpg.get_item_type(tag).split("::")[1].strip().lower()
+        type_ = _get_simplified_type(tag)
 
         if type_ == "mvbutton":
-            return EasyDPGWrapperButton(tag)
+            return _cached_wrapper(EasyDPGWrapperButton, tag)
         elif type_ == "mvfiledialog":
-            return EasyDPGWrapperFileDialog(tag)
+            return _cached_wrapper(EasyDPGWrapperFileDialog, tag)
         elif type_ == "mvtext":
-            return EasyDPGWrapperText(tag)
+            return _cached_wrapper(EasyDPGWrapperText, tag)
         elif type_ == "mvcheckbox":
-            return EasyDPGWrapperCheckbox(tag)
+            return _cached_wrapper(EasyDPGWrapperCheckbox, tag)
         elif type_ == "mvgroup":
-            return EasyDPGWrapperGroup(tag)
+            return _cached_wrapper(EasyDPGWrapperGroup, tag)
         elif type_ == "mvwindowappitem":
             conf_ = dpg.get_item_configuration(tag)
             if "popup" in conf_ and conf_["popup"] is True:
-                return EasyDPGWrapperPopup(tag)
+                return _cached_wrapper(EasyDPGWrapperPopup, tag)
             if "modal" in conf_ and conf_["modal"] is True:
-                return EasyDPGWrapperModal(tag)
-            return EasyDPGWrapperPrimaryPanel(tag)
+                return _cached_wrapper(EasyDPGWrapperModal, tag)
+            return _cached_wrapper(EasyDPGWrapperPrimaryPanel, tag)
         elif type_ == "mvchildwindow":
-            return EasyDPGWrapperInnerPanel(tag)
+            return _cached_wrapper(EasyDPGWrapperInnerPanel, tag)
         elif type_ == "mvspacer":
-            return EasyDPGWrapperSpacer(tag)
+            return _cached_wrapper(EasyDPGWrapperSpacer, tag)
         else:
-            print(f"WARNING: EasyDPGWrapperFactory: type {type_} for dpg tag {tag} is not supported, no specific wrapper found, retuning a generic wrapper but without any additional functionalities...! @TODO This type should be implemented with specific a wrapper subclass")
-            return EasyDPGWrapper(tag)
+            _LOG_WIDGETS.warning("EasyDPGWrapperFactory: type %s for dpg tag %s is not supported, no specific wrapper found, retuning a generic wrapper but without any additional functionalities...! @TODO This type should be implemented with specific a wrapper subclass", type_, tag)
+            return _cached_wrapper(EasyDPGWrapper, tag)
+
+_UNSET = object() # marcheaza 'nicio valoare inca' la selectorii memoizati / abonarile pe selectori
+
+class _MemoizedSelector:
+    '''
+    Selector derivat: recalculeaza combiner-ul doar cand cel putin una dintre feliile de intrare s-a schimbat (ca identitate).
+    '''
+    def __init__(self, input_selectors, combiner):
+        self.input_selectors_ = input_selectors
+        self.combiner_ = combiner
+        self.last_inputs_ = _UNSET
+        self.last_result_ = _UNSET
+        self.recomputations_ = 0
+
+    def __call__(self, state):
+        inputs_ = [selector(state) for selector in self.input_selectors_]
+        if self.last_inputs_ is _UNSET or any(a is not b for a, b in zip(inputs_, self.last_inputs_)):
+            self.last_result_ = self.combiner_(*inputs_)
+            self.last_inputs_ = inputs_
+            self.recomputations_ += 1
+        return self.last_result_
+
+    def recomputations(self): return self.recomputations_
+
+def create_selector(*input_selectors: Callable[[Any], Any], combiner: Callable[..., Any]) -> _MemoizedSelector:
+    '''
+    Construieste un selector derivat, memoizat (in stilul reselect), ex:
+        visible_posts = create_selector(lambda s: s.posts, lambda s: s.filter, combiner=lambda posts, f: [p for p in posts if f in p["name"]])
+    :input_selectors functii state -> felie; combiner-ul primeste feliile, in ordine, si e reapelat doar cand una dintre ele se schimba
+    '''
+    if len(input_selectors) == 0:
+        raise Exception("ERROR: create_selector: at least one input selector is required")
+    return _MemoizedSelector(list(input_selectors), combiner)
+
+def _longest_increasing_subsequence(values: List[int]) -> List[int]:
+    '''
+    :return: indicii (in values) unei cele mai lungi subsecvente strict crescatoare, O(n log n)
+    '''
+    tails_ = [] # tails_[l] = indicele celui mai mic final al unei subsecvente de lungime l+1
+    tail_values_ = []
+    previous_ = [-1] * len(values)
+    for i, value in enumerate(values):
+        l_ = bisect.bisect_left(tail_values_, value)
+        if l_ > 0:
+            previous_[i] = tails_[l_ - 1]
+        if l_ == len(tails_):
+            tails_.append(i)
+            tail_values_.append(value)
+        else:
+            tails_[l_] = i
+            tail_values_[l_] = value
+    result_ = []
+    i = tails_[-1] if len(tails_) > 0 else -1
+    while i >= 0:
+        result_.append(i)
+        i = previous_[i]
+    return result_[::-1]
 
 class EasyDPGWidget:
 
@@ -2130,8 +3846,79 @@ class EasyDPGWidget:
         if lookup_name is not None:
             self.app_._auto_register_widget(self, lookup_name)
 
+        self.reconciled_lists_: Dict[Union[str, int], Dict[str, Any]] = {} # container -> {"keys": ordinea curenta, "rows": cheie -> {"tag", "row", "item"}}
+
     def app(self): return self.app_
 
+    def reconcile_children(self, container: AnyParent, items: Sequence[Any], row_builder: ReconcileRowBuilder,
+                           key: Callable[[Any], Any] = lambda item: item, row_updater: ReconcileRowUpdater = None) -> Dict[str, int]:
+        '''
+        Aduce copiii containerului la lista items, pe baza unor chei stabile, cu un diff minimal (in locul lui delete_children + reconstruire):
+        randurile cu chei disparute se sterg, cele noi se construiesc, cele pastrate se actualizeaza pe loc (doar daca elementul s-a schimbat)
+        si se muta doar cele care nu fac parte din cea mai lunga subsecventa deja ordonata. Adaugarea unui element la final atinge un singur rand.
+        :param container: containerul (tag sau wrapper) ale carui randuri le gestionam; restul copiilor lui nu ar trebui atinsi direct
+        :param items: lista noua de elemente
+        :param row_builder: (container, element) -> rand (wrapper sau tag); e apelat cu containerul activ, deci explicit_parent e optional
+        :param key: cheia stabila a unui element (implicit elementul insusi, care trebuie sa fie hashable)
+        :param row_updater: (rand, element) -> None; daca lipseste, un element modificat (!= cel vechi) isi reconstruieste randul
+        :return: numarul de operatii aplicate: {inserted, deleted, moved, updated}
+        '''
+        container_ = container if isinstance(container, _EasyDPGWrapperContainer) else EasyDPGWrapperFactory.create_wrapper(container if type(container) in [int, str] else container.tag())
+        container_tag_ = container_.tag()
+        state_ = self.reconciled_lists_.setdefault(container_tag_, {"keys": [], "rows": {}})
+        rows_ = state_["rows"]
+        stats_ = {"inserted": 0, "deleted": 0, "moved": 0, "updated": 0}
+
+        new_keys_ = [key(item) for item in items]
+        if len(set(new_keys_)) != len(new_keys_):
+            raise Exception(f"ERROR: EasyDPGWidget: reconcile_children: duplicated keys in the new list for container {container_tag_}, keys must be unique")
+        new_items_ = dict(zip(new_keys_, items))
+
+        # 1. stergeri: chei disparute, randuri care nu mai exista (sterse din afara) si randuri modificate fara row_updater
+        deleted_tags_ = []
+        for old_key in state_["keys"]:
+            row_ = rows_[old_key]
+            if not dpg.does_item_exist(row_["tag"]):
+                del rows_[old_key]
+            elif old_key not in new_items_ or (row_updater is None and row_["item"] != new_items_[old_key]):
+                deleted_tags_ += _collect_subtree_tags(row_["tag"])
+                dpg.delete_item(row_["tag"])
+                del rows_[old_key]
+                stats_["deleted"] += 1
+        if len(deleted_tags_) > 0:
+            _on_items_deleted(deleted_tags_)
+            notify_structure_changed(container_tag_)
+
+        # 2. actualizari pe loc si inserari (construite la final, in ordinea noua)
+        current_order_ = [old_key for old_key in state_["keys"] if old_key in rows_]
+        for new_key in new_keys_:
+            item_ = new_items_[new_key]
+            if new_key in rows_:
+                if rows_[new_key]["item"] != item_:
+                    row_updater(rows_[new_key]["row"], item_)
+                    rows_[new_key]["item"] = item_
+                    stats_["updated"] += 1
+                continue
+            with container_:
+                row_ = row_builder(container_, item_)
+            rows_[new_key] = {"tag": row_ if type(row_) in [int, str] else row_.tag(), "row": row_, "item": item_}
+            current_order_.append(new_key)
+            stats_["inserted"] += 1
+
+        # 3. mutari: pastram pe loc cea mai lunga subsecventa crescatoare (dupa pozitia in ordinea noua), restul se muta de la coada spre cap
+        new_position_ = {k: i for i, k in enumerate(new_keys_)}
+        stable_ = {current_order_[i] for i in _longest_increasing_subsequence([new_position_[k] for k in current_order_])}
+        next_tag_ = 0
+        for new_key in reversed(new_keys_):
+            tag_ = rows_[new_key]["tag"]
+            if new_key not in stable_:
+                container_.move_child_here(tag_, before=next_tag_)
+                stats_["moved"] += 1
+            next_tag_ = tag_
+
+        state_["keys"] = new_keys_
+        return stats_
+
     def _dispatch_event(self, event, *args, **kwargs):
         if event not in self.event_listeners_:
             return
@@ -2153,6 +3940,7 @@ class EasyDPGWidget:
         if isinstance(dpg_tag_or_wrapper, EasyDPGWrapper):
             self.elements_registry_[id] = dpg_tag_or_wrapper
         else:
+            _notify_item_added(dpg_tag_or_wrapper) # tag-uri brute, probabil create direct prin dpg (fara build-urile EasyDPG care anunta singure)
             self.elements_registry_[id] = EasyDPGWrapperFactory.create_wrapper(dpg_tag_or_wrapper)
 
     def lookup_element(self, id: str):
@@ -2168,11 +3956,11 @@ class EasyDPGWidget:
 
     def apply_effect(self, effect: str, *args, **kwargs): # efect + parametrii efect
         if effect not in self.effects_.keys():
-            print(f"WARNING: EasyDPGWidget: apply_effect: Ignoring call, as effect '{effect}' doesn't exist in current widget, available effects are:\n{self.effects_.keys()}")
+            _LOG_EVENTS.warning("EasyDPGWidget: apply_effect: Ignoring call, as effect '%s' doesn't exist in current widget, available effects are:\n%s", effect, self.effects_.keys())
             return
         self.effects_[effect](*args, **kwargs)
 
-    def listen_on_ievent(self, internal_event, callback=lambda ev, dummy_parameters: print("WARNING: EasyDPGWidget: listen_on_ievent: this is a default NOP callback and should be replaced with a specialized one, but take into account the parameters as this callback can take any parameter provided when the event is being triggered...")):
+    def listen_on_ievent(self, internal_event, callback=lambda ev, dummy_parameters: _LOG_EVENTS.warning("EasyDPGWidget: listen_on_ievent: this is a default NOP callback and should be replaced with a specialized one, but take into account the parameters as this callback can take any parameter provided when the event is being triggered...")):
         if internal_event not in self.event_listeners_:
             self.event_listeners_[internal_event] = []
         self.event_listeners_[internal_event].append(callback)
@@ -2180,8 +3968,53 @@ class EasyDPGWidget:
     def effects(self): return self.effects_
     def ievents(self): return self.events_
 
-    def listen_on_redux(self, redux_xpath, callback: WidgetReduxListener = lambda widget, registry, xpath, value: print('WARNING: EasyDPGWidget: listen_on_redux: implicit NOP callback, you should replace this with a specific one !')):
-        self.redux_store_.subscribe(lambda xpath, value: callback(self, self.elements_registry_, xpath, value),  xpath=redux_xpath)
+    def dispatch_threadsafe(self, action):
+        self.app_.dispatch_threadsafe(self.redux_store_, action) # pentru firele de executie din fundal care alimenteaza store-ul acestui widget
+
+    def __coalesce(self, coalesce: Union[bool, None]) -> bool:
+        return self.app_.configurator_.coalesce_redux_updates if coalesce is None else coalesce
+
+    def listen_on_redux(self, redux_xpath, callback: WidgetReduxListener = lambda widget, registry, xpath, value: _LOG_EVENTS.warning('EasyDPGWidget: listen_on_redux: implicit NOP callback, you should replace this with a specific one !'), coalesce: bool = None):
+        '''
+        :coalesce True: notificarile se aplica o data per cadru, inainte de randare, doar cu ultima valoare per (widget, xpath); None = ce s-a ales la create_app
+        Sub async_start, callback-ul poate fi si corutina (async def): ruleaza ca task in event loop-ul aplicatiei.
+        '''
+        apply_ = lambda widget, registry, xpath, value: self.app_.spawn_if_awaitable(callback(widget, registry, xpath, value))
+        if self.__coalesce(coalesce):
+            scheduler_ = self.app_.redux_scheduler()
+            self.redux_store_.subscribe(lambda xpath, value: scheduler_.schedule((self, xpath, callback), apply_, self, self.elements_registry_, xpath, value), xpath=redux_xpath)
+        else:
+            self.redux_store_.subscribe(lambda xpath, value: apply_(self, self.elements_registry_, xpath, value),  xpath=redux_xpath)
+
+    def listen_on_selector(self, selector: Callable[[Any], Any], callback: SelectorListener, equality: Callable[[Any, Any], bool] = None, redux_xpath: str = None, coalesce: bool = None):
+        '''
+        Abonare pe un selector: callback-ul e apelat doar cand valoarea selectata se schimba (implicit ca identitate, sau dupa equality),
+        nu la fiecare notificare a store-ului; pentru valori derivate foloseste create_selector(...), care e memoizat.
+        :param selector: valoarea notificata (starea intreaga, sau felia de la redux_xpath) -> valoarea selectata
+        :param callback: (widget, registry, valoarea selectata) -> None
+        :param equality: (vechi, nou) -> True daca sunt echivalente (callback-ul nu se apeleaza); implicit 'is'
+        :param redux_xpath: optional, ca la listen_on_redux, pentru a primi doar notificarile unei felii
+        :param coalesce: ca la listen_on_redux; selectorul se evalueaza abia la aplicare, pe ultima valoare
+        Ca la listen_on_redux, sub async_start callback-ul poate fi corutina.
+        '''
+        equality_ = equality if equality is not None else (lambda old, new: old is new)
+        last_ = [_UNSET]
+
+        def _on_notification(xpath=None, value=None):
+            selected_ = selector(value)
+            if last_[0] is not _UNSET and equality_(last_[0], selected_):
+                return
+            last_[0] = selected_
+            self.app_.spawn_if_awaitable(callback(self, self.elements_registry_, selected_))
+
+        listener_ = _on_notification
+        if self.__coalesce(coalesce):
+            scheduler_ = self.app_.redux_scheduler()
+            listener_ = lambda xpath=None, value=None: scheduler_.schedule((self, _on_notification), _on_notification, xpath, value)
+
+        if redux_xpath is not None:
+            return self.redux_store_.subscribe(listener_, xpath=redux_xpath)
+        return self.redux_store_.subscribe(listener_)
 
 
 '''
@@ -0,0 +1,4 @@
+'''
+Teste pentru EasyDPG (pytest), rulate din directorul parinte al pachetului, de ex:
+    python -m pytest easydpg/tests
+'''
@@ -0,0 +1,20 @@
+import pytest
+
+from .. import easy_dpg
+from ..easy_dpg import reset_item_caches
+
+
+@pytest.fixture(autouse=True)
+def fresh_item_caches():
+    # fiecare test isi creeaza (si distruge) propriul context dpg, in care tag-urile int o iau de la capat
+    reset_item_caches()
+    yield
+    reset_item_caches()
+
+
+@pytest.fixture(autouse=True)
+def fresh_singletons():
+    # EasyDPGApp si _LayoutManagerController sunt singleton-uri DI, legate de contextul dpg in care au lucrat: fiecare test primeste altele
+    easy_dpg._easydpg_injector = None
+    yield
+    easy_dpg._easydpg_injector = None
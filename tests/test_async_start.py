@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import create_app
+
+
+def _first_window_id():
+    dpg.create_context()
+    try:
+        return dpg.add_window()
+    finally:
+        dpg.destroy_context()
+
+
+def test_failing_create_ui_still_closes_the_app():
+    fresh_id_ = _first_window_id()
+    app_ = create_app()
+
+    def create_ui():
+        raise ValueError("create_ui failed")
+
+    with pytest.raises(ValueError):
+        asyncio.run(app_.async_start(create_ui))
+    assert not app_.running_
+    assert app_.async_loop_ is None
+
+    assert _first_window_id() == fresh_id_ # contextul vechi a fost distrus, deci id-urile o iau de la capat
+
+
+def test_failing_create_ui_still_closes_the_sync_loop():
+    fresh_id_ = _first_window_id()
+    app_ = create_app()
+
+    def create_ui():
+        raise ValueError("create_ui failed")
+
+    with pytest.raises(ValueError):
+        app_.start(create_ui)
+    assert not app_.running_
+    assert _first_window_id() == fresh_id_
@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import Counter
+
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import create_app
+
+
+@pytest.fixture
+def context():
+    dpg.create_context()
+    yield
+    dpg.destroy_context()
+
+
+def _in_flight(app):
+    with app.background_lock_:
+        return len(app.background_in_flight_)
+
+
+def _wait_idle(app, timeout=5.0):
+    deadline_ = time.perf_counter() + timeout
+    while _in_flight(app) > 0:
+        assert time.perf_counter() < deadline_, "background listeners did not finish"
+        time.sleep(0.001)
+
+
+def test_slow_listener_is_not_resubmitted_while_in_flight(context):
+    app_ = create_app(background_deadline_ms=0.0)
+    release_ = threading.Event()
+    calls_ = []
+
+    def slow():
+        calls_.append(threading.get_ident())
+        release_.wait(5.0)
+    app_.register_pre_render_listener(slow, background=True)
+
+    try:
+        for _ in range(5):
+            app_._step_frame(render=False)
+        assert len(calls_) == 1 # cadrele urmatoare nu mai pornesc inca o rulare pana nu se termina prima
+        assert _in_flight(app_) == 1
+    finally:
+        release_.set()
+    _wait_idle(app_)
+    app_._step_frame(render=False)
+    _wait_idle(app_)
+    assert len(calls_) == 2
+    assert threading.get_ident() not in calls_
+
+
+def test_in_flight_count_under_concurrency(context):
+    app_ = create_app(background_workers=4, background_deadline_ms=0.0)
+    lock_ = threading.Lock()
+    running_ = Counter()
+    overlaps_ = []
+    applied_ = Counter()
+
+    def make_listener(n):
+        def listener():
+            with lock_:
+                running_[n] += 1
+                if running_[n] > 1:
+                    overlaps_.append(n)
+            time.sleep(0.0005 * (n % 3))
+            with lock_:
+                running_[n] -= 1
+            return lambda: applied_.update([(n, threading.get_ident())]) # aplicat pe firul de randare
+        return listener
+
+    for n in range(12):
+        app_.register_pre_render_listener(make_listener(n), background=True)
+        app_.register_post_render_listener(make_listener(100 + n), background=True)
+    for _ in range(50):
+        app_._step_frame(render=False)
+        assert _in_flight(app_) <= 24
+    _wait_idle(app_)
+    app_._step_frame(render=False)
+    _wait_idle(app_)
+    app_.drain_ui_queue()
+
+    assert overlaps_ == [] # acelasi listener nu ruleaza niciodata de doua ori in paralel
+    assert {n for n, _ in applied_} == set(range(12)) | set(range(100, 112))
+    assert {thread_ for _, thread_ in applied_} == {threading.get_ident()}
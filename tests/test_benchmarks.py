@@ -0,0 +1,58 @@
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..benchmarks.suite import _HeadlessHarness, _deep_adjusters, _wide_list, _ROOT_SIZE, BENCHMARKS
+
+
+@pytest.fixture
+def harness():
+    harness_ = _HeadlessHarness()
+    yield harness_
+    harness_.close()
+
+
+def _nested_lm_sizes(top):
+    # marimile scrise de layout pe LM-urile imbricate (ultimul copil al fiecarui nivel, in afara de cel mai adanc)
+    sizes_ = []
+    lm_ = top.tag()
+    while True:
+        children_ = dpg.get_item_children(lm_, 1)
+        if dpg.get_item_type(children_[-1]).endswith("mvChildWindow"):
+            lm_ = children_[-1]
+            sizes_.append((dpg.get_item_width(lm_), dpg.get_item_height(lm_)))
+        else:
+            return sizes_
+
+
+def test_deep_adjusters_are_laid_out_at_the_seeded_size(harness):
+    top_ = _deep_adjusters(harness.case_root(), depth=4)
+    harness.set_root_lm_size(top_.tag(), _ROOT_SIZE)
+    harness.frame()
+    sizes_ = _nested_lm_sizes(top_)
+    assert len(sizes_) == 3
+    assert sizes_[0] == (_ROOT_SIZE[0], _ROOT_SIZE[1] // 2) # regula 4:1u,1u,1r pe verticala: R-ul primeste jumatatea ramasa
+    assert all(width > 0 and height > 0 for width, height in sizes_)
+
+
+def test_resize_is_laid_out_at_the_new_size(harness):
+    top_ = _deep_adjusters(harness.case_root(), depth=4)
+    harness.set_root_lm_size(top_.tag(), _ROOT_SIZE)
+    harness.frame()
+    harness.set_root_lm_size(top_.tag(), (1200, 600))
+    harness.frame()
+    assert _nested_lm_sizes(top_)[0] == (1200, 300)
+
+
+def test_wide_list_rows_are_spread_over_the_seeded_height(harness):
+    lm_ = _wide_list(harness.case_root(), rows=10)
+    harness.set_root_lm_size(lm_.tag(), _ROOT_SIZE)
+    harness.frame()
+    rows_ = dpg.get_item_children(lm_.tag(), 1)
+    assert [dpg.get_item_pos(row)[1] for row in rows_] == [i * _ROOT_SIZE[1] // 10 for i in range(10)]
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS.keys()))
+def test_every_benchmark_runs_one_op(harness, name):
+    op_, _ = BENCHMARKS[name](harness)
+    op_()
+    harness.cleanup()
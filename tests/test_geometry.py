@@ -0,0 +1,43 @@
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import EasyDPGWrapperButton, invalidate_geometry_snapshot
+
+
+@pytest.fixture
+def window():
+    dpg.create_context() # headless, fara viewport
+    yield dpg.add_window()
+    dpg.destroy_context()
+
+
+def test_explicit_set_pos_overrides_a_raw_write(window):
+    button_ = EasyDPGWrapperButton(dpg.add_button(tag="btn", parent=window))
+    button_.set_pos(10, 20)
+    dpg.set_item_pos("btn", [50, 50])
+    button_.set_pos(10, 20)
+    assert dpg.get_item_pos("btn") == [10, 20]
+    dpg.configure_item("btn", width=5)
+    button_.set_size(width=100, height=30)
+    button_.set_size(width=100)
+    assert dpg.get_item_width("btn") == 100
+
+
+def test_layout_write_skips_only_what_it_wrote_itself(window):
+    button_ = EasyDPGWrapperButton(dpg.add_button(tag="btn", parent=window))
+    button_.set_geometry(10, 20, 100, 30, skip_unchanged=True)
+    dpg.set_item_pos("btn", [50, 50])
+    button_.set_geometry(10, 20, 100, 30, skip_unchanged=True)
+    assert dpg.get_item_pos("btn") == [50, 50] # scrierea bruta nu se vede fara invalidare
+    invalidate_geometry_snapshot("btn")
+    button_.set_geometry(10, 20, 100, 30, skip_unchanged=True)
+    assert dpg.get_item_pos("btn") == [10, 20]
+
+
+def test_item_recreated_under_the_same_alias_gets_its_geometry(window):
+    EasyDPGWrapperButton(dpg.add_button(tag="btn", parent=window)).set_geometry(10, 20, 100, 30, skip_unchanged=True)
+    dpg.delete_item("btn") # prin dpg brut
+    button_ = EasyDPGWrapperButton(dpg.add_button(tag="btn", parent=window))
+    button_.set_geometry(10, 20, 100, 30, skip_unchanged=True)
+    assert dpg.get_item_pos("btn") == [10, 20]
+    assert (dpg.get_item_width("btn"), dpg.get_item_height("btn")) == (100, 30)
@@ -0,0 +1,56 @@
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import EasyDPGWrapperText, EasyDPGWrapperButton, EasyDPGWrapperFactory
+
+
+@pytest.fixture
+def window():
+    dpg.create_context() # headless, fara viewport
+    yield dpg.add_window()
+    dpg.destroy_context()
+
+
+def test_alias_reused_after_raw_delete(window):
+    dpg.add_text("x", tag="row", parent=window)
+    EasyDPGWrapperText("row")
+    dpg.delete_item("row") # prin dpg brut: EasyDPG nu afla de stergere
+    dpg.add_button(tag="row", parent=window)
+    assert EasyDPGWrapperButton("row").tag() == "row"
+    with pytest.raises(Exception, match="mvbutton"):
+        EasyDPGWrapperText("row")
+
+
+def test_int_tag_reused_by_a_new_context():
+    # fara reset_item_caches intre contexte: tipul din cache e al elementului vechi, deci se reciteste inainte de refuz
+    dpg.create_context()
+    text_ = dpg.add_text("x", parent=dpg.add_window())
+    EasyDPGWrapperText(text_)
+    dpg.destroy_context()
+
+    dpg.create_context()
+    try:
+        button_ = dpg.add_button(parent=dpg.add_window())
+        assert button_ == text_
+        assert EasyDPGWrapperButton(button_).tag() == button_
+    finally:
+        dpg.destroy_context()
+
+
+def test_layout_meta_does_not_outlive_the_item(window):
+    EasyDPGWrapperText(dpg.add_text("x", tag="row", parent=window)).configure_layout(scale_x=0.3)
+    assert EasyDPGWrapperText("row").scale_x() == 0.3
+    dpg.delete_item("row")
+    dpg.add_button(tag="row", parent=window)
+    assert EasyDPGWrapperButton("row").scale_x() == 1.0
+
+
+def test_wrapper_cache_does_not_serve_a_deleted_item(window):
+    dpg.add_button(tag="row", parent=window)
+    old_ = EasyDPGWrapperFactory.create_wrapper("row")
+    assert EasyDPGWrapperFactory.create_wrapper("row") is old_
+    dpg.delete_item("row")
+    dpg.add_button(tag="row", parent=window)
+    new_ = EasyDPGWrapperFactory.create_wrapper("row")
+    assert new_ is not old_
+    assert EasyDPGWrapperFactory.create_wrapper("row") is new_
@@ -0,0 +1,54 @@
+from ..easy_dpg import _ListenerRegistry
+
+
+def test_dispatch_order_is_priority_then_registration():
+    registry_ = _ListenerRegistry()
+    called_ = []
+    registry_.add(lambda: called_.append("a"))
+    registry_.add(lambda: called_.append("b"), priority=5)
+    registry_.add(lambda: called_.append("c"))
+    registry_.dispatch()
+    assert called_ == ["b", "a", "c"]
+
+
+def test_removed_during_dispatch_is_not_called():
+    registry_ = _ListenerRegistry()
+    called_ = []
+    handles_ = {}
+    handles_["first"] = registry_.add(lambda: (called_.append("first"), handles_["second"]()))
+    handles_["second"] = registry_.add(lambda: called_.append("second"))
+    registry_.dispatch()
+    assert called_ == ["first"]
+    assert len(registry_) == 1
+
+
+def test_listener_removing_itself_finishes_its_call():
+    registry_ = _ListenerRegistry()
+    called_ = []
+    handles_ = {}
+    handles_["self"] = registry_.add(lambda: (handles_["self"](), called_.append("self")))
+    registry_.add(lambda: called_.append("next"))
+    registry_.dispatch()
+    registry_.dispatch()
+    assert called_ == ["self", "next", "next"]
+
+
+def test_added_during_dispatch_waits_for_the_next_one():
+    registry_ = _ListenerRegistry()
+    called_ = []
+    registry_.add(lambda: registry_.add(lambda: called_.append("late"), once=True), once=True)
+    registry_.dispatch()
+    assert called_ == []
+    registry_.dispatch()
+    assert called_ == ["late"]
+    assert len(registry_) == 0
+
+
+def test_handle_is_idempotent_and_claim_skips_removed():
+    registry_ = _ListenerRegistry()
+    listener_ = lambda: None
+    handle_ = registry_.add(listener_)
+    ((id_, _, once_),) = registry_.snapshot()
+    assert handle_() is listener_
+    assert handle_() is None
+    assert not registry_.claim(id_, once_) # un snapshot luat inainte de stergere nu mai poate porni listener-ul
@@ -0,0 +1,31 @@
+import logging
+
+import pytest
+
+from ..easy_dpg import np, _LOG_LAYOUT, _compile_adjust_rule, _solve_proportional_parts, _solve_proportional_parts_vectorized
+
+
+@pytest.fixture
+def layout_logger():
+    logger_ = logging.getLogger("easydpg.layout")
+    level_ = logger_.level
+    yield logger_
+    logger_.setLevel(level_)
+
+
+def test_debug_enabled_follows_external_configuration(layout_logger):
+    layout_logger.setLevel(logging.WARNING) # configurat direct prin logging, fara set_log_level
+    assert not _LOG_LAYOUT.debug_enabled
+    layout_logger.setLevel(logging.DEBUG)
+    assert _LOG_LAYOUT.debug_enabled
+
+
+def test_overflowing_solve_does_not_warn(layout_logger, caplog):
+    plan_ = _compile_adjust_rule("2:1u[min=300],1u[min=300],1r") # minimele nu incap in 100, deci se micsoreaza proportional
+    layout_logger.setLevel(logging.DEBUG)
+    with caplog.at_level(logging.DEBUG, logger="easydpg.layout"):
+        _solve_proportional_parts(plan_, 100, "test")
+        if np is not None:
+            _solve_proportional_parts_vectorized([plan_], [100], ["test"])
+    assert len(caplog.records) > 0
+    assert all(record_.levelno == logging.DEBUG for record_ in caplog.records)
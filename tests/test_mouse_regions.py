@@ -0,0 +1,92 @@
+import pytest
+from dearpygui import dearpygui as dpg
+
+from .. import easy_dpg
+from ..easy_dpg import _MouseRegionIndex, _forget_rect_size
+
+
+@pytest.fixture
+def rects(monkeypatch):
+    # fara viewport dpg nu calculeaza dreptunghiurile, deci le dam noi: tag -> (x, y, latime, inaltime), ca dupa o randare
+    dpg.create_context()
+    rects_ = {}
+    monkeypatch.setattr(easy_dpg.dpg, "get_item_rect_min", lambda tag: list(rects_[tag][:2]))
+    monkeypatch.setattr(easy_dpg.dpg, "get_item_rect_size", lambda tag: list(rects_[tag][2:]))
+    yield rects_
+    dpg.destroy_context()
+
+
+def _rendered(rects, tag, rect):
+    rects[tag] = rect
+    _forget_rect_size() # ca dupa o randare: marimile citite in cadrul anterior nu mai sunt valabile
+
+
+def _region(index, tag, hits, leaves):
+    return index.add(tag, lambda x, y: hits.append((tag, x, y)), on_leave=lambda: leaves.append(tag))
+
+
+def test_only_the_region_under_the_cursor_is_called(rects):
+    window_ = dpg.add_window()
+    near_, far_ = dpg.add_button(parent=window_), dpg.add_button(parent=window_)
+    _rendered(rects, near_, (10, 10, 100, 40))
+    _rendered(rects, far_, (600, 400, 100, 40))
+    index_, hits_, leaves_ = _MouseRegionIndex(), [], []
+    _region(index_, near_, hits_, leaves_)
+    _region(index_, far_, hits_, leaves_)
+
+    index_.route(50, 20, frame=1)
+    index_.route(110, 20, frame=1) # marginea din dreapta e exclusa: iesire din near_
+    assert hits_ == [(near_, 50, 20)]
+    assert leaves_ == [near_]
+
+
+def test_move_is_seen_only_after_invalidate(rects):
+    item_ = dpg.add_button(parent=dpg.add_window())
+    _rendered(rects, item_, (0, 0, 50, 50))
+    index_, hits_, leaves_ = _MouseRegionIndex(), [], []
+    _region(index_, item_, hits_, leaves_)
+    index_.route(10, 10, frame=1)
+    assert len(hits_) == 1
+
+    _rendered(rects, item_, (300, 300, 50, 50)) # mutat (in alta celula a grilei), dar neanuntat
+    index_.route(310, 310, frame=2)
+    assert len(hits_) == 1 # grila nu se reconstruieste fara invalidate()
+    assert leaves_ == [item_] # dupa dreptunghiul vechi, cursorul a iesit
+
+    index_.invalidate(frame=2)
+    index_.route(310, 310, frame=3)
+    index_.route(10, 10, frame=3)
+    assert hits_[1:] == [(item_, 310, 310)]
+    assert leaves_ == [item_, item_]
+
+
+def test_resize_across_grid_cells(rects):
+    item_ = dpg.add_button(parent=dpg.add_window())
+    _rendered(rects, item_, (0, 0, 100, 20))
+    index_, hits_, leaves_ = _MouseRegionIndex(cell=64), [], []
+    _region(index_, item_, hits_, leaves_)
+    index_.route(200, 10, frame=1)
+    assert hits_ == []
+
+    _rendered(rects, item_, (0, 0, 300, 20)) # acum acopera si celulele din dreapta
+    index_.invalidate(frame=1)
+    index_.route(200, 10, frame=2)
+    assert hits_ == [(item_, 200, 10)]
+
+
+def test_deleted_item_and_removed_handle_stop_routing(rects):
+    window_ = dpg.add_window()
+    deleted_, removed_, kept_ = (dpg.add_button(parent=window_) for _ in range(3))
+    for tag_ in (deleted_, removed_, kept_):
+        _rendered(rects, tag_, (0, 0, 50, 50))
+    index_, hits_, leaves_ = _MouseRegionIndex(), [], []
+    _region(index_, deleted_, hits_, leaves_)
+    handle_ = _region(index_, removed_, hits_, leaves_)
+    _region(index_, kept_, hits_, leaves_)
+
+    dpg.delete_item(deleted_)
+    handle_()
+    index_.invalidate(frame=1)
+    index_.route(10, 10, frame=2)
+    assert [tag_ for tag_, _, _ in hits_] == [kept_]
+    assert len(index_) == 1
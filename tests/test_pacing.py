@@ -0,0 +1,17 @@
+import pytest
+
+from ..easy_dpg import create_app, EasyDPGAppConfigurator
+
+
+@pytest.mark.parametrize("fps", [0, -30])
+@pytest.mark.parametrize("name", ["target_fps", "idle_fps"])
+def test_non_positive_fps_is_rejected(name, fps):
+    with pytest.raises(Exception, match=name):
+        EasyDPGAppConfigurator(background_color=(0.5, 0.5, 0.5, 1.0), pos=None, size=None, fullscreen=False, **{name: fps})
+    with pytest.raises(Exception, match=name):
+        create_app(**{name: fps})
+
+
+def test_fps_none_means_no_limit():
+    configurator_ = EasyDPGAppConfigurator(background_color=(0.5, 0.5, 0.5, 1.0), pos=None, size=None, fullscreen=False, target_fps=60, idle_fps=None)
+    assert configurator_.target_fps == 60.0 and configurator_.idle_fps is None
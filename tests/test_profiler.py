@@ -0,0 +1,34 @@
+from ..easy_dpg import FrameProfiler
+
+
+def _profiler_with_counts(values):
+    profiler_ = FrameProfiler()
+    for value in values:
+        profiler_.begin_frame()
+        profiler_.count("items", value)
+        profiler_.end_frame()
+    return profiler_
+
+
+def test_nearest_rank_percentiles():
+    summary_ = _profiler_with_counts(range(1, 11)).summary(percentiles=(10, 50, 70, 90, 99, 100))["count:items"]
+    assert summary_["p10"] == 1
+    assert summary_["p50"] == 5
+    assert summary_["p70"] == 7
+    assert summary_["p90"] == 9
+    assert summary_["p99"] == 10
+    assert summary_["p100"] == 10
+    assert summary_["max"] == 10
+    assert summary_["mean"] == 5.5
+
+
+def test_percentiles_of_a_single_frame():
+    summary_ = _profiler_with_counts([7]).summary()["count:items"]
+    assert summary_["p50"] == summary_["p90"] == summary_["p99"] == 7
+
+
+def test_missing_counter_counts_as_zero():
+    profiler_ = _profiler_with_counts([3])
+    profiler_.begin_frame()
+    profiler_.end_frame()
+    assert profiler_.summary(percentiles=(50,))["count:items"]["p50"] == 0
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from ..easy_dpg import np, _compile_adjust_rule, _solve_proportional_parts, _solve_proportional_parts_vectorized, _VECTORIZED_SOLVE_MIN_JOBS
+from ..benchmarks.proportional_solver import _random_rule
+
+pytestmark = pytest.mark.skipif(np is None, reason="numpy is not installed, the vectorized solver is not available")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_matches_python(seed, cases=5000):
+    # aceleasi valori si aceleasi tipuri (int pentru partile non-R si dupa micsorare, float pentru R-uri), pe reguli si totaluri aleatoare
+    rnd_ = random.Random(seed)
+    plans_ = [_compile_adjust_rule(_random_rule(rnd_)) for _ in range(cases)]
+    totals_ = [rnd_.choice([rnd_.randint(0, 4000), rnd_.uniform(0, 4000)]) for _ in range(cases)]
+    names_ = ["parity"] * cases
+
+    expected_ = [_solve_proportional_parts(plan_, total_, name_) for plan_, total_, name_ in zip(plans_, totals_, names_)]
+    actual_ = _solve_proportional_parts_vectorized(plans_, totals_, names_)
+    assert len(actual_) == len(expected_)
+    for plan_, total_, e, a in zip(plans_, totals_, expected_, actual_):
+        assert e == a, f"rule {plan_.rule}, total {total_}"
+        assert [type(d) for _, d in e] == [type(d) for _, d in a], f"rule {plan_.rule}, total {total_}"
+
+
+def test_vectorized_single_plan_and_threshold_batch():
+    plan_ = _compile_adjust_rule("10:2u[min=50],3u,1r,2r")
+    for total_ in (0, 37, 480, 1000.5):
+        assert _solve_proportional_parts_vectorized([plan_], [total_], ["parity"]) == [_solve_proportional_parts(plan_, total_, "parity")]
+
+    plans_ = [plan_] * _VECTORIZED_SOLVE_MIN_JOBS
+    totals_ = list(range(_VECTORIZED_SOLVE_MIN_JOBS))
+    assert _solve_proportional_parts_vectorized(plans_, totals_, ["parity"] * len(plans_)) == \
+        [_solve_proportional_parts(plan_, total_, "parity") for total_ in totals_]
@@ -0,0 +1,56 @@
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import create_app, EasyDPGWidget, EasyDPGWrapperGroup, EasyDPGWrapperText
+from ..redux import ReduxStore, ReduxStateRoot
+
+
+@pytest.fixture
+def widget():
+    dpg.create_context()
+    create_app()
+    ListState = ReduxStateRoot("ListState", ["rows"])
+    ListState.__new__.__defaults__ = ([],)
+    store_ = ReduxStore(reducer_or_substatekey2reducer_map={"rows": lambda rows, action=None: rows if rows is not None else []}, initial_state=ListState(), middlewares=[])
+    yield EasyDPGWidget(redux_store=store_)
+    dpg.destroy_context()
+
+
+def _rows(container):
+    return [dpg.get_value(tag_) for tag_ in dpg.get_item_children(container.tag(), 1)]
+
+
+def _build_row(container, item):
+    return EasyDPGWrapperText.build(item["name"])
+
+
+def test_keyed_diff_touches_only_what_changed(widget):
+    container_ = EasyDPGWrapperGroup.build(type="v", explicit_parent=dpg.add_window())
+    key_ = lambda item: item["id"]
+    items_ = [{"id": i, "name": f"row {i}"} for i in range(5)]
+    assert widget.reconcile_children(container_, items_, _build_row, key=key_) == {"inserted": 5, "deleted": 0, "moved": 0, "updated": 0}
+    tags_ = dict(zip(range(5), dpg.get_item_children(container_.tag(), 1)))
+
+    stats_ = widget.reconcile_children(container_, items_ + [{"id": 5, "name": "row 5"}], _build_row, key=key_) # adaugare la final: un singur rand atins
+    assert stats_ == {"inserted": 1, "deleted": 0, "moved": 0, "updated": 0}
+
+    reordered_ = [items_[4], items_[0], items_[1], items_[2], {"id": 3, "name": "row 3 bis"}] # 4 mutat in fata, 3 modificat, 5 sters
+    stats_ = widget.reconcile_children(container_, reordered_, _build_row, key=key_, row_updater=lambda row, item: row.set_text(item["name"]))
+    assert stats_ == {"inserted": 0, "deleted": 1, "moved": 1, "updated": 1}
+    assert _rows(container_) == ["row 4", "row 0", "row 1", "row 2", "row 3 bis"]
+    assert dpg.get_item_children(container_.tag(), 1) == [tags_[i] for i in [4, 0, 1, 2, 3]] # randurile pastrate sunt aceleasi elemente dpg
+
+
+def test_changed_item_without_updater_is_rebuilt(widget):
+    container_ = EasyDPGWrapperGroup.build(type="v", explicit_parent=dpg.add_window())
+    key_ = lambda item: item["id"]
+    widget.reconcile_children(container_, [{"id": 0, "name": "a"}, {"id": 1, "name": "b"}], _build_row, key=key_)
+    stats_ = widget.reconcile_children(container_, [{"id": 0, "name": "a"}, {"id": 1, "name": "B"}], _build_row, key=key_)
+    assert stats_ == {"inserted": 1, "deleted": 1, "moved": 0, "updated": 0}
+    assert _rows(container_) == ["a", "B"]
+
+
+def test_duplicated_keys_are_rejected(widget):
+    container_ = EasyDPGWrapperGroup.build(type="v", explicit_parent=dpg.add_window())
+    with pytest.raises(Exception, match="duplicated keys"):
+        widget.reconcile_children(container_, ["a", "a"], lambda container, item: EasyDPGWrapperText.build(item))
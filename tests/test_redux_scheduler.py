@@ -0,0 +1,72 @@
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import create_app, EasyDPGWidget, _ReduxUpdateScheduler
+from ..redux import ReduxStore, ReduxStateRoot, Action
+
+
+@pytest.fixture
+def store():
+    dpg.create_context()
+    CounterState = ReduxStateRoot("CounterState", ["count"])
+    CounterState.__new__.__defaults__ = (0,)
+
+    def count_reducer(count, action=None):
+        if action is not None and action.name == "Set":
+            return action.payload
+        return count if count is not None else 0
+
+    yield ReduxStore(reducer_or_substatekey2reducer_map={"count": count_reducer}, initial_state=CounterState(), middlewares=[])
+    dpg.destroy_context()
+
+
+def test_burst_of_dispatches_is_applied_once_per_frame(store):
+    app_ = create_app(coalesce_redux_updates=True)
+    seen_ = []
+    widget_ = EasyDPGWidget(redux_store=store)
+    widget_.listen_on_redux("count", lambda widget, registry, xpath, value: seen_.append(value))
+
+    for i in range(1, 6):
+        store.dispatch(Action("Set", i))
+    assert seen_ == [] # nimic sincron: doar programat pentru cadrul urmator
+    assert app_.redux_scheduler().pending() == 1
+    app_._step_frame(render=False)
+    assert seen_ == [5] # doar ultima valoare
+
+    app_._step_frame(render=False)
+    assert seen_ == [5]
+
+
+def test_per_listener_override_of_the_app_default(store):
+    app_ = create_app(coalesce_redux_updates=True)
+    seen_ = []
+    widget_ = EasyDPGWidget(redux_store=store)
+    widget_.listen_on_redux("count", lambda widget, registry, xpath, value: seen_.append(value), coalesce=False)
+
+    store.dispatch(Action("Set", 1))
+    store.dispatch(Action("Set", 2))
+    assert seen_ == [1, 2]
+
+
+def test_updates_scheduled_while_flushing_wait_for_the_next_frame():
+    scheduler_ = _ReduxUpdateScheduler()
+    applied_ = []
+
+    def first():
+        applied_.append("first")
+        scheduler_.schedule("second", applied_.append, "second")
+
+    scheduler_.schedule("first", first)
+    assert scheduler_.flush() == 1
+    assert applied_ == ["first"]
+    assert scheduler_.flush() == 1
+    assert applied_ == ["first", "second"]
+
+
+def test_failing_update_does_not_block_the_others():
+    scheduler_ = _ReduxUpdateScheduler()
+    applied_ = []
+    scheduler_.schedule("a", lambda: 1 / 0)
+    scheduler_.schedule("b", applied_.append, "b")
+    assert scheduler_.flush() == 2
+    assert applied_ == ["b"]
@@ -0,0 +1,73 @@
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import create_app, create_selector, EasyDPGWidget
+from ..redux import ReduxStore, ReduxStateRoot, Action
+
+
+def _replace(value, action, name):
+    if action is not None and action.name == name:
+        return action.payload
+    return value
+
+
+@pytest.fixture
+def store():
+    dpg.create_context()
+    PostsState = ReduxStateRoot("PostsState", ["posts", "filter", "clock"])
+    PostsState.__new__.__defaults__ = ([], "", 0)
+    yield ReduxStore(reducer_or_substatekey2reducer_map={
+        "posts": lambda posts, action=None: _replace(posts, action, "SetPosts"),
+        "filter": lambda filter, action=None: _replace(filter, action, "SetFilter"),
+        "clock": lambda clock, action=None: _replace(clock, action, "Tick"),
+    }, initial_state=PostsState(), middlewares=[])
+    dpg.destroy_context()
+
+
+def test_selector_recomputes_only_when_an_input_changes():
+    posts_ = ["alpha", "beta", "gamma"]
+    visible_ = create_selector(lambda s: s["posts"], lambda s: s["filter"], combiner=lambda posts, f: [p for p in posts if f in p])
+
+    first_ = visible_({"posts": posts_, "filter": "a", "clock": 0})
+    assert visible_({"posts": posts_, "filter": "a", "clock": 1}) is first_ # aceleasi felii (ca identitate): rezultatul memorat
+    assert visible_.recomputations() == 1
+    assert visible_({"posts": posts_, "filter": "mm", "clock": 1}) == ["gamma"]
+    assert visible_.recomputations() == 2
+
+
+def test_create_selector_needs_an_input():
+    with pytest.raises(Exception, match="at least one input selector"):
+        create_selector(combiner=lambda: None)
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_listener_is_notified_only_when_the_selection_changes(store, coalesce):
+    app_ = create_app()
+    visible_ = create_selector(lambda s: s.posts, lambda s: s.filter, combiner=lambda posts, f: [p for p in posts if f in p])
+    seen_ = []
+    widget_ = EasyDPGWidget(redux_store=store)
+    widget_.listen_on_selector(visible_, lambda widget, registry, value: seen_.append(value), coalesce=coalesce)
+
+    store.dispatch(Action("SetPosts", ["alpha", "beta"]))
+    store.dispatch(Action("Tick", 1)) # felia urmarita nu se schimba: fara notificare, fara recalculare
+    store.dispatch(Action("Tick", 2))
+    app_._step_frame(render=False)
+    assert seen_ == [["alpha", "beta"]]
+    assert visible_.recomputations() == 1
+
+    store.dispatch(Action("SetFilter", "al"))
+    app_._step_frame(render=False)
+    assert seen_ == [["alpha", "beta"], ["alpha"]]
+
+
+def test_equality_suppresses_equivalent_selections(store):
+    app_ = create_app()
+    seen_ = []
+    widget_ = EasyDPGWidget(redux_store=store)
+    widget_.listen_on_selector(lambda s: len(s.posts), lambda widget, registry, value: seen_.append(value), equality=lambda old, new: old == new, coalesce=False)
+
+    store.dispatch(Action("SetPosts", ["a"]))
+    store.dispatch(Action("SetPosts", ["b"])) # alta lista, aceeasi lungime
+    store.dispatch(Action("SetPosts", ["b", "c"]))
+    app_._step_frame(render=False)
+    assert seen_ == [1, 2]
@@ -0,0 +1,66 @@
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import _DFSTreeIndex, _EasyDPGWrapperContainer, _STRUCTURE_CHANGED_TAGS
+
+
+@pytest.fixture
+def dpg_context():
+    dpg.create_context() # headless, fara viewport
+    _STRUCTURE_CHANGED_TAGS.clear()
+    yield
+    _STRUCTURE_CHANGED_TAGS.clear()
+    dpg.destroy_context()
+
+
+def _consume_into(index):
+    # ca _LayoutManagerController la pre-render: toate containerele anuntate in acelasi cadru, re-scanate impreuna
+    tags_ = list(_STRUCTURE_CHANGED_TAGS)
+    _STRUCTURE_CHANGED_TAGS.clear()
+    return index.rescan(tags_)
+
+
+def _assert_matches_full_build(index, root):
+    reference_ = _DFSTreeIndex()
+    reference_.build(root)
+    assert set(index.nodes()) == set(reference_.nodes())
+    for tag in reference_.nodes():
+        assert index.depth(tag) == reference_.depth(tag)
+        assert index.parent(tag) == reference_.parent(tag)
+
+
+def test_move_child_here_to_shallower_container(dpg_context):
+    root_ = dpg.add_window()
+    a_ = dpg.add_group(parent=root_)
+    a1_ = dpg.add_group(parent=a_)
+    b_ = dpg.add_group(parent=root_)
+    x_ = dpg.add_text("x", parent=a1_)
+
+    index_ = _DFSTreeIndex()
+    index_.build(root_)
+
+    _EasyDPGWrapperContainer(b_).move_child_here(x_) # anunta si vechiul parinte (a1_), si noul parinte (b_)
+    assert _STRUCTURE_CHANGED_TAGS == {a1_, b_}
+    assert _consume_into(index_) == (set(), set())
+    assert index_.parent(x_) == b_ and index_.depth(x_) == 2
+    _assert_matches_full_build(index_, root_)
+
+    dpg.add_text("y", parent=b_)
+    _EasyDPGWrapperContainer(b_).move_child_here(dpg.add_text("z", parent=a1_))
+    _consume_into(index_)
+    _assert_matches_full_build(index_, root_)
+
+
+def test_move_child_here_to_deeper_container(dpg_context):
+    root_ = dpg.add_window()
+    a_ = dpg.add_group(parent=root_)
+    a1_ = dpg.add_group(parent=a_)
+    x_ = dpg.add_text("x", parent=root_)
+
+    index_ = _DFSTreeIndex()
+    index_.build(root_)
+
+    _EasyDPGWrapperContainer(a1_).move_child_here(x_)
+    assert _consume_into(index_) == (set(), set())
+    assert index_.parent(x_) == a1_ and index_.depth(x_) == 3
+    _assert_matches_full_build(index_, root_)
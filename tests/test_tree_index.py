@@ -0,0 +1,75 @@
+import random
+
+from ..easy_dpg import _DFSTreeIndex
+
+
+def _index(children):
+    index_ = _DFSTreeIndex(children_provider=lambda tag: children[tag])
+    index_.build("root")
+    return index_
+
+
+def _assert_matches_full_build(index, children):
+    # indexul intretinut incremental trebuie sa fie identic (structural) cu unul construit de la zero
+    reference_ = _index(children)
+    assert set(index.nodes()) == set(reference_.nodes())
+    for tag in reference_.nodes():
+        assert index.depth(tag) == reference_.depth(tag)
+        assert index.parent(tag) == reference_.parent(tag)
+        assert index.children_count(tag) == reference_.children_count(tag)
+    for a in reference_.nodes():
+        for b in reference_.nodes():
+            assert index.is_ancestor(a, b) == reference_.is_ancestor(a, b), (a, b)
+
+
+def test_move_to_shallower_parent():
+    # x se muta de sub A1 (adanc) sub B (mai putin adanc); B e scanat primul, deci uitarea subarborelui vechi al lui A1 nu trebuie sa-l stearga pe x
+    children_ = {"root": ["A", "B"], "A": ["A1"], "A1": ["x"], "B": [], "x": []}
+    index_ = _index(children_)
+
+    children_["A1"], children_["B"] = [], ["x"]
+    assert index_.rescan(["A1", "B"]) == (set(), set())
+    assert "x" in index_ and index_.parent("x") == "B" and index_.depth("x") == 2
+    _assert_matches_full_build(index_, children_)
+
+    index_.rescan(["B"]) # inainte de corectura: KeyError('x')
+    _assert_matches_full_build(index_, children_)
+
+
+def test_add_and_remove():
+    children_ = {"root": ["A"], "A": ["a1", "a2"], "a1": [], "a2": []}
+    index_ = _index(children_)
+
+    children_["A"] = ["a1", "n"]
+    children_.pop("a2")
+    children_["n"] = []
+    assert index_.rescan(["A"]) == ({"n"}, {"a2"})
+    _assert_matches_full_build(index_, children_)
+
+
+def test_random_cross_parent_moves(cases=300, moves=5, seed=0):
+    rnd_ = random.Random(seed)
+    for _ in range(cases):
+        children_ = {"root": []}
+        for i in range(rnd_.randint(1, 40)):
+            children_[i] = []
+            children_[rnd_.choice(list(children_.keys())[:-1])].append(i)
+        index_ = _index(children_)
+
+        for _ in range(moves):
+            tag_ = rnd_.choice([t for t in children_ if t != "root"])
+            subtree_, stack_ = set(), [tag_]
+            while len(stack_) > 0:
+                node_ = stack_.pop()
+                subtree_.add(node_)
+                stack_ += children_[node_]
+            old_parent_ = next(p for p, kids in children_.items() if tag_ in kids)
+            new_parent_ = rnd_.choice([t for t in children_ if t not in subtree_])
+
+            children_[old_parent_].remove(tag_)
+            children_[new_parent_].insert(rnd_.randint(0, len(children_[new_parent_])), tag_)
+            notified_ = [old_parent_, new_parent_]
+            rnd_.shuffle(notified_)
+
+            assert index_.rescan(notified_) == (set(), set())
+            _assert_matches_full_build(index_, children_)
@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import create_app, _UIThreadQueue
+
+
+@pytest.fixture
+def context():
+    dpg.create_context()
+    yield
+    dpg.destroy_context()
+
+
+def test_posts_from_workers_run_on_the_render_thread_in_order(context):
+    app_ = create_app(ui_queue_budget_ms=None)
+    ran_ = []
+    start_ = threading.Barrier(4)
+
+    def worker(worker_id):
+        start_.wait() # toate firele posteaza in acelasi timp
+        for i in range(500):
+            app_.post_to_ui(lambda w, i: ran_.append((w, i, threading.get_ident())), worker_id, i)
+
+    workers_ = [threading.Thread(target=worker, args=(w,)) for w in range(4)]
+    for t in workers_:
+        t.start()
+    for t in workers_:
+        t.join()
+    assert ran_ == [] # nimic nu ruleaza pe firele producatoare
+    app_._step_frame(render=False)
+
+    assert len(ran_) == 4 * 500
+    assert {thread_ for _, _, thread_ in ran_} == {threading.get_ident()}
+    for w in range(4):
+        assert [i for worker_, i, _ in ran_ if worker_ == w] == list(range(500)) # ordinea postarii, per producator
+
+
+def test_budget_leaves_the_rest_for_the_next_drain():
+    queue_ = _UIThreadQueue()
+    ran_ = []
+    for i in range(3):
+        queue_.post(lambda i: (ran_.append(i), time.sleep(0.01)), i)
+    assert queue_.drain(0.001) == 1 # bugetul depasit dupa primul, dar macar unul ruleaza
+    assert queue_.drain(None) == 2
+    assert ran_ == [0, 1, 2]
+
+
+def test_posts_made_while_draining_wait_for_the_next_drain():
+    queue_ = _UIThreadQueue()
+    ran_ = []
+    queue_.post(lambda: (ran_.append("first"), queue_.post(ran_.append, "second")))
+    assert queue_.drain(None) == 1
+    assert ran_ == ["first"]
+    assert queue_.drain(None) == 1
+    assert ran_ == ["first", "second"]
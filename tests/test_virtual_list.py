@@ -0,0 +1,47 @@
+import pytest
+from dearpygui import dearpygui as dpg
+
+from ..easy_dpg import create_app, EasyDPGVirtualList
+
+
+@pytest.fixture
+def app():
+    dpg.create_context() # headless, fara viewport: listenerii ruleaza prin _step_frame(render=False)
+    app_ = create_app()
+    yield app_
+    dpg.destroy_context()
+
+
+def _shown_rows(list_):
+    return sorted((slot_["index"], dpg.get_value(slot_["row"].tag())) for slot_ in list_.slots_ if slot_["index"] is not None)
+
+
+def _close(app, list_):
+    list_.delete()
+    app._step_frame(render=False) # lista nu mai exista, deci listenerul ei de sincronizare se dezinregistreaza
+
+
+def test_same_length_data_from_callable_is_rebound(app):
+    state_ = {"rows": ["a", "b", "c"]}
+    list_ = EasyDPGVirtualList.build(lambda: state_["rows"], explicit_parent=dpg.add_window())
+    app._step_frame(render=False)
+    assert _shown_rows(list_) == [(0, "a"), (1, "b"), (2, "c")]
+
+    state_["rows"] = ["x", "y", "z"] # aceeasi lungime, aceeasi fereastra vizibila, alta secventa
+    app._step_frame(render=False)
+    assert _shown_rows(list_) == [(0, "x"), (1, "y"), (2, "z")]
+    _close(app, list_)
+
+
+def test_in_place_change_needs_refresh(app):
+    rows_ = ["a", "b", "c"]
+    list_ = EasyDPGVirtualList.build(rows_, explicit_parent=dpg.add_window())
+    app._step_frame(render=False)
+
+    rows_[1] = "B" # aceeasi secventa, modificata pe loc: nu se vede fara refresh()
+    app._step_frame(render=False)
+    assert _shown_rows(list_) == [(0, "a"), (1, "b"), (2, "c")]
+    list_.refresh()
+    app._step_frame(render=False)
+    assert _shown_rows(list_) == [(0, "a"), (1, "B"), (2, "c")]
+    _close(app, list_)